@@ -1,9 +1,23 @@
 import random
 import math
-import tkinter as tk
-import matplotlib.pyplot as plt
 import time
 import numpy as np
+from distances import DistanceMatrix
+from population import RoutePopulation
+from crossover import cycle_crossover
+from repair import RepairStage, repair_route
+from solver import RunConfig
+from scheduler import RunScheduler
+from localsearch import LocalSearch, nearest_neighbor_lists
+from construction import nearest_neighbor_tour
+from crowd import consensus_tour
+from archive import ExpertArchive
+from fitness_cache import FitnessCache
+from renderer import RouteRenderer
+from background import BackgroundSolver
+from tsplib import load_instance
+from profiling import PhaseProfiler
+from telemetry import Reporter, TelemetryWriter, improvement_curves, read_telemetry
 
 
 
@@ -38,26 +52,27 @@ class Individual:
         self.fitness = None
 
 
-class Population:
-    def __init__(self, size, city_ids):
-        # Initialize a population with 'size' individuals, each wih a random route.
-        self.individuals = [Individual(city_ids) for _ in range(size)]
+class Population(RoutePopulation):
+    # Array-backed population: routes are rows of one int32 array and
+    # .individuals are views onto those rows (see population.py).
 
     def uniform_crossover(self, parent1, parent2):
         # Uniform Crossover: Combines two parent routes to create two child routes.
-        child1 = [-1] * len(parent1.route)
-        child2 = [-1] * len(parent2.route)
+        route1 = parent1.route
+        route2 = parent2.route
+        child1 = [-1] * len(route1)
+        child2 = [-1] * len(route2)
         # Initialize child routes as lists of -1s.
 
         # Iterate through each city in the parent routes.
-        for i in range(len(parent1.route)):
+        for i in range(len(route1)):
              # Randomly select a parent to inherit the city from (50% chance each).
             if random.random() < 0.5:
-                child1[i] = parent1.route[i]
-                child2[i] = parent2.route[i]
+                child1[i] = route1[i]
+                child2[i] = route2[i]
             else:
-                child1[i] = parent2.route[i]
-                child2[i] = parent1.route[i]
+                child1[i] = route2[i]
+                child2[i] = route1[i]
         #Fix an invalid routes for complete tour
         child1 = self.fix_invalid_route(child1)
         child2 = self.fix_invalid_route(child2)
@@ -66,36 +81,14 @@ class Population:
 
     def cycle_crossover(self, parent1, parent2):
         # Combines two parent routes using the cycle crossover method.
-        cycle = [-1] * len(parent1.route)
-        start_idx = 0
-        # Initialize a list to represent the cycle and starting index
-        while -1 in cycle:
-            if cycle[start_index] == -1:
-                cycle[start_index] = parent1.route[start_idx]
-                next_index = parent2.route.index(cycle[start_idx])
-                while next_index != start_idx:
-                    cycle[next_index] = parent1.route[next_index]
-                    next_index = parent2.route.index(cycle[next_index])
-            start_index = cycle.index(-1)
-        # keep repeating until all elements in the cycle are filled. 
-        # Create offspring routes based on the cycle
-        child1 = [-1 if city not in cycle else city for city in parent1.route]
-        child2 = [-1 if city not in cycle else city for city in parent2.route]
-
-        # Ensure that each child is a valid route
-        child1 = self.fix_invalid_route(child1)
-        child2 = self.fix_invalid_route(child2)
-
-        return child1, child2
+        # Linear time version in crossover.py, children are always complete tours
+        child1, child2 = cycle_crossover(parent1.row, parent2.row, None)
+        return child1.tolist(), child2.tolist()
 
     def fix_invalid_route(self, route):
-        # Ensure that each city appears exactly once in the route
-        missing_cities = set(range(1, len(route) + 1)) - set(route)
-        for city in missing_cities:
-            if -1 in route:
-                index = route.index(-1)
-                route[index] = city
-        return route
+        # Ensure that each city appears exactly once in the route: duplicates and
+        # -1 placeholders are replaced by the missing cities in one linear pass
+        return repair_route(route, self.cities).tolist()
 
 # Euclid formula - calculates distance between two cities. 
 def calculated_distance_cities(city1, city2):
@@ -134,68 +127,65 @@ def roulette_wheel_selection(population):
     return None
 
 
-def check_termination_criteria(population, generation, max_generations, fitness_threshold):
-    # To check if the maximum number of generations has been reached
-    if generation >= max_generations:
-        return True
-    # Filtering out individuals with invalid fitness values
-    valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
-
-    if not valid_individuals:
-        return True
-
-    # Checking if the best fitness meets a certain threshold
-    best_fitness = min(population.individuals, key=lambda x: x.fitness).fitness
-    if best_fitness <= fitness_threshold:
-        return True
-
-    return False
-
-
-
 max_generations = 1000 # Desired maximum number of generations
-fitness_threshold = 1000.0  # Desired fitness threshold
+stall_generations = 100  # Stop a run after this many generations without improvement
+seed_fraction = 0.0  # Share of each initial population built as nearest neighbour tours
+seed_method = "nearest"  # "greedy" makes the first seeded tour a greedy edge tour
+workers = None  # Worker processes for the independent runs, None uses every core
+seed = None  # Master seed for the runs, set it to make a session reproducible
+local_search_post_pass = True  # 2-opt/Or-opt on the completed wisdom of crowds tour
+solver_poll_ms = 100  # How often the GUI collects progress from the solver thread
+expert_archive_size = 200  # Distinct expert tours kept across all runs for the cross-run crowd
+verbosity = "quiet"  # Console output: "quiet", "summary", "runs" or "debug"
+telemetry_path = 'telemetry.jsonl'  # Per-generation benchmark statistics, .parquet needs pyarrow
+profile = False  # Time every phase of the runs and print per-run and per-sweep breakdown tables
 
-# Initialize variables to store data
-city_data = {}
-dimension = 0 # number of cities
-read_coordinates = False  # Flag to indicate when to start reading coordinates
-
-# Open the file for reading
 file_path = 'Random222.tsp'  # Replace with the actual file path
-with open(file_path, 'r') as file:
-    for line in file:
-        parts = line.strip().split()
-
-        # Check for specific keywords to extract file data
-        if parts[0] == "DIMENSION:":
-            dimension = int(parts[1])
-        elif parts[0] == "NODE_COORD_SECTION":
-            read_coordinates = True
-        elif read_coordinates and len(parts) == 3:
-            city_id = int(parts[0])
-            x_coordinate = float(parts[1])
-            y_coordinate = float(parts[2])
-            city_data[city_id] = (x_coordinate, y_coordinate)
-
-city_ids = list(range(1, dimension + 1))
 
 
 class TSPGUI:
-    def __init__(self, root, city_data, crossover_method, mutation_method):
+    def __init__(self, root, city_data, crossover_method, mutation_method, distance_matrix=None):
+        # tkinter is only imported once a window is actually opened
+        import tkinter as tk
+
         self.root = root
         self.city_data = city_data
+        self.distance_matrix = distance_matrix if distance_matrix is not None else DistanceMatrix(city_data)
         self.best_solution = None  # Stores best solution
-        self.city_labels = {}  # Initialize the city_labels dictionary
         self.scale_factor = 4  # Scaling factor
         self.crossover_method = crossover_method
         self.mutation_method = mutation_method
+        # Expert tours are scored again and again; this remembers every length
+        self.fitness_cache = FitnessCache(self.distance_matrix)
+        self.report = Reporter(verbosity)
+        neighbor_lists = nearest_neighbor_lists(self.distance_matrix)
+        self.repair = RepairStage(self.distance_matrix, neighbor_lists=neighbor_lists)
+        self.local_search = None
+        if local_search_post_pass:
+            self.local_search = LocalSearch(self.distance_matrix, neighbor_lists=neighbor_lists)
 
         self.canvas = tk.Canvas(root, width=600, height=600)  # Increase the width and height
         self.canvas.pack() # Canvas
-
-        self.start_button = tk.Button(root, text="Click to start WOC GA run as well as GA after the displayed next graph", command=self.genetic_algorithm)
+        self.renderer = RouteRenderer(self.canvas, self.distance_matrix.coordinates, self.distance_matrix.city_ids,
+                                      self.scale_factor)
+        # Phase timings of this session: the runs' own plus repair, crowd and drawing here
+        self.profiler = None
+        if profile:
+            self.profiler = PhaseProfiler()
+            self.profiler.instrument(self.repair, "repair", "completion")
+            self.profiler.instrument(self, "combine_routes", "crowd")
+            self.profiler.instrument(self.renderer, "draw", "gui")
+            if self.local_search is not None:
+                self.profiler.instrument(self.local_search, "improve", "local_search")
+
+        # The sweep runs in a background thread; the buttons only talk to it
+        self.solver = None
+        self.start_button = tk.Button(root, text="Click to start WOC GA run as well as GA after the displayed next graph", command=self.start_solver)
         self.start_button.pack()
+        self.pause_button = tk.Button(root, text="Pause", command=self.toggle_pause, state="disabled")
+        self.pause_button.pack()
+        self.cancel_button = tk.Button(root, text="Cancel", command=self.cancel_solver, state="disabled")
+        self.cancel_button.pack()
 
         self.best_solution_label = tk.Label(root, text="Distance: ")
         self.best_solution_label.pack()
@@ -204,34 +194,14 @@ class TSPGUI:
         self.method_label.pack()
 
     def drawing_route(self, route):
-        # Clear the canvas
-        self.canvas.delete("all")
-
-        for i in range(len(route) - 1):
-            city1 = self.city_data[route[i]]
-            city2 = self.city_data[route[i + 1]]
-            x1, y1 = city1
-            x2, y2 = city2
-            x1_scaled, y1_scaled = x1 * self.scale_factor, y1 * self.scale_factor
-            x2_scaled, y2_scaled = x2 * self.scale_factor, y2 * self.scale_factor
-            self.canvas.create_line(x1_scaled, y1_scaled, x2_scaled, y2_scaled, fill="blue", width=1)
-        # Draw a line connecting the last city to the first to complete the cycle
-        city1 = self.city_data[route[-1]]
-        city2 = self.city_data[route[0]]
-        x1, y1 = city1
-        x2, y2 = city2
-        x1_scaled, y1_scaled = x1 * self.scale_factor, y1 * self.scale_factor
-        x2_scaled, y2_scaled = x2 * self.scale_factor, y2 * self.scale_factor
-        self.canvas.create_line(x1_scaled, y1_scaled, x2_scaled, y2_scaled, fill="green", width=5)
-        # Labels
-        for city_id, coordinates in self.city_data.items():
-            x, y = coordinates
-            x_scaled, y_scaled = x * self.scale_factor, y * self.scale_factor
-            label = self.city_labels.get(city_id)
-            if label:
-                self.canvas.delete(label)  # Remove previous label
-            label = self.canvas.create_text(x_scaled, y_scaled, text=str(city_id), font=("Arial", 12, "bold"), fill="black")
-            self.city_labels[city_id] = label
+        # Markers are created once and the tour polyline is moved in place,
+        # throttled to the renderer's frame rate (see renderer.py)
+        self.renderer.draw(route)
+
+    def score(self, individual):
+        # calculate_fitness through the cache, so no tour is measured twice
+        individual.fitness = self.fitness_cache.tour_length(individual.route)
+        return individual.fitness
 
     def update_gui(self):
         #Updating GUI with best solution's route and fitness
@@ -239,8 +209,69 @@ class TSPGUI:
             self.drawing_route(self.best_solution.route)
             self.best_solution_label.config(text=f"Best Solution GA tour: {self.best_solution.fitness:.2f}")
 
+    def start_solver(self):
+        # Runs genetic_algorithm in a worker thread and polls its progress
+        if self.solver is not None and self.solver.running:
+            return
+        self.solver = BackgroundSolver(self.genetic_algorithm).start()
+        self.start_button.config(state="disabled")
+        self.pause_button.config(state="normal", text="Pause")
+        self.cancel_button.config(state="normal")
+        self.root.after(solver_poll_ms, self.poll_solver)
+
+    def toggle_pause(self):
+        if self.solver.paused:
+            self.solver.resume()
+            self.pause_button.config(text="Pause")
+        else:
+            self.solver.pause()
+            self.pause_button.config(text="Resume")
+
+    def cancel_solver(self):
+        self.solver.cancel()
+        self.cancel_button.config(state="disabled")
+
+    def poll_solver(self):
+        # Runs on the Tk thread: applies only the newest best-so-far snapshot
+        # and reschedules itself until the solver thread has finished.
+        finished = None
+        latest = None
+        for message in self.solver.poll():
+            if message[0] == "best":
+                latest = message
+            else:
+                finished = message
+        if latest is not None:
+            _, route, fitness = latest
+            self.drawing_route(route)
+            self.best_solution_label.config(text=f"Best Solution GA tour: {fitness:.2f}")
+        if finished is None:
+            self.root.after(solver_poll_ms, self.poll_solver)
+            return
+        if finished[0] == "error":
+            print(f"Solver failed:\n{finished[2]}", end="")
+        elif finished[0] == "cancelled":
+            print("Solver cancelled")
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled", text="Pause")
+        self.cancel_button.config(state="disabled")
+
+    def checkpoint(self):
+        if self.solver is not None:
+            self.solver.checkpoint()
+
+    def show_best(self, solution):
+        # From the solver thread only queue a snapshot; Tk is left to the GUI thread
+        if self.solver is not None:
+            self.solver.publish(solution.route, solution.fitness)
+        else:
+            self.update_gui()
+
     def genetic_algorithm(self):
-        top_expert_solutions = []
+        # Best distinct experts of every run, for the cross-run crowd at the end
+        top_expert_solutions = ExpertArchive(expert_archive_size, len(self.city_data))
+        if self.profiler is not None:
+            self.profiler.instrument(top_expert_solutions, "consensus", "crowd")
         combined_costs = []
 
         average_costs = []
@@ -248,147 +279,130 @@ class TSPGUI:
         max_costs = []
         #this will keep track of my complete TSP solutions to make comparison later on to GA
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        scheduler = RunScheduler(self.distance_matrix, workers=workers, seed=seed)
         
-        crossover_methods = ["Cycle", "Uniform"]
-        mutation_methods = ["Swap", "Scramble"]
-
-        for crossover_method in crossover_methods:
-            for mutation_method in mutation_methods:
-            # Set the current crossover and mutation methods
-                current_crossover_method = crossover_method
-                current_mutation_method = mutation_method
+        try:
+            crossover_methods = ["Cycle", "Uniform"]
+            mutation_methods = ["Swap", "Scramble"]
+
+            for crossover_method in crossover_methods:
+                for mutation_method in mutation_methods:
+                # Set the current crossover and mutation methods
+                    current_crossover_method = crossover_method
+                    current_mutation_method = mutation_method
     
-                for _ in range(100):  # Number of runs
-                    global max_generations, fitness_threshold, pop_size, mutation_rate
-
-                    # Initialize the population
-                    population = initialize_population(pop_size, city_ids)
-
-                    for generation in range(max_generations):
-                        # Calculate fitness for each individual
-                        for individual in population.individuals:
-                            calculate_fitness(individual, city_data)
-            
-                        # Select parents using roulette wheel selection
-                        parents = [roulette_wheel_selection(population) for _ in range(pop_size)]
-
-                        new_population = Population(pop_size, city_ids)
-                        for i in range(0, pop_size, 2):
-                            child1, child2 = population.uniform_crossover(parents[i], parents[i + 1])
-                            new_population.individuals[i] = Individual(child1)
-                            new_population.individuals[i + 1] = Individual(child2)
-
-                        # Apply mutation to the new population
-                        for individual in new_population.individuals:
-                            if random.random() < mutation_rate:
-                                individual.swap_mutation()
-                            if random.random() < mutation_rate:
-                                individual.scramble_mutation()
-
-                        population = new_population
-
-                        if check_termination_criteria(population, generation, max_generations, fitness_threshold):
-                            break
-
-                    # Calculate fitness for all individuals in the final total population
-                    for individual in population.individuals:
-                        calculate_fitness(individual, city_data)
+                    global max_generations, pop_size, mutation_rate
+                    # Run the GA with the crossover method of this benchmark row
+                    config = RunConfig(crossover_method=current_crossover_method, mutation_method=current_mutation_method,
+                                       pop_size=pop_size, max_generations=max_generations,
+                                       mutation_rate=mutation_rate, stall_generations=stall_generations,
+                                       seed_fraction=seed_fraction, seed_method=seed_method, profile=profile)
+
+                    # Runs execute in the worker pool and arrive here as they finish
+                    for result in scheduler.run([config], 100):  # Number of runs
+                        self.checkpoint()  # Pause and cancel take effect between runs
+                        # Fitness for all individuals in the final total population is computed by the worker
+                        population = result.population()
+                        self.fitness_cache.store(result.routes, result.fitness)
+                        if self.profiler is not None:
+                            self.profiler.merge(result.profile)
+                            if self.report.enabled("runs"):
+                                print(PhaseProfiler().merge(result.profile).table(
+                                    f"{current_crossover_method} + {current_mutation_method} run {result.run_index}"))
                 
-                    valid_individuals = []
-                    #valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
+                        valid_individuals = []
+                        #valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
 
-                    for individual in population.individuals:
-                        calculate_fitness(individual, city_data)
-                        if individual.fitness is not None:
-                            valid_individuals.append(individual)
+                        for individual in population.individuals:
+                            if individual.fitness is not None:
+                                valid_individuals.append(individual)
 
 
-                    print("Expert Fitness Values:")
-                    for expert in valid_individuals:
-                        print(f"Expert fitness: {expert.fitness}")
+                        if self.report.enabled("debug"):
+                            print("Expert Fitness Values:")
+                            for expert in valid_individuals:
+                                print(f"Expert fitness: {expert.fitness}")
         
 
-                    if valid_individuals:
-                        best_solution = min(valid_individuals, key=lambda x: x.fitness)
-                        self.best_solution = best_solution
-                        self.update_gui()  # Update the GUI with the best solution
-
-                        experts = sorted(valid_individuals, key=lambda x: x.fitness)
-                        num_experts = int(len(experts) * 0.10)
-                        top_expert_routes = [expert.route for expert in experts[:num_experts]]
-
-
-            
-                        top_expert_solutions.extend(top_expert_routes)
-                
-
-                        print("Top 10% Expert Solutions:")
-
-            
-                        for i, route in enumerate(top_expert_routes):
-                            individual = Individual(city_data.keys())
-                            individual.route = route
-                            calculate_fitness(individual, self.city_data)
-                            print(f"Expert {i + 1} route: {route} Cost: {individual.fitness:.2f}")
-                        #keeps track of the top ten percent of routes and their cost
-                        #Append the top expert routes to the list
-                        top_expert_solutions.extend(top_expert_routes)
-
-                        combined_expert_solution = self.combine_expert_solutions(top_expert_routes)
-                        combined_route = combined_expert_solution.route
-                        #prints combined expert solution from top ten percent. 
-                        print("Combined Expert Solution:")
-                        print(f"Route: {combined_route}")
-                        print(f"Cost of Combined Solution: {combined_expert_solution.fitness:.2f}")
-                        print(f"Combination: {current_crossover_method} + {current_mutation_method}")
+                        if valid_individuals:
+                            # Best tour of the whole run, which may no longer be in the final population
+                            best_solution = Individual(result.best_route)
+                            best_solution.fitness = result.best_fitness
+                            self.best_solution = best_solution
+                            self.show_best(best_solution)  # Update the GUI with the best solution
+
+                            experts = sorted(valid_individuals, key=lambda x: x.fitness)
+                            num_experts = int(len(experts) * 0.10)
+                            top_expert_routes = [expert.route for expert in experts[:num_experts]]
+                            top_expert_solutions.add(top_expert_routes, [expert.fitness for expert in experts[:num_experts]])
+
+                            if self.report.enabled("debug"):
+                                print("Top 10% Expert Solutions:")
+                                for i, route in enumerate(top_expert_routes):
+                                    individual = Individual(self.city_data.keys())
+                                    individual.route = route
+                                    self.score(individual)
+                                    print(f"Expert {i + 1} route: {route} Cost: {individual.fitness:.2f}")
+
+                            combined_expert_solution = self.combine_expert_solutions(top_expert_routes)
+                            combined_route = combined_expert_solution.route
+                            #prints combined expert solution from top ten percent. 
+                            self.report("debug", "Combined Expert Solution:")
+                            self.report("debug", f"Route: {combined_route}")
+                            self.report("runs", f"Cost of Combined Solution: {combined_expert_solution.fitness:.2f}")
+                            self.report("runs", f"Combination: {current_crossover_method} + {current_mutation_method}")
             
-                        #combined_route = self.apply_greedy_algorithm(combined_route, self.city_data)
-                        combined_route = self.complete_tsp_solution(combined_route)
-                        combined_solution = Individual(city_data.keys())
-                        combined_solution.route = combined_route
-                        calculate_fitness(combined_solution, self.city_data)
-                        #completes that Combined Expert Solution and ensures TSP solution
-                        print("Complete TSP Solution:")
-                        print(f"Route: {combined_route}")
-                        print(f"Cost of Complete TSP Solution: {combined_solution.fitness:.2f}")
-
-                        combined_costs.append(combined_solution.fitness)
-                    else:
-                        print("No valid solutions found!")
-
-                    end_time = time.time()
-
-            # Calculate execution time
-                    execution_time = end_time - start_time
-                    print(f"Execution time: {execution_time:.2f} seconds")
+                            #combined_route = self.apply_greedy_algorithm(combined_route, self.city_data)
+                            combined_route = self.complete_tsp_solution(combined_route)
+                            if self.local_search is not None:
+                                # Hybrid step: local search post-pass on the completed crowd tour
+                                combined_route, _ = self.local_search.improve(combined_route)
+                            combined_solution = Individual(self.city_data.keys())
+                            combined_solution.route = combined_route
+                            self.score(combined_solution)
+                            #completes that Combined Expert Solution and ensures TSP solution
+                            self.report("debug", "Complete TSP Solution:")
+                            self.report("debug", f"Route: {combined_route}")
+                            self.report("runs", f"Cost of Complete TSP Solution: {combined_solution.fitness:.2f}")
+
+                            combined_costs.append(combined_solution.fitness)
+                        else:
+                            self.report("runs", "No valid solutions found!")
+
+                        # Time the worker spent on this run
+                        self.report("runs", f"Execution time: {result.elapsed:.2f} seconds")
+        finally:
+            scheduler.close()
+
+        if len(top_expert_solutions):
+            # Wisdom of crowds over the archived experts of all runs
+            crowd_route = self.complete_tsp_solution(top_expert_solutions.consensus(self.distance_matrix.coordinates))
+            if self.local_search is not None:
+                crowd_route, _ = self.local_search.improve(crowd_route)
+            crowd_solution = Individual(self.city_data.keys())
+            crowd_solution.route = crowd_route
+            self.score(crowd_solution)
+            self.report("summary", f"Cross-run crowd of {len(top_expert_solutions)} experts:")
+            self.report("debug", f"Route: {crowd_route}")
+            self.report("summary", f"Cost of cross-run crowd solution: {crowd_solution.fitness:.2f}")
 
         average_costs.append(np.mean(combined_costs))
         min_costs.append(np.min(combined_costs))
         max_costs.append(np.max(combined_costs))
         #100 runs of Complete TSP solution then outputs average
-        print(f"Average Cost of Complete TSP Solutions: {np.mean(average_costs):.2f}")
-        print(f"Min Cost of Complete TSP Solutions: {np.min(min_costs):.2f}")
-        print(f"Max Cost of Complete TSP Solutions: {np.max(max_costs):.2f}")
+        self.report("summary", f"Average Cost of Complete TSP Solutions: {np.mean(average_costs):.2f}")
+        self.report("summary", f"Min Cost of Complete TSP Solutions: {np.min(min_costs):.2f}")
+        self.report("summary", f"Max Cost of Complete TSP Solutions: {np.max(max_costs):.2f}")
+        self.report("debug", f"Fitness cache: {self.fitness_cache.hits} hits, {self.fitness_cache.misses} misses")
+        self.report("summary", f"Sweep time: {time.perf_counter() - start_time:.2f} seconds")
+        if self.profiler is not None:
+            print(self.profiler.table("Phase breakdown for the whole session"))
         
     def complete_tsp_solution(self, combined_route):
-        visited_cities = set()
-        new_route = []
-
-        for city in combined_route:
-            if city not in visited_cities:
-                new_route.append(city)
-                visited_cities.add(city)
-            else:
-                unvisited_city = None
-                for i in range(1, len(combined_route) + 1):
-                    if i not in visited_cities:
-                        unvisited_city = i
-                        break
-
-                if unvisited_city is not None:
-                    new_route.append(unvisited_city)
-                    visited_cities.add(unvisited_city)
+        # Drops repeated cities and inserts every missing one where it adds the
+        # least distance (RepairStage in repair.py), then closes the tour
+        new_route = self.repair(combined_route)
 
         if new_route[0] != new_route[-1]:
             new_route.append(new_route[0])
@@ -400,9 +414,9 @@ class TSPGUI:
 
         experts = []
         for route in expert_routes:
-            individual = Individual(city_data.keys())
+            individual = Individual(self.city_data.keys())
             individual.route = route
-            calculate_fitness(individual, self.city_data)
+            self.score(individual)
             experts.append(individual)
 
         sorted_experts = sorted(experts, key=lambda x: x.fitness)
@@ -419,550 +433,185 @@ class TSPGUI:
         
 
         # Create an Individual object with the combined route
-        combined_individual = Individual(city_data.keys())
+        combined_individual = Individual(self.city_data.keys())
         combined_individual.route = combined_route
-        calculate_fitness(combined_individual, self.city_data)
+        self.score(combined_individual)
 
         return combined_individual
 
     
     def combine_routes(self, routes):
-       
-        combined_route = []
+        # Consensus tour built from the edges the experts agree on most (see
+        # crowd.py). Unlike averaging city ids position by position, the
+        # result is always a valid tour.
+        return consensus_tour(routes, self.distance_matrix.coordinates)
 
-        for i in range(len(routes[0])):
-            total_position = sum(route[i] for route in routes)
-            combined_position = total_position / len(routes)
-            combined_route.append(int(combined_position))
-
-        return combined_route
-    
     def apply_greedy_algorithm(self, route, city_coordinates):
-    # Start from the first city
-        current_city = route[0]
-        unvisited_cities = set(route[1:])  # Exclude the starting node
-
-        new_route = [current_city]
-
-        while unvisited_cities:
-            nearest_city = min(unvisited_cities, key=lambda city: calculated_distance_cities(city_coordinates[current_city], city_coordinates[city]))
-            new_route.append(nearest_city)
-            unvisited_cities.remove(nearest_city)
-            current_city = nearest_city
+        # Nearest neighbour tour starting from the first city, using the grid
+        # index in construction.py instead of a min() over all unvisited cities
+        cities = list(dict.fromkeys(route))
+        coordinates = np.zeros((max(cities) + 1, 2))
+        coordinates[cities] = [city_coordinates[city] for city in cities]
+        new_route = nearest_neighbor_tour(cities, coordinates, start_city=route[0])
 
     # Adds the starting node to complete the TSP route
         new_route.append(new_route[0])
 
         return new_route
 
-def main():
-
-    root = tk.Tk()
-    root.title("TSP GA")
-    gui = TSPGUI(root, city_data, "Uniform", "Swap")
-    root.mainloop()
-
-
-if __name__ == "__main__":
-    main()
-
-# Crossover and mutation methods to be tested
-crossover_methods = ["Cycle", "Uniform"]
-mutation_methods = ["Swap", "Scramble"]
-
-fitness_dict = {}
-
-for crossover_method in crossover_methods:
-    for mutation_method in mutation_methods:
-        if crossover_method == "Uniform" and mutation_method == "Swap":
-            pop_size = 100
-            mutation_rate = 0.2
-        elif crossover_method == "Cycle" and mutation_method == "Scramble":
-            pop_size = 100
-            mutation_rate = 0.2
-        else:
-            pop_size = 100
-            mutation_rate = 0.2
-
-        results = []
-        start_time = time.time() 
-        # Run the GA loop
-        for _ in range(100):  # number of run times
-            population = initialize_population(pop_size, city_ids)
-
-            for generation in range(max_generations):
-                for individual in population.individuals:
-                    calculate_fitness(individual, city_data)
-
-                parents = [roulette_wheel_selection(population) for _ in range(pop_size)]
-
-                new_population = Population(pop_size, city_ids)
-                for i in range(0, pop_size, 2):
-                    child1, child2 = population.uniform_crossover(parents[i], parents[i + 1])
-                    new_population.individuals[i] = Individual(child1)
-                    new_population.individuals[i + 1] = Individual(child2)
-
-                for individual in new_population.individuals:
-                    if random.random() < mutation_rate:
-                        individual.swap_mutation()
-                    if random.random() < mutation_rate:
-                        individual.scramble_mutation()
-
-                population = new_population
-
-                if check_termination_criteria(population, generation, max_generations, fitness_threshold):
-                    break
-
-            for individual in population.individuals:
-                calculate_fitness(individual, city_data)
-
-            valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
-
-            expert_cost_data = {}
-
-
-            if valid_individuals:
-                best_solution = min(valid_individuals, key=lambda x: x.fitness)
-                results.append(best_solution.fitness)
-                print(f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
-                print(f"Best solution found is: {best_solution.route}")
-                print(f"Total distance traveled in tour: {best_solution.fitness}")
-
-                expert_cost_data[(crossover_method, mutation_method)] = [ind.fitness for ind in valid_individuals]
-            
-            else:
-                print("No valid solutions found!")
-
-
-        fitness_dict[(crossover_method, mutation_method)] = results
-        print(f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
-
-        #calculations for my WOC 100 runs. 
-        if results:
-            mean_fitness = sum(results) / len(results)
-            min_fitness = min(results)
-            max_fitness = max(results)
-            std_deviation = math.sqrt(sum((x - mean_fitness) ** 2 for x in results) / len(results))
-
-            print(f"Mean fitness for 100 runs: {mean_fitness:.2f}")
-            print(f"Minimum fitness for 100 runs: {min_fitness:.2f}")
-            print(f"Maximum fitness for 100 runs: {max_fitness:.2f}")
-            print(f"Standard deviation for 100 runs: {std_deviation:.2f}")
-        else:
-            print("No valid solutions found!")
-
-        end_time = time.time()  # Records the end time
-        execution_time = end_time - start_time
-        print(f"Execution time for 100 runs: {execution_time:.2f} seconds")
-
-
-# Display execution times for all combinations
-results_dict = {}
-execution_times = {} 
-
-for combo, results in fitness_dict.items():
-    crossover_method, mutation_method = combo
-    if results:
-        mean_fitness = sum(results) / len(results)
-        min_fitness = min(results)
-        max_fitness = max(results)
-        std_deviation = math.sqrt(sum((x - mean_fitness) ** 2 for x in results) / len(results))
-        #start_time = time.time()
-        execution_time = 0
-        execution_times[combo] = 0
-        for _ in range(100):
-            start_time = time.time()
-            end_time = time.time()
-            execution_time += end_time - start_time
-            execution_times[combo] += execution_time  
-      
-        results_dict[combo] = {
-            "mean_fitness": mean_fitness,
-            "min_fitness": min_fitness,
-            "max_fitness": max_fitness,
-            "std_deviation": std_deviation,
-            "execution_time": execution_time  # execution time
-        }
-       
-
-# Display results for all combinations
-for combo, results in results_dict.items():
-    crossover_method, mutation_method = combo
-    print(f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
-    print(f"Mean fitness for 100 runs: {results['mean_fitness']:.2f}")
-    print(f"Minimum fitness for 100 runs: {results['min_fitness']:.2f}")
-    print(f"Maximum fitness for 100 runs: {results['max_fitness']:.2f}")
-    print(f"Standard deviation for 100 runs: {results['std_deviation']:.2f}")
-   
-
-
-for combo, fitness_values in fitness_dict.items():
-    crossover_method, mutation_method = combo
-    generations = list(range(len(fitness_values)))
-    
-    #if (crossover_method == "Cycle" and mutation_method == "Swap") or (crossover_method == "Uniform" and mutation_method == "Scramble"):
-    label = f"{crossover_method}, {mutation_method}"
-        
-    if fitness_values:
-        plt.plot(generations, fitness_values, label=label)
-
-plt.xlabel("Generation")
-plt.ylabel("Cost")
-plt.legend(loc="best")
-plt.title("Improvement Curves for Four Selected GA combinations")
-plt.show()
-
-generation = list(range(1, 11))  # Use data for 10 generations
-cost = [
-    499.50, 519.49, 551.66, 551.66, 551.66, 559.88, 559.88, 561.31, 565.63, 573.45
-]  # Replace with any cost values
-
-plt.plot(generation, cost, marker='o', linestyle='-')
-plt.title('Top Expert Routes By Rank')
-plt.xlabel('Top ten expert index')
-plt.ylabel('Cost')
-plt.grid(True)
-plt.show()
-
-
-                        population = new_population
-
-                        if check_termination_criteria(population, generation, max_generations, fitness_threshold):
-                            break
-
-        # Calculate fitness for all individuals in the final total population
-                    for individual in population.individuals:
-                        calculate_fitness(individual, city_data)
-                
-                    valid_individuals = []
-            #valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
-
-                    for individual in population.individuals:
-                        calculate_fitness(individual, city_data)
-                        if individual.fitness is not None:
-                            valid_individuals.append(individual)
-
-            
-
-
-
-                    print("Expert Fitness Values:")
-                    for expert in valid_individuals:
-                        print(f"Expert fitness: {expert.fitness}")
-        
+def run_benchmark(distance_matrix, crossover_methods=("Cycle", "Uniform"), mutation_methods=("Swap", "Scramble"),
+                  runs=100, generations=None, workers=None, seed=None, telemetry=None, verbosity="quiet",
+                  profile=False):
+    # Runs every crossover/mutation combination `runs` times and returns
+    # ({combo: [best fitness per run]}, {combo: summary statistics}).
+    # telemetry is a store path (see telemetry.py) for the per-generation
+    # statistics of every run; verbosity is one of telemetry.VERBOSITY_LEVELS.
+    # profile=True times the phases of every run (see profiling.py), prints a
+    # breakdown per combination and for the sweep and adds it to the summaries.
+    if generations is None:
+        generations = max_generations
+    report = Reporter(verbosity)
+    sweep_profile = PhaseProfiler() if profile else None
+    fitness_dict = {}
+    results_dict = {}
+
+    writer = TelemetryWriter(telemetry) if telemetry is not None else None
+    with RunScheduler(distance_matrix, workers=workers, seed=seed) as scheduler:
+        for crossover_method in crossover_methods:
+            for mutation_method in mutation_methods:
+                results = []
+                best_route = None
+                combo_profile = PhaseProfiler() if profile else None
+                start_time = time.perf_counter()
+                config = RunConfig(crossover_method=crossover_method, mutation_method=mutation_method,
+                                   pop_size=pop_size, max_generations=generations,
+                                   mutation_rate=mutation_rate, stall_generations=stall_generations,
+                                   seed_fraction=seed_fraction, seed_method=seed_method,
+                                   telemetry=writer is not None, profile=profile)
+                # Run the GA loop, runs are spread over the worker pool and streamed back
+                for result in scheduler.run([config], runs):
+                    if writer is not None:
+                        writer.write(result.telemetry, crossover=crossover_method, mutation=mutation_method,
+                                     run_index=result.run_index)
+                    if combo_profile is not None:
+                        combo_profile.merge(result.profile)
+                        if report.enabled("runs"):
+                            print(PhaseProfiler().merge(result.profile).table(
+                                f"{crossover_method} + {mutation_method} run {result.run_index}"))
+                    population = result.population()
+
+                    valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
 
                     if valid_individuals:
-                        best_solution = min(valid_individuals, key=lambda x: x.fitness)
-                        self.best_solution = best_solution
-                        self.update_gui()  # Update the GUI with the best solution
-
-                        experts = sorted(valid_individuals, key=lambda x: x.fitness)
-                        num_experts = int(len(experts) * 0.10)
-                        top_expert_routes = [expert.route for expert in experts[:num_experts]]
-
-
-            # Append the top expert routes to the list
-                        top_expert_solutions.extend(top_expert_routes)
-                
-
-                        print("Top 10% Expert Solutions:")
-
-            
-                        for i, route in enumerate(top_expert_routes):
-                            individual = Individual(city_data.keys())
-                            individual.route = route
-                            calculate_fitness(individual, self.city_data)
-                            print(f"Expert {i + 1} route: {route} Cost: {individual.fitness:.2f}")
-
-            # Append the top expert routes to the list
-                        top_expert_solutions.extend(top_expert_routes)
-
-                        combined_expert_solution = self.combine_expert_solutions(top_expert_routes)
-                        combined_route = combined_expert_solution.route
-
-                        print("Combined Expert Solution:")
-                        print(f"Route: {combined_route}")
-                        print(f"Cost of Combined Solution: {combined_expert_solution.fitness:.2f}")
-                        print(f"Combination: {current_crossover_method} + {current_mutation_method}")
-            
-                #combined_route = self.apply_greedy_algorithm(combined_route, self.city_data)
-                        combined_route = self.complete_tsp_solution(combined_route)
-                        combined_solution = Individual(city_data.keys())
-                        combined_solution.route = combined_route
-                        calculate_fitness(combined_solution, self.city_data)
-
-                        print("Complete TSP Solution:")
-                        print(f"Route: {combined_route}")
-                        print(f"Cost of Complete TSP Solution: {combined_solution.fitness:.2f}")
-
-                        combined_costs.append(combined_solution.fitness)
+                        # Best tour of the whole run, which may no longer be in the final population
+                        best_solution = Individual(result.best_route)
+                        best_solution.fitness = result.best_fitness
+                        if not results or best_solution.fitness < min(results):
+                            best_route = best_solution.route
+                        results.append(best_solution.fitness)
+                        report("debug", f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
+                        report("debug", f"Best solution found is: {best_solution.route}")
+                        report("runs", f"Total distance traveled in tour: {best_solution.fitness}")
                     else:
-                        print("No valid solutions found!")
-
-                    end_time = time.time()
-
-            # Calculate execution time
-                    execution_time = end_time - start_time
-                    print(f"Execution time: {execution_time:.2f} seconds")
-
-        average_costs.append(np.mean(combined_costs))
-        min_costs.append(np.min(combined_costs))
-        max_costs.append(np.max(combined_costs))
-
-        print(f"Average Cost of Complete TSP Solutions: {np.mean(average_costs):.2f}")
-        print(f"Min Cost of Complete TSP Solutions: {np.min(min_costs):.2f}")
-        print(f"Max Cost of Complete TSP Solutions: {np.max(max_costs):.2f}")
-        
-    def complete_tsp_solution(self, combined_route):
-        visited_cities = set()
-        new_route = []
-
-        for city in combined_route:
-            if city not in visited_cities:
-                new_route.append(city)
-                visited_cities.add(city)
-            else:
-                unvisited_city = None
-                for i in range(1, len(combined_route) + 1):
-                    if i not in visited_cities:
-                        unvisited_city = i
-                        break
-
-                if unvisited_city is not None:
-                    new_route.append(unvisited_city)
-                    visited_cities.add(unvisited_city)
-
-        if new_route[0] != new_route[-1]:
-            new_route.append(new_route[0])
-
-        return new_route
-
-    def combine_expert_solutions(self, expert_routes):
-        # Sort the experts based on fitness
-
-        experts = []
-        for route in expert_routes:
-            individual = Individual(city_data.keys())
-            individual.route = route
-            calculate_fitness(individual, self.city_data)
-            experts.append(individual)
-
-        sorted_experts = sorted(experts, key=lambda x: x.fitness)
-
-        # Calculate the number of experts to select (100% of the population)
-        num_experts = int(len(sorted_experts) * 1.00)
-
-
-        # Extract the routes of the top experts
-        top_expert_routes = [expert.route for expert in sorted_experts[:num_experts]]
-
-        # Combine the routes 
-        combined_route = self.combine_routes(top_expert_routes)
-        
-
-        # Create an Individual object with the combined route
-        combined_individual = Individual(city_data.keys())
-        combined_individual.route = combined_route
-        calculate_fitness(combined_individual, self.city_data)
-
-        return combined_individual
-
-    
-    def combine_routes(self, routes):
-       
-        combined_route = []
-
-        for i in range(len(routes[0])):
-            total_position = sum(route[i] for route in routes)
-            combined_position = total_position / len(routes)
-            combined_route.append(int(combined_position))
-
-        return combined_route
-    
-    def apply_greedy_algorithm(self, route, city_coordinates):
-    # Start from the first city (starting node)
-        current_city = route[0]
-        unvisited_cities = set(route[1:])  # Exclude the starting node
-
-        new_route = [current_city]
-
-        while unvisited_cities:
-            nearest_city = min(unvisited_cities, key=lambda city: calculated_distance_cities(city_coordinates[current_city], city_coordinates[city]))
-            new_route.append(nearest_city)
-            unvisited_cities.remove(nearest_city)
-            current_city = nearest_city
-
-    # Adds the starting node to complete the TSP route
-        new_route.append(new_route[0])
-
-        return new_route
-
-def main():
+                        report("runs", "No valid solutions found!")
+
+                fitness_dict[(crossover_method, mutation_method)] = results
+                execution_time = time.perf_counter() - start_time
+                report("runs", f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
+
+                #calculations for my WOC runs.
+                if results:
+                    mean_fitness = sum(results) / len(results)
+                    std_deviation = math.sqrt(sum((x - mean_fitness) ** 2 for x in results) / len(results))
+                    results_dict[(crossover_method, mutation_method)] = {
+                        "mean_fitness": mean_fitness,
+                        "min_fitness": min(results),
+                        "max_fitness": max(results),
+                        "std_deviation": std_deviation,
+                        "execution_time": execution_time,
+                        "best_route": best_route,
+                    }
+                    if combo_profile is not None:
+                        results_dict[(crossover_method, mutation_method)]["profile"] = combo_profile.summary()
+                    report("runs", f"Mean fitness for {runs} runs: {mean_fitness:.2f}")
+                    report("runs", f"Minimum fitness for {runs} runs: {min(results):.2f}")
+                    report("runs", f"Maximum fitness for {runs} runs: {max(results):.2f}")
+                    report("runs", f"Standard deviation for {runs} runs: {std_deviation:.2f}")
+                else:
+                    report("runs", "No valid solutions found!")
+                report("runs", f"Execution time for {runs} runs: {execution_time:.2f} seconds")
+                if combo_profile is not None:
+                    print(combo_profile.table(f"Phase breakdown for {crossover_method} + {mutation_method}"))
+                    sweep_profile.merge(combo_profile)
+    if writer is not None:
+        writer.close()
+
+    # Display results for all combinations
+    for combo, results in results_dict.items():
+        crossover_method, mutation_method = combo
+        report("summary", f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
+        report("summary", f"Mean fitness for {runs} runs: {results['mean_fitness']:.2f}")
+        report("summary", f"Minimum fitness for {runs} runs: {results['min_fitness']:.2f}")
+        report("summary", f"Maximum fitness for {runs} runs: {results['max_fitness']:.2f}")
+        report("summary", f"Standard deviation for {runs} runs: {results['std_deviation']:.2f}")
+    if sweep_profile is not None:
+        print(sweep_profile.table("Phase breakdown for the whole sweep"))
+
+    return fitness_dict, results_dict
+
+
+def plot_results(path=telemetry_path):
+    # Improvement curves from the telemetry store written by run_benchmark: the
+    # best cost per generation, averaged over the runs of each combination.
+    # matplotlib is only imported when something is actually plotted
+    import matplotlib.pyplot as plt
+
+    for combo, fitness_values in improvement_curves(read_telemetry(path)).items():
+        crossover_method, mutation_method = combo
+        generations = list(range(len(fitness_values)))
+
+        #if (crossover_method == "Cycle" and mutation_method == "Swap") or (crossover_method == "Uniform" and mutation_method == "Scramble"):
+        label = f"{crossover_method}, {mutation_method}"
+
+        if len(fitness_values):
+            plt.plot(generations, fitness_values, label=label)
+
+    plt.xlabel("Generation")
+    plt.ylabel("Cost")
+    plt.legend(loc="best")
+    plt.title("Improvement Curves for Four Selected GA combinations")
+    plt.show()
+
+    generation = list(range(1, 11))  # Use data for 10 generations
+    cost = [
+        499.50, 519.49, 551.66, 551.66, 551.66, 559.88, 559.88, 561.31, 565.63, 573.45
+    ]  # Replace with any cost values
+
+    plt.plot(generation, cost, marker='o', linestyle='-')
+    plt.title('Top Expert Routes By Rank')
+    plt.xlabel('Top ten expert index')
+    plt.ylabel('Cost')
+    plt.grid(True)
+    plt.show()
+
+
+def main(path=file_path):
+    # Interactive session: the GUI first, then the operator benchmark and plots
+    # once the window is closed. Headless batch runs go through cli.py instead.
+    import tkinter as tk
+
+    instance = load_instance(path)
+    distance_matrix = instance.distance_matrix()
 
     root = tk.Tk()
     root.title("TSP GA")
-    gui = TSPGUI(root, city_data, "Uniform", "Swap")
+    gui = TSPGUI(root, instance.city_data(), "Uniform", "Swap", distance_matrix)
     root.mainloop()
 
+    run_benchmark(distance_matrix, workers=workers, seed=seed, telemetry=telemetry_path, verbosity=verbosity,
+                  profile=profile)
+    plot_results(telemetry_path)
+
 
 if __name__ == "__main__":
     main()
-
-# Crossover and mutation methods to be tested
-crossover_methods = ["Cycle", "Uniform"]
-mutation_methods = ["Swap", "Scramble"]
-
-fitness_dict = {}
-
-for crossover_method in crossover_methods:
-    for mutation_method in mutation_methods:
-        if crossover_method == "Uniform" and mutation_method == "Swap":
-            pop_size = 100
-            mutation_rate = 0.2
-        elif crossover_method == "Cycle" and mutation_method == "Scramble":
-            pop_size = 100
-            mutation_rate = 0.2
-        else:
-            pop_size = 100
-            mutation_rate = 0.2
-
-        results = []
-        start_time = time.time() 
-        # Run the GA loop
-        for _ in range(100):  # number of run times
-            population = initialize_population(pop_size, city_ids)
-
-            for generation in range(max_generations):
-                for individual in population.individuals:
-                    calculate_fitness(individual, city_data)
-
-                parents = [roulette_wheel_selection(population) for _ in range(pop_size)]
-
-                new_population = Population(pop_size, city_ids)
-                for i in range(0, pop_size, 2):
-                    child1, child2 = population.uniform_crossover(parents[i], parents[i + 1])
-                    new_population.individuals[i] = Individual(child1)
-                    new_population.individuals[i + 1] = Individual(child2)
-
-                for individual in new_population.individuals:
-                    if random.random() < mutation_rate:
-                        individual.swap_mutation()
-                    if random.random() < mutation_rate:
-                        individual.scramble_mutation()
-
-                population = new_population
-
-                if check_termination_criteria(population, generation, max_generations, fitness_threshold):
-                    break
-
-            for individual in population.individuals:
-                calculate_fitness(individual, city_data)
-
-            valid_individuals = [ind for ind in population.individuals if ind.fitness is not None]
-
-            expert_cost_data = {}
-
-
-            if valid_individuals:
-                best_solution = min(valid_individuals, key=lambda x: x.fitness)
-                results.append(best_solution.fitness)
-                print(f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
-                print(f"Best solution found is: {best_solution.route}")
-                print(f"Total distance traveled in tour: {best_solution.fitness}")
-
-                expert_cost_data[(crossover_method, mutation_method)] = [ind.fitness for ind in valid_individuals]
-            
-            else:
-                print("No valid solutions found!")
-
-
-        fitness_dict[(crossover_method, mutation_method)] = results
-        print(f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
-
-
-        if results:
-            mean_fitness = sum(results) / len(results)
-            min_fitness = min(results)
-            max_fitness = max(results)
-            std_deviation = math.sqrt(sum((x - mean_fitness) ** 2 for x in results) / len(results))
-
-            print(f"Mean fitness for 100 runs: {mean_fitness:.2f}")
-            print(f"Minimum fitness for 100 runs: {min_fitness:.2f}")
-            print(f"Maximum fitness for 100 runs: {max_fitness:.2f}")
-            print(f"Standard deviation for 100 runs: {std_deviation:.2f}")
-        else:
-            print("No valid solutions found!")
-
-        end_time = time.time()  # Records the end time
-        execution_time = end_time - start_time
-        print(f"Execution time for 100 runs: {execution_time:.2f} seconds")
-
-
-# Display execution times for all combinations
-results_dict = {}
-execution_times = {} 
-
-for combo, results in fitness_dict.items():
-    crossover_method, mutation_method = combo
-    if results:
-        mean_fitness = sum(results) / len(results)
-        min_fitness = min(results)
-        max_fitness = max(results)
-        std_deviation = math.sqrt(sum((x - mean_fitness) ** 2 for x in results) / len(results))
-        #start_time = time.time()
-        execution_time = 0
-        execution_times[combo] = 0
-        for _ in range(100):
-            start_time = time.time()
-            end_time = time.time()
-            execution_time += end_time - start_time
-            execution_times[combo] += execution_time  
-      
-        results_dict[combo] = {
-            "mean_fitness": mean_fitness,
-            "min_fitness": min_fitness,
-            "max_fitness": max_fitness,
-            "std_deviation": std_deviation,
-            "execution_time": execution_time  # execution time
-        }
-       
-
-# Display results for all combinations
-for combo, results in results_dict.items():
-    crossover_method, mutation_method = combo
-    print(f"Results for Crossover: {crossover_method}, Mutation is: {mutation_method}")
-    print(f"Mean fitness for 100 runs: {results['mean_fitness']:.2f}")
-    print(f"Minimum fitness for 100 runs: {results['min_fitness']:.2f}")
-    print(f"Maximum fitness for 100 runs: {results['max_fitness']:.2f}")
-    print(f"Standard deviation for 100 runs: {results['std_deviation']:.2f}")
-   
-
-
-for combo, fitness_values in fitness_dict.items():
-    crossover_method, mutation_method = combo
-    generations = list(range(len(fitness_values)))
-    
-    #if (crossover_method == "Cycle" and mutation_method == "Swap") or (crossover_method == "Uniform" and mutation_method == "Scramble"):
-    label = f"{crossover_method}, {mutation_method}"
-        
-    if fitness_values:
-        plt.plot(generations, fitness_values, label=label)
-
-plt.xlabel("Generation")
-plt.ylabel("Cost")
-plt.legend(loc="best")
-plt.title("Improvement Curves for four selected GA combinations")
-plt.show()
-
-generation = list(range(1, 11))  # Use data for 10 generations
-cost = [
-    499.50, 519.49, 551.66, 551.66, 551.66, 559.88, 559.88, 561.31, 565.63, 573.45
-]  # Replace with any cost values
-
-plt.plot(generation, cost, marker='o', linestyle='-')
-plt.title('Top Expert Routes by order')
-plt.xlabel('Expert index')
-plt.ylabel('Cost')
-plt.grid(True)
-plt.show()
-
@@ -0,0 +1,98 @@
+import numpy as np
+
+from crowd import consensus_tour
+
+
+def canonical_routes(routes):
+    # The same closed tour can be written starting at any city and in either
+    # direction. Rotates every row to start at its smallest city id and reverses
+    # it if needed so the second city is smaller than the last one, giving one
+    # spelling per tour.
+    routes = np.atleast_2d(np.asarray(routes, dtype=np.int32))
+    rows, length = routes.shape
+    shift = (np.argmin(routes, axis=1)[:, None] + np.arange(length)) % length
+    rotated = np.take_along_axis(routes, shift, axis=1)
+    if length > 2:
+        backwards = rotated[:, 1] > rotated[:, -1]
+        rotated[backwards, 1:] = rotated[backwards, :0:-1]
+    return rotated
+
+
+# Per-position random multipliers for route_keys, by route length
+_key_weights = {}
+
+
+def route_keys(routes):
+    # 128-bit key per row of canonical tours: two sums of city id times a fixed
+    # random 64-bit weight per position, wrapping mod 2^64. One vectorised pass
+    # over the whole array; the weights come from a fixed seed, so keys are
+    # the same in every process. Returned as a list of (int, int) tuples.
+    routes = np.atleast_2d(routes)
+    length = routes.shape[1]
+    if length not in _key_weights:
+        rng = np.random.default_rng(length)
+        _key_weights[length] = rng.integers(0, 2 ** 63, (2, length), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    weights = _key_weights[length]
+    values = routes.astype(np.uint64)
+    keys = np.stack([(values * weights[0]).sum(axis=1), (values * weights[1]).sum(axis=1)], axis=1)
+    return list(map(tuple, keys.tolist()))
+
+
+class ExpertArchive:
+    def __init__(self, capacity, length):
+        # Fixed-size store of the best distinct expert tours seen so far, across
+        # any number of runs. Tours are stored canonically in one preallocated
+        # int32 array, so memory stays at capacity * length no matter how many
+        # experts are offered; duplicates are recognised by route_keys(). When
+        # full, a new tour replaces the worst stored one if it is shorter.
+        self.capacity = capacity
+        self.routes = np.zeros((capacity, length), dtype=np.int32)
+        self.costs = np.full(capacity, np.inf)
+        self.slots = {}  # route key -> slot
+        self.keys = [None] * capacity
+        self.count = 0
+        self.offered = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, routes, costs):
+        # Offers experts (one route or a 2-D array of routes) with their tour
+        # lengths. Returns how many were stored.
+        costs = np.atleast_1d(np.asarray(costs, dtype=float))
+        if not costs.size:
+            return 0
+        canonical = canonical_routes(routes)
+        self.offered += len(costs)
+        stored = 0
+        keys = route_keys(canonical)
+        # Shortest first, so a full archive evicts as few of them as possible
+        for index in np.argsort(costs, kind="stable"):
+            key = keys[index]
+            if key in self.slots:
+                continue
+            if self.count < self.capacity:
+                slot = self.count
+                self.count += 1
+            else:
+                slot = int(np.argmax(self.costs))
+                if costs[index] >= self.costs[slot]:
+                    continue
+                del self.slots[self.keys[slot]]
+            self.routes[slot] = canonical[index]
+            self.costs[slot] = costs[index]
+            self.slots[key] = slot
+            self.keys[slot] = key
+            stored += 1
+        return stored
+
+    def best(self, count=None):
+        # (routes, costs) of the count shortest stored tours, best first.
+        order = np.argsort(self.costs[:self.count], kind="stable")[:count]
+        return self.routes[order], self.costs[order]
+
+    def consensus(self, coordinates, count=None):
+        # Wisdom of crowds tour over the count best archived experts (all by
+        # default); see crowd.consensus_tour.
+        routes, _ = self.best(count)
+        return consensus_tour(routes, coordinates)
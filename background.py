@@ -0,0 +1,77 @@
+import queue
+import threading
+import traceback
+
+
+class SolverCancelled(Exception):
+    pass
+
+
+class BackgroundSolver:
+    def __init__(self, target, *args):
+        # Runs target(*args) in a worker thread. The target reports progress
+        # with publish() and calls checkpoint() between units of work, which is
+        # where pause and cancel take effect. The GUI thread collects messages
+        # with poll() (e.g. from root.after) and never blocks on the solver.
+        # Messages are tuples: ("best", route, fitness) from publish(), then
+        # exactly one of ("done",), ("cancelled",) or ("error", exception,
+        # formatted traceback).
+        self.target = target
+        self.args = args
+        self.messages = queue.Queue()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._cancel = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        try:
+            self.target(*self.args)
+        except SolverCancelled:
+            self.messages.put(("cancelled",))
+        except Exception as exc:
+            self.messages.put(("error", exc, "".join(traceback.format_exception(exc))))
+        else:
+            self.messages.put(("done",))
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+    @property
+    def paused(self):
+        return not self._resume.is_set()
+
+    def pause(self):
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def cancel(self):
+        self._cancel.set()
+        self._resume.set()
+
+    def checkpoint(self):
+        # Called from the solver thread: blocks while paused and raises
+        # SolverCancelled once cancel() has been called.
+        self._resume.wait()
+        if self._cancel.is_set():
+            raise SolverCancelled()
+
+    def publish(self, route, fitness):
+        # Called from the solver thread with a best-so-far snapshot.
+        self.messages.put(("best", list(route), float(fitness)))
+
+    def poll(self):
+        # Called from the GUI thread: every message published since the last call.
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                return messages
@@ -0,0 +1,287 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import resource
+import sys
+import time
+
+import numpy as np
+
+from crossover import CROSSOVER_OPERATORS
+from mutation import MUTATION_OPERATORS
+from scheduler import RunScheduler
+from solver import RunConfig
+from tsplib import TSPInstance, load_instance
+
+
+# Reproducible benchmark suite. Every case is one instance x operator pair x
+# population size x worker count, run a fixed number of generations (no early
+# stopping, so the work per case is constant) in a fresh process:
+#
+#   python benchmark.py --sizes 50 200 1000 10000 --tsplib berlin52.tsp --crossover Uniform Order \
+#       --pop-sizes 100 --workers 1 4 --seed 1 --output bench.json --baseline baseline.json
+#
+# Results are compared against --baseline and regressions make the exit
+# status 1; --save-baseline writes the results as the new baseline.
+
+# Published optimal tour lengths (TSPLIB rounding) by instance NAME
+KNOWN_OPTIMA = {
+    "att48": 10628, "berlin52": 7542, "bier127": 118282, "ch130": 6110, "ch150": 6528,
+    "eil51": 426, "eil76": 538, "eil101": 629, "kroA100": 21282, "kroA150": 26524,
+    "kroA200": 29368, "lin105": 14379, "pcb442": 50778, "pr76": 108159, "pr1002": 259045,
+    "rat99": 1211, "st70": 675, "ts225": 126643, "tsp225": 3916, "a280": 2579,
+    "ulysses16": 6859, "ulysses22": 7013, "gr96": 55209, "d1291": 50801, "rl1889": 316536,
+}
+
+# Fields that identify a case when matching results against a baseline
+CASE_KEY = ("instance", "crossover", "mutation", "pop_size", "workers", "runs", "generations", "seed")
+
+
+def random_instance(size, seed=0, extent=1000.0):
+    # size cities uniform in an extent x extent square, ids 1..size, EUC_2D.
+    # The same (size, seed) always gives the same instance. The matrix is
+    # filled a block of rows at a time so building it needs no n x n temporaries.
+    rng = np.random.default_rng([seed, size])
+    city_ids = np.arange(1, size + 1, dtype=np.int32)
+    coordinates = np.zeros((size + 1, 2))
+    coordinates[1:] = rng.random((size, 2)) * extent
+    xs, ys = coordinates[:, 0], coordinates[:, 1]
+    matrix = np.empty((size + 1, size + 1))
+    for start in range(0, size + 1, 1024):
+        stop = min(start + 1024, size + 1)
+        matrix[start:stop] = np.hypot(xs[start:stop, None] - xs[None, :], ys[start:stop, None] - ys[None, :])
+    name = f"random{size}-s{seed}"
+    header = {"NAME": name, "DIMENSION": str(size), "EDGE_WEIGHT_TYPE": "EUC_2D"}
+    return TSPInstance(name, header, city_ids, coordinates, matrix)
+
+
+def instance_specs(sizes, tsplib_paths, instance_seed=0):
+    # ("random", size, seed) and ("tsplib", path) entries, built lazily in the
+    # case process so only the instance being measured is ever in memory.
+    return ([("random", size, instance_seed) for size in sizes] +
+            [("tsplib", path) for path in tsplib_paths])
+
+
+def _build_instance(spec):
+    if spec[0] == "random":
+        return random_instance(spec[1], spec[2])
+    # Published optima use TSPLIB's rounded distances
+    return load_instance(spec[1], tsplib_rounding=True)
+
+
+def _peak_process_rss_mb():
+    # Largest resident set of any single process of the case: this one or a
+    # finished child (the pool workers), from getrusage. A per-process peak,
+    # not the sum over workers, which would count the shared distance matrix
+    # once per worker. ru_maxrss is in KiB on Linux, bytes on macOS.
+    unit = 1 if sys.platform == "darwin" else 1024
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak * unit / 2 ** 20
+
+
+def run_case(spec, crossover, mutation, pop_size, workers, runs, generations, seed, repeats=5):
+    # Runs one case in this process and returns its record. The runs are
+    # repeated `repeats` times with the same seed, so every repeat does the same
+    # work, and the fastest wall time counts; slower repeats are noise from the
+    # rest of the machine. Only the runs are timed: the worker pool is up and
+    # the shared matrix mapped before the clock starts, and the pool is shut
+    # down after it stops.
+    setup_start = time.perf_counter()
+    instance = _build_instance(spec)
+    distance_matrix = instance.distance_matrix()
+    setup_time = time.perf_counter() - setup_start
+
+    config = RunConfig(crossover_method=crossover, mutation_method=mutation, pop_size=pop_size,
+                       max_generations=generations, fitness_threshold=None)
+    wall_times = []
+    for _ in range(repeats):
+        best = []
+        evaluations = 0
+        with RunScheduler(distance_matrix, workers=workers, seed=seed) as scheduler:
+            scheduler.start()
+            start_time = time.perf_counter()
+            for result in scheduler.run([config], runs):
+                best.append(result.best_fitness)
+                evaluations += result.evaluations
+            wall_times.append(time.perf_counter() - start_time)
+    wall_time = min(wall_times)
+
+    optimum = KNOWN_OPTIMA.get(instance.name)
+    best_fitness = min(best)
+    return {"instance": instance.name, "dimension": instance.dimension, "crossover": crossover,
+            "mutation": mutation, "pop_size": pop_size, "workers": workers, "runs": runs,
+            "generations": generations, "seed": seed, "setup_time": setup_time, "wall_time": wall_time,
+            "wall_times": wall_times, "evaluations": evaluations, "evals_per_second": evaluations / wall_time,
+            "peak_process_rss_mb": _peak_process_rss_mb(), "best_fitness": best_fitness,
+            "mean_fitness": float(np.mean(best)), "optimum": optimum,
+            "gap": None if optimum is None else 100.0 * (best_fitness - optimum) / optimum}
+
+
+def _case_process(queue, args):
+    try:
+        queue.put(("ok", run_case(*args)))
+    except Exception as exc:
+        queue.put(("error", repr(exc)))
+
+
+def run_isolated(*args, timeout=None):
+    # run_case in a child process of its own, so peak RSS covers this case
+    # only. The child is not a daemon, so it may start its own worker pool.
+    # Raises RuntimeError if the case fails, if the child dies without
+    # reporting (e.g. killed for running out of memory) or after timeout seconds.
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_case_process, args=(results, args))
+    process.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                status, value = results.get(timeout=1.0)
+                break
+            except queue.Empty:
+                pass
+            if process.exitcode is not None:
+                # The result is written before the child exits; look once more
+                try:
+                    status, value = results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    raise RuntimeError(f"Benchmark case {args[:5]} died with exit code {process.exitcode}")
+            if deadline is not None and time.monotonic() > deadline:
+                raise RuntimeError(f"Benchmark case {args[:5]} did not finish within {timeout} seconds")
+        process.join()
+    finally:
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    if status == "error":
+        raise RuntimeError(f"Benchmark case {args[:5]} failed: {value}")
+    return value
+
+
+def run_suite(specs, crossovers, mutations, pop_sizes, workers, runs=3, generations=200, seed=0,
+              repeats=5, isolate=True, case_timeout=None, progress=None):
+    # Every combination of the given lists, in a fixed order. Returns
+    # (records, failures); a failed isolated case is recorded in failures as
+    # its arguments and error message and the suite goes on. progress, if
+    # given, is called with each record as it is finished.
+    records = []
+    failures = []
+    for spec, crossover, mutation, pop_size, worker_count in itertools.product(
+            specs, crossovers, mutations, pop_sizes, workers):
+        args = (spec, crossover, mutation, pop_size, worker_count, runs, generations, seed, repeats)
+        if not isolate:
+            record = run_case(*args)
+        else:
+            try:
+                record = run_isolated(*args, timeout=case_timeout)
+            except RuntimeError as exc:
+                failures.append({"case": list(args), "error": str(exc)})
+                continue
+        records.append(record)
+        if progress is not None:
+            progress(record)
+    return records, failures
+
+
+def compare(records, baseline, time_tolerance=0.10, memory_tolerance=0.10, quality_tolerance=0.0,
+            time_floor=0.1):
+    # Matches records to the baseline's by CASE_KEY and returns one entry per
+    # regression: wall time or peak RSS up, evaluations per second down, by more
+    # than the relative tolerance, or a worse best tour. A slowdown must also
+    # cost more than time_floor seconds, so short cases do not flag timer
+    # noise. With the same seed a run is deterministic, so quality_tolerance=0
+    # catches any change in the search itself. Cases missing from the baseline
+    # are skipped.
+    previous = {tuple(record[name] for name in CASE_KEY): record for record in baseline}
+    regressions = []
+    for record in records:
+        base = previous.get(tuple(record[name] for name in CASE_KEY))
+        if base is None:
+            continue
+        # The time this case's evaluations would have taken at the baseline rate
+        expected_time = record["evaluations"] / base["evals_per_second"]
+        checks = (("wall_time", record["wall_time"] > base["wall_time"] * (1 + time_tolerance) + time_floor),
+                  ("evals_per_second", record["wall_time"] > expected_time * (1 + time_tolerance) + time_floor),
+                  ("peak_process_rss_mb",
+                   record["peak_process_rss_mb"] > base["peak_process_rss_mb"] * (1 + memory_tolerance)),
+                  ("best_fitness", record["best_fitness"] > base["best_fitness"] * (1 + quality_tolerance)))
+        for metric, regressed in checks:
+            if regressed:
+                regressions.append({"case": {name: record[name] for name in CASE_KEY}, "metric": metric,
+                                    "baseline": base[metric], "current": record[metric]})
+    return regressions
+
+
+def format_record(record):
+    gap = "" if record["gap"] is None else f", gap {record['gap']:.2f}%"
+    return (f"{record['instance']} {record['crossover']} + {record['mutation']} pop {record['pop_size']} "
+            f"workers {record['workers']}: {record['wall_time']:.2f} s, "
+            f"{record['evals_per_second']:.0f} evals/s, {record['peak_process_rss_mb']:.0f} MiB peak process, "
+            f"best {record['best_fitness']:.2f}{gap}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the TSP genetic algorithm.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[50, 200, 1000, 10000],
+                        help="random instance sizes (cities)")
+    parser.add_argument("--tsplib", nargs="*", default=[], help="TSPLIB .tsp files")
+    parser.add_argument("--instance-seed", type=int, default=0, help="seed for the random instances")
+    parser.add_argument("--crossover", nargs="+", default=["Uniform"], choices=sorted(CROSSOVER_OPERATORS))
+    parser.add_argument("--mutation", nargs="+", default=["Swap"], choices=sorted(MUTATION_OPERATORS))
+    parser.add_argument("--pop-sizes", type=int, nargs="+", default=[100])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--runs", type=int, default=3, help="GA runs per case")
+    parser.add_argument("--generations", type=int, default=200, help="generations per run")
+    parser.add_argument("--seed", type=int, default=0, help="master seed of every case's runs")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="times each case is timed; the fastest counts")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="run the cases in this process (peak RSS then only grows)")
+    parser.add_argument("--case-timeout", type=float, default=None,
+                        help="seconds before an isolated case is stopped and reported as failed")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this path")
+    parser.add_argument("--baseline", default=None, help="results JSON to compare against")
+    parser.add_argument("--save-baseline", default=None, help="write the results as a baseline to this path")
+    parser.add_argument("--time-tolerance", type=float, default=0.10,
+                        help="relative slowdown tolerated before flagging a regression")
+    parser.add_argument("--time-floor", type=float, default=0.1,
+                        help="seconds a slowdown must also exceed before it is flagged")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10,
+                        help="relative peak process RSS growth tolerated before flagging a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    specs = instance_specs(args.sizes, args.tsplib, args.instance_seed)
+    records, failures = run_suite(specs, args.crossover, args.mutation, args.pop_sizes, args.workers, args.runs,
+                                  args.generations, args.seed, args.repeats, isolate=not args.no_isolate,
+                                  case_timeout=args.case_timeout,
+                                  progress=lambda record: print(format_record(record)))
+    for failure in failures:
+        print(f"FAILED {failure['error']}")
+    results = {"cpu_count": os.cpu_count(), "records": records, "failures": failures}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["records"]
+        results["regressions"] = compare(records, baseline, args.time_tolerance, args.memory_tolerance,
+                                         time_floor=args.time_floor)
+        for regression in results["regressions"]:
+            case = regression["case"]
+            print(f"REGRESSION {case['instance']} {case['crossover']} + {case['mutation']} "
+                  f"pop {case['pop_size']} workers {case['workers']}: {regression['metric']} "
+                  f"{regression['baseline']:.7g} -> {regression['current']:.7g}")
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as file:
+                json.dump(results, file, indent=2)
+    return 1 if results.get("regressions") or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
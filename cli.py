@@ -0,0 +1,146 @@
+import argparse
+import json
+import time
+
+import numpy as np
+
+from crossover import CROSSOVER_OPERATORS
+from mutation import MUTATION_OPERATORS
+from scheduler import RunScheduler
+from selection import SELECTION_STRATEGIES
+from profiling import PhaseProfiler
+from replacement import REPLACEMENT_MODES
+from solver import SEED_METHODS, RunConfig
+from telemetry import VERBOSITY_LEVELS, Reporter, TelemetryWriter
+from tsplib import load_instance
+
+
+# Headless entry point for batch runs. Imports neither tkinter nor matplotlib:
+#
+#   python cli.py Random222.tsp --crossover Cycle Uniform --mutation Swap Scramble \
+#       --runs 100 --generations 1000 --seed 1 --workers 8 --output results.json \
+#       --telemetry generations.jsonl --profile -vv
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the TSP genetic algorithm without a display.")
+    parser.add_argument("instance", help="TSPLIB .tsp file")
+    parser.add_argument("--crossover", nargs="+", default=["Cycle", "Uniform"],
+                        choices=sorted(CROSSOVER_OPERATORS), help="crossover operators to run")
+    parser.add_argument("--mutation", nargs="+", default=["Swap", "Scramble"],
+                        choices=sorted(MUTATION_OPERATORS), help="mutation operators to run")
+    parser.add_argument("--selection", default="roulette", choices=SELECTION_STRATEGIES)
+    parser.add_argument("--runs", type=int, default=100, help="independent runs per combination")
+    parser.add_argument("--generations", type=int, default=1000, help="maximum generations per run")
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--mutation-rate", type=float, default=0.2)
+    parser.add_argument("--replacement", default="generational", choices=REPLACEMENT_MODES)
+    parser.add_argument("--elitism", type=int, default=0, help="best routes kept unchanged each generation")
+    parser.add_argument("--steady-state-size", type=int, default=2, help="children per steady-state round")
+    parser.add_argument("--seed-fraction", type=float, default=0.0,
+                        help="share of each initial population built as nearest neighbour tours")
+    parser.add_argument("--seed-method", default="nearest", choices=SEED_METHODS,
+                        help="with greedy the first seeded tour is a greedy edge tour")
+    parser.add_argument("--fitness-threshold", type=float, default=None,
+                        help="stop a run once its best tour is this short")
+    parser.add_argument("--stall", type=int, default=None,
+                        help="stop a run after this many generations without improvement")
+    parser.add_argument("--time-limit", type=float, default=None, help="wall-clock budget per run in seconds")
+    parser.add_argument("--max-evaluations", type=int, default=None, help="tour evaluation budget per run")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the whole sweep")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--no-cache", action="store_true", help="do not read or write the instance cache")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this path")
+    parser.add_argument("--telemetry", default=None,
+                        help="write per-generation statistics to this .jsonl (or .parquet, needs pyarrow) file")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every phase and print a breakdown per combination and for the sweep")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="print a summary (-v), every run (-vv) or more (-vvv)")
+    return parser.parse_args(argv)
+
+
+def run(args):
+    # Returns the JSON-serialisable results of the sweep described by args.
+    instance = load_instance(args.instance, cache=not args.no_cache)
+    distance_matrix = instance.distance_matrix()
+    configs = [RunConfig(crossover_method=crossover, mutation_method=mutation, pop_size=args.pop_size,
+                         max_generations=args.generations, mutation_rate=args.mutation_rate,
+                         fitness_threshold=args.fitness_threshold, selection=args.selection,
+                         stall_generations=args.stall, time_limit=args.time_limit,
+                         max_evaluations=args.max_evaluations, elitism=args.elitism,
+                         replacement=args.replacement, steady_state_size=args.steady_state_size,
+                         seed_fraction=args.seed_fraction, seed_method=args.seed_method,
+                         telemetry=args.telemetry is not None, profile=args.profile)
+               for crossover in args.crossover for mutation in args.mutation]
+    combos = [{"crossover": config.crossover_method, "mutation": config.mutation_method, "runs": []}
+              for config in configs]
+    best = [None] * len(configs)
+    profiles = [PhaseProfiler() for _ in configs] if args.profile else None
+    report = Reporter(VERBOSITY_LEVELS[min(args.verbose, len(VERBOSITY_LEVELS) - 1)])
+    writer = TelemetryWriter(args.telemetry) if args.telemetry else None
+
+    start_time = time.perf_counter()
+    with RunScheduler(distance_matrix, workers=args.workers, seed=args.seed) as scheduler:
+        # Without --seed the scheduler picks one; record it so the sweep can be repeated
+        seed = scheduler.seed
+        for result in scheduler.run(configs, args.runs):
+            combo = combos[result.config_index]
+            combo["runs"].append({"run": result.run_index, "spawn_key": list(result.seed.spawn_key),
+                                  "best_fitness": result.best_fitness, "elapsed": result.elapsed,
+                                  "generations": result.generations, "evaluations": result.evaluations,
+                                  "stop_reason": result.stop_reason})
+            if profiles is not None:
+                combo["runs"][-1]["profile"] = result.profile
+                profiles[result.config_index].merge(result.profile)
+                if report.enabled("runs"):
+                    print(PhaseProfiler().merge(result.profile).table(
+                        f"{combo['crossover']} + {combo['mutation']} run {result.run_index}"))
+            if writer is not None:
+                writer.write(result.telemetry, crossover=combo["crossover"], mutation=combo["mutation"],
+                             run_index=result.run_index)
+            if best[result.config_index] is None or result.best_fitness < best[result.config_index].best_fitness:
+                best[result.config_index] = result
+            report("runs", f"{combo['crossover']} + {combo['mutation']} run {result.run_index}: "
+                           f"{result.best_fitness:.2f} ({result.generations} generations, {result.elapsed:.2f} s, "
+                           f"stopped by {result.stop_reason})")
+    if writer is not None:
+        writer.close()
+
+    for combo, result in zip(combos, best):
+        combo["runs"].sort(key=lambda record: record["run"])
+        fitness = np.array([record["best_fitness"] for record in combo["runs"]])
+        combo.update(mean_fitness=float(fitness.mean()), min_fitness=float(fitness.min()),
+                     max_fitness=float(fitness.max()), std_deviation=float(fitness.std()),
+                     best_route=result.best_route)
+        report("summary", f"{combo['crossover']} + {combo['mutation']}: mean {combo['mean_fitness']:.2f}, "
+                          f"min {combo['min_fitness']:.2f}, max {combo['max_fitness']:.2f}, "
+                          f"std {combo['std_deviation']:.2f}")
+
+    summary = {}
+    if profiles is not None:
+        # Per phase [calls, nanoseconds] for each combination and the whole sweep
+        sweep = PhaseProfiler()
+        for combo, profiler in zip(combos, profiles):
+            combo["profile"] = profiler.summary()
+            print(profiler.table(f"Phase breakdown for {combo['crossover']} + {combo['mutation']}"))
+            sweep.merge(profiler)
+        print(sweep.table("Phase breakdown for the whole sweep"))
+        summary["profile"] = sweep.summary()
+
+    return {"instance": instance.name, "dimension": instance.dimension, "seed": seed,
+            "generations": args.generations, "pop_size": args.pop_size,
+            "elapsed": time.perf_counter() - start_time, "combinations": combos, **summary}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import numpy as np
+
+from repair import batch_repair, repair_route
+
+
+# All operators take two parent routes (1-D int arrays of city ids) and a NumPy
+# Generator, and return two child routes that are valid permutations of the
+# parents' cities. Position lookups use arrays indexed by city id, so every
+# operator runs in O(n).
+
+
+def _lookup_size(*routes):
+    return int(max(route.max() for route in routes)) + 1
+
+
+def _random_segment(length, rng):
+    start, end = sorted(rng.integers(0, length, 2))
+    return int(start), int(end)
+
+
+def uniform_crossover(parent1, parent2, rng):
+    # Each position is inherited from either parent with 50% chance, then
+    # duplicates are repaired so both children are complete tours.
+    mask = rng.random(len(parent1)) < 0.5
+    child1 = np.where(mask, parent1, parent2)
+    child2 = np.where(mask, parent2, parent1)
+    cities = np.sort(parent1)
+    return repair_route(child1, cities), repair_route(child2, cities)
+
+
+def _order_child(parent1, parent2, start, end, size):
+    # Keeps parent1[start:end + 1] in place and fills the remaining positions,
+    # starting after the segment, with the other cities in parent2's order.
+    length = len(parent1)
+    child = np.empty_like(parent1)
+    child[start:end + 1] = parent1[start:end + 1]
+    in_segment = np.zeros(size, dtype=bool)
+    in_segment[parent1[start:end + 1]] = True
+    order = np.roll(parent2, -(end + 1))
+    fill = order[~in_segment[order]]
+    child[(end + 1 + np.arange(len(fill))) % length] = fill
+    return child
+
+
+def order_crossover(parent1, parent2, rng):
+    # OX: one random segment, each child keeps it from one parent.
+    size = _lookup_size(parent1, parent2)
+    start, end = _random_segment(len(parent1), rng)
+    return (_order_child(parent1, parent2, start, end, size),
+            _order_child(parent2, parent1, start, end, size))
+
+
+def _pmx_child(parent1, parent2, start, end, size):
+    # Copies parent1's segment, then places parent2's cities outside it,
+    # following the segment mapping for cities already used. Each mapping chain
+    # is resolved once and cached, so the whole child is linear time.
+    child = parent2.copy()
+    child[start:end + 1] = parent1[start:end + 1]
+    mapping = np.full(size, -1, dtype=np.int64)
+    mapping[parent1[start:end + 1]] = parent2[start:end + 1]
+    resolved = {}
+    for i in range(len(parent1)):
+        if start <= i <= end:
+            continue
+        city = int(child[i])
+        if mapping[city] < 0:
+            continue
+        chain = []
+        while mapping[city] >= 0 and city not in resolved:
+            chain.append(city)
+            city = int(mapping[city])
+        final = resolved.get(city, city)
+        for link in chain:
+            resolved[link] = final
+        child[i] = final
+    return child
+
+
+def partially_mapped_crossover(parent1, parent2, rng):
+    # PMX: one random segment, each child keeps it from one parent.
+    size = _lookup_size(parent1, parent2)
+    start, end = _random_segment(len(parent1), rng)
+    return (_pmx_child(parent1, parent2, start, end, size),
+            _pmx_child(parent2, parent1, start, end, size))
+
+
+def _cycle_children(parent1, parent2, size):
+    # Splits the positions into cycles (follow parent2's city back to its
+    # position in parent1 until the start is reached). Child1 takes even
+    # numbered cycles from parent1 and odd ones from parent2, child2 the
+    # opposite. Every position is visited once, so this is linear time.
+    length = len(parent1)
+    position = np.empty(size, dtype=np.int64)
+    position[parent1] = np.arange(length)
+    from_first = np.zeros(length, dtype=bool)
+    visited = np.zeros(length, dtype=bool)
+    cycle = 0
+    for start in range(length):
+        if visited[start]:
+            continue
+        index = start
+        while not visited[index]:
+            visited[index] = True
+            from_first[index] = cycle % 2 == 0
+            index = position[parent2[index]]
+        cycle += 1
+    return np.where(from_first, parent1, parent2), np.where(from_first, parent2, parent1)
+
+
+def cycle_crossover(parent1, parent2, rng):
+    # CX: every city keeps the position it had in one of the parents. The
+    # operator is deterministic; rng is accepted for a uniform signature.
+    return _cycle_children(parent1, parent2, _lookup_size(parent1, parent2))
+
+
+def _edge_child(parent1, parent2, rng, size):
+    # Builds the union edge table (at most four neighbours per city), then walks
+    # from parent1's first city, always moving to the neighbour with the fewest
+    # remaining neighbours. Dead ends jump to a random unvisited city, taken from
+    # a swap-remove pool so that step is O(1) too.
+    length = len(parent1)
+    neighbours = np.empty((size, 4), dtype=np.int64)
+    for slot, parent in enumerate((parent1, parent2)):
+        neighbours[parent, 2 * slot] = np.roll(parent, 1)
+        neighbours[parent, 2 * slot + 1] = np.roll(parent, -1)
+    table = {int(city): set(neighbours[city].tolist()) for city in parent1}
+
+    pool = parent1.tolist()
+    pool_index = {city: i for i, city in enumerate(pool)}
+    child = np.empty_like(parent1)
+    city = pool[0]
+    for i in range(length):
+        child[i] = city
+        last = pool.pop()
+        if last != city:
+            pool[pool_index[city]] = last
+            pool_index[last] = pool_index[city]
+        del pool_index[city]
+        candidates = table.pop(city)
+        for neighbour in candidates:
+            table[neighbour].discard(city)
+        if not pool:
+            break
+        if candidates:
+            fewest = min(len(table[c]) for c in candidates)
+            best = [c for c in candidates if len(table[c]) == fewest]
+            city = best[int(rng.integers(len(best)))] if len(best) > 1 else best[0]
+        else:
+            city = pool[int(rng.integers(len(pool)))]
+    return child
+
+
+def edge_recombination_crossover(parent1, parent2, rng):
+    # ERX: children inherit as many parental edges as possible.
+    size = _lookup_size(parent1, parent2)
+    return _edge_child(parent1, parent2, rng, size), _edge_child(parent2, parent1, rng, size)
+
+
+def batch_uniform_crossover(first, second, out, rng):
+    pairs, length = first.shape
+    mask = rng.random((pairs, length)) < 0.5
+    size = _lookup_size(first, second)
+    cities = np.sort(first[0])
+    np.copyto(out[0:2 * pairs:2], np.where(mask, first, second))
+    np.copyto(out[1:2 * pairs:2], np.where(mask, second, first))
+    batch_repair(out[0:2 * pairs:2], cities, size)
+    batch_repair(out[1:2 * pairs:2], cities, size)
+
+
+def _batch_order_children(keep, order_from, starts, ends, out, size):
+    # Vectorised _order_child over all pairs.
+    pairs, length = keep.shape
+    row_ids = np.arange(pairs)[:, None]
+    position = np.empty((pairs, size), dtype=np.int64)
+    position[row_ids, keep] = np.arange(length)
+    in_segment = (position >= starts[:, None]) & (position <= ends[:, None])
+    shift = (ends[:, None] + 1 + np.arange(length)) % length
+    order = np.take_along_axis(order_from, shift, axis=1)
+    outside = ~in_segment[row_ids, order]
+    # Stable sort moves the cities outside the segment to the front, in order
+    fill = np.take_along_axis(order, np.argsort(~outside, axis=1, kind="stable"), axis=1)
+    fill_count = length - (ends - starts + 1)
+    fill_mask = np.arange(length) < fill_count[:, None]
+    np.copyto(out, keep)
+    out[np.broadcast_to(row_ids, shift.shape)[fill_mask], shift[fill_mask]] = fill[fill_mask]
+
+
+def batch_order_crossover(first, second, out, rng):
+    pairs, length = first.shape
+    segments = np.sort(rng.integers(0, length, (pairs, 2)), axis=1)
+    size = _lookup_size(first, second)
+    _batch_order_children(first, second, segments[:, 0], segments[:, 1], out[0:2 * pairs:2], size)
+    _batch_order_children(second, first, segments[:, 0], segments[:, 1], out[1:2 * pairs:2], size)
+
+
+CROSSOVER_OPERATORS = {
+    "Uniform": uniform_crossover,
+    "Cycle": cycle_crossover,
+    "Order": order_crossover,
+    "PMX": partially_mapped_crossover,
+    "Edge": edge_recombination_crossover,
+}
+
+# Operators with a kernel that handles every pair of a generation in one pass
+BATCH_CROSSOVER_OPERATORS = {
+    "Uniform": batch_uniform_crossover,
+    "Order": batch_order_crossover,
+}
+
+
+def batch_crossover(method, routes, parents, out, rng):
+    # Mates parents[0] with parents[1], parents[2] with parents[3], ... and writes
+    # the two children of each pair into the matching rows of out. An odd last
+    # parent is copied through unchanged.
+    if method not in CROSSOVER_OPERATORS:
+        raise ValueError(f"Unknown crossover method: {method}")
+    pairs = len(parents) // 2
+    first = routes[parents[0:2 * pairs:2]]
+    second = routes[parents[1:2 * pairs:2]]
+    if method in BATCH_CROSSOVER_OPERATORS:
+        BATCH_CROSSOVER_OPERATORS[method](first, second, out, rng)
+    else:
+        operator = CROSSOVER_OPERATORS[method]
+        for i in range(pairs):
+            out[2 * i], out[2 * i + 1] = operator(first[i], second[i], rng)
+    if len(parents) % 2:
+        out[len(parents) - 1] = routes[parents[-1]]
+    return out
@@ -0,0 +1,53 @@
+import numpy as np
+
+from construction import _chain_fragments, _greedy_fragments
+
+
+# Wisdom of crowds aggregation: count how many expert tours use each edge and
+# build one consensus tour from the most agreed-on edges. Edges are kept as a
+# sparse list (one entry per distinct edge) so memory grows with the number of
+# distinct edges, not with n^2.
+
+
+def edge_frequencies(routes):
+    # routes is a (experts x n) array of closed tours over the same cities, in
+    # city ids. Returns (first, second, counts): every undirected edge used by
+    # at least one expert, with first < second, and how many experts use it.
+    routes = np.asarray(routes)
+    following = np.roll(routes, -1, axis=1)
+    low = np.minimum(routes, following).ravel().astype(np.int64)
+    high = np.maximum(routes, following).ravel().astype(np.int64)
+    size = int(high.max()) + 1
+    keys, counts = np.unique(low * size + high, return_counts=True)
+    return keys // size, keys % size, counts
+
+
+def edge_frequency_matrix(routes):
+    # Dense (max_id + 1) square version of edge_frequencies, indexed by city id.
+    first, second, counts = edge_frequencies(routes)
+    size = int(np.asarray(routes).max()) + 1
+    matrix = np.zeros((size, size), dtype=np.int32)
+    matrix[first, second] = counts
+    matrix[second, first] = counts
+    return matrix
+
+
+def consensus_tour(routes, coordinates):
+    # coordinates is indexed by city id, as DistanceMatrix.coordinates is.
+    # Edges are taken greedily by agreement (ties: shorter first) as long as the
+    # tour stays a set of paths; the paths are then chained nearest endpoint
+    # first. The result is always a complete tour, one city per position.
+    routes = np.asarray(routes)
+    city_ids = np.sort(routes[0])
+    n = len(city_ids)
+    if n < 3:
+        return city_ids.tolist()
+    first, second, counts = edge_frequencies(routes)
+    lengths = ((coordinates[first] - coordinates[second]) ** 2).sum(axis=1)
+    by_agreement = np.lexsort((lengths, -counts))
+    # Compact indices for the matching, city ids again at the end
+    compact = np.zeros(int(city_ids[-1]) + 1, dtype=np.int64)
+    compact[city_ids] = np.arange(n)
+    adjacent, degree = _greedy_fragments(n, compact[first[by_agreement]], compact[second[by_agreement]])
+    order = _chain_fragments(coordinates[city_ids], adjacent, degree)
+    return city_ids[order].tolist()
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class DistanceMatrix:
+    def __init__(self, city_data):
+        # Builds the full city to city distance table once from {city_id: (x, y)}.
+        # Rows and columns are indexed directly by city id, so a route (or a 2-D
+        # array of routes) can be used as gather indices without any translation.
+        self.city_ids = np.array(sorted(city_data), dtype=np.int32)
+        size = int(self.city_ids[-1]) + 1
+        self.coordinates = np.zeros((size, 2))
+        for city_id, (x, y) in city_data.items():
+            self.coordinates[city_id] = (x, y)
+        xs = self.coordinates[:, 0]
+        ys = self.coordinates[:, 1]
+        self.matrix = np.hypot(xs[:, None] - xs[None, :], ys[:, None] - ys[None, :])
+
+    @classmethod
+    def from_arrays(cls, city_ids, coordinates, matrix):
+        # Wraps existing arrays (e.g. views onto shared memory) without recomputing.
+        distance_matrix = cls.__new__(cls)
+        distance_matrix.city_ids = city_ids
+        distance_matrix.coordinates = coordinates
+        distance_matrix.matrix = matrix
+        return distance_matrix
+
+    def __len__(self):
+        return len(self.city_ids)
+
+    def distance(self, city1, city2):
+        return float(self.matrix[city1, city2])
+
+    def tour_length(self, route):
+        # Total length of one closed tour, including the edge back to the start.
+        route = np.asarray(route)
+        return float(self.matrix[route, np.roll(route, -1)].sum())
+
+    def evaluate_routes(self, routes, out=None):
+        # Scores every row of a (pop_size x n) route array in one gather and sum.
+        routes = np.asarray(routes)
+        lengths = self.matrix[routes[:, :-1], routes[:, 1:]].sum(axis=1, out=out)
+        lengths += self.matrix[routes[:, -1], routes[:, 0]]
+        return lengths
+
+    def evaluate_population(self, population):
+        # Batch replacement for calling calculate_fitness on every individual.
+        routes = np.array([individual.route for individual in population.individuals])
+        lengths = self.evaluate_routes(routes)
+        for individual, length in zip(population.individuals, lengths):
+            individual.fitness = float(length)
+        return lengths
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from archive import canonical_routes, route_keys
+
+
+class FitnessCache:
+    def __init__(self, distance_matrix, capacity=100000):
+        # LRU memo of tour lengths keyed by route_keys() of the canonical tour, so
+        # a rotation or reversal of a tour already scored is a hit. Has the same
+        # evaluate_routes() as DistanceMatrix and can be passed to
+        # RoutePopulation.evaluate() in its place.
+        self.distance_matrix = distance_matrix
+        self.capacity = capacity
+        self.lengths = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.lengths)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _remember(self, key, length):
+        self.lengths[key] = length
+        if len(self.lengths) > self.capacity:
+            self.lengths.popitem(last=False)
+
+    def store(self, routes, lengths):
+        # Records tours that were scored elsewhere (e.g. in a worker process).
+        for key, length in zip(route_keys(canonical_routes(routes)), np.atleast_1d(lengths).tolist()):
+            self._remember(key, length)
+
+    def evaluate_routes(self, routes, out=None):
+        # Tour lengths of every row. Only rows not in the cache are scored, in
+        # one batch, and a route repeated within the batch is scored once.
+        routes = np.atleast_2d(routes)
+        lengths = np.empty(len(routes)) if out is None else out
+        keys = route_keys(canonical_routes(routes))
+        missing = {}
+        for row, key in enumerate(keys):
+            length = self.lengths.get(key)
+            if length is None:
+                missing.setdefault(key, []).append(row)
+            else:
+                self.lengths.move_to_end(key)
+                lengths[row] = length
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            scored = self.distance_matrix.evaluate_routes(routes[first_rows]).tolist()
+            for (key, rows), length in zip(missing.items(), scored):
+                lengths[rows] = length
+                self._remember(key, length)
+        return lengths
+
+    def tour_length(self, route):
+        # One tour; a closed route (first city repeated at the end) counts the
+        # same as the open one.
+        route = np.asarray(route)
+        if len(route) > 1 and route[0] == route[-1]:
+            route = route[:-1]
+        return float(self.evaluate_routes(route[None, :])[0])
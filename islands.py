@@ -0,0 +1,179 @@
+import multiprocessing
+import os
+import queue
+import time
+
+import numpy as np
+
+from distances import DistanceMatrix
+from rngs import RandomStreams, generator
+from scheduler import SharedArray, _attach
+from solver import GeneticAlgorithm
+from termination import Termination
+
+
+MIGRATION_TOPOLOGIES = ("ring", "full")
+
+
+class IslandConfig:
+    def __init__(self, islands=None, migration_interval=10, migrants=2, topology="ring"):
+        # islands            - number of subpopulations, one process each (None = one per core)
+        # migration_interval - generations between migrations
+        # migrants           - elite routes each island sends per migration
+        # topology           - "ring" sends to the next island, "full" to every other island
+        if topology not in MIGRATION_TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+        self.islands = islands or os.cpu_count() or 1
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+
+    def targets(self, island):
+        if self.islands == 1:
+            return []
+        if self.topology == "ring":
+            return [(island + 1) % self.islands]
+        return [other for other in range(self.islands) if other != island]
+
+    def sources(self, island):
+        # Islands that send migrants to island
+        if self.islands == 1:
+            return []
+        if self.topology == "ring":
+            return [(island - 1) % self.islands]
+        return [other for other in range(self.islands) if other != island]
+
+
+class IslandResult:
+    def __init__(self, island_curves, best_routes, best_fitness):
+        # island_curves[k, g] is the best tour length found on island k up to
+        # generation g; best_routes are those tours, one per island
+        self.island_curves = island_curves
+        self.global_curve = island_curves.min(axis=0)
+        best = int(np.argmin(best_fitness))
+        self.best_island = best
+        self.best_route = best_routes[best]
+        self.best_fitness = float(best_fitness[best])
+
+
+def _receive_migrants(population, inbox, sources, generation, pending, finished):
+    # Waits for the migrants each still running source island sent at this
+    # generation and applies them in source order, so the exchange (and with it
+    # the run) does not depend on process timing. Messages that arrive early,
+    # for a later migration, wait in pending; a source that stopped sends None,
+    # after which it is no longer waited for.
+    arrived = {}
+    while True:
+        for source in sources:
+            if (source, generation) in pending:
+                arrived[source] = pending.pop((source, generation))
+        if all(source in arrived or source in finished for source in sources):
+            break
+        source, sent_generation, message = inbox.get()
+        if message is None:
+            finished.add(source)
+        else:
+            pending[(source, sent_generation)] = message
+    # Immigrants replace the worst individuals; they arrive already scored.
+    for source in sorted(arrived):
+        routes, fitness = arrived[source]
+        worst = np.argsort(population.fitness, kind="stable")[-len(fitness):]
+        population.routes[worst] = routes
+        population.fitness[worst] = fitness
+        population.dirty[worst] = False
+
+
+def _island_worker(island, config, island_config, specs, inboxes, results, seed):
+    attached = [_attach(spec) for spec in specs]
+    city_ids, coordinates, matrix = (array for _, array in attached)
+    distance_matrix = DistanceMatrix.from_arrays(city_ids, coordinates, matrix)
+    ga = GeneticAlgorithm(config, city_ids.tolist(), distance_matrix, generator(seed))
+    population = ga.population
+    targets = island_config.targets(island)
+    sources = island_config.sources(island)
+    pending = {}
+    finished = set()
+    curve = np.empty(config.max_generations)
+    termination = Termination.from_config(config)
+    population.evaluate(ga.evaluator)
+    termination.record(population)
+
+    for generation in range(config.max_generations):
+        ga.step()
+        population.evaluate(ga.evaluator)
+        if targets and (generation + 1) % island_config.migration_interval == 0:
+            elite = np.argsort(population.fitness)[:island_config.migrants]
+            message = (island, generation, (population.routes[elite].copy(), population.fitness[elite].copy()))
+            for target in targets:
+                inboxes[target].put(message)
+            _receive_migrants(population, inboxes[island], sources, generation, pending, finished)
+        stop = termination.update(population)
+        # Best so far, not the current minimum, which can rise without elitism
+        curve[generation] = termination.best_fitness
+        if stop:
+            # A converged island stops early; its curve stays flat from here on
+            curve[generation + 1:] = curve[generation]
+            break
+    # Islands still running must not wait for migrants from this one
+    for target in targets:
+        inboxes[target].put((island, generation, None))
+
+    results.put((island, curve, termination.best_route.tolist(), termination.best_fitness))
+    # Read the inbox empty, up to every source's end marker. A source can only
+    # exit once everything it sent has been written to the pipe, so a message
+    # left unread here could keep it (and with it the whole run) waiting.
+    inbox = inboxes[island]
+    while not finished.issuperset(sources):
+        source, _, message = inbox.get()
+        if message is None:
+            finished.add(source)
+    for memory, _ in attached:
+        memory.close()
+
+
+def run_islands(config, distance_matrix, island_config=None, seed=None, timeout=None):
+    # Island model: island_config.islands subpopulations of config.pop_size each,
+    # every one running GeneticAlgorithm.step() in its own process for
+    # up to config.max_generations generations (an island stops on its own once
+    # its Termination criteria are met) and exchanging elite routes through
+    # queues every migration_interval generations. Every island draws from its
+    # own stream under seed and migration is synchronous, so a seeded run is
+    # reproducible. timeout (seconds, None for no limit) bounds the whole run.
+    island_config = island_config or IslandConfig()
+    streams = RandomStreams(seed)
+    seeds = [streams.island(island) for island in range(island_config.islands)]
+    shared = [SharedArray(array) for array in (distance_matrix.city_ids, distance_matrix.coordinates,
+                                               distance_matrix.matrix)]
+    specs = [array.spec() for array in shared]
+    context = multiprocessing.get_context()
+    inboxes = [context.Queue() for _ in range(island_config.islands)]
+    results = context.Queue()
+    processes = [context.Process(target=_island_worker,
+                                 args=(island, config, island_config, specs, inboxes, results, seeds[island]))
+                 for island in range(island_config.islands)]
+    try:
+        for process in processes:
+            process.start()
+        collected = []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(collected) < len(processes):
+            try:
+                collected.append(results.get(timeout=1.0))
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise RuntimeError("An island process exited unexpectedly")
+                if deadline is not None and time.monotonic() > deadline:
+                    raise RuntimeError(f"Island run did not finish within {timeout} seconds")
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for array in shared:
+            array.close()
+
+    collected.sort(key=lambda item: item[0])
+    curves = np.array([curve for _, curve, _, _ in collected])
+    return IslandResult(curves, [route for _, _, route, _ in collected],
+                        np.array([fitness for _, _, _, fitness in collected]))
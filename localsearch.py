@@ -0,0 +1,183 @@
+from collections import deque
+
+import numpy as np
+
+
+def nearest_neighbor_lists(distance_matrix, k=10, chunk_size=1024):
+    # neighbors[city] = the k closest other cities, nearest first. Rows are
+    # indexed by city id like the distance matrix; computed in row chunks so the
+    # temporary stays small on large instances.
+    city_ids = distance_matrix.city_ids
+    k = min(k, len(city_ids) - 1)
+    neighbors = np.zeros((len(distance_matrix.matrix), k), dtype=np.int32)
+    for start in range(0, len(city_ids), chunk_size):
+        rows = city_ids[start:start + chunk_size]
+        distances = distance_matrix.matrix[rows][:, city_ids]
+        distances[np.arange(len(rows)), np.arange(start, start + len(rows))] = np.inf
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1)
+        neighbors[rows] = city_ids[np.take_along_axis(nearest, order, axis=1)]
+    return neighbors
+
+
+class LocalSearch:
+    def __init__(self, distance_matrix, neighbors=10, or_opt_max=3, neighbor_lists=None):
+        # 2-opt and Or-opt restricted to each city's nearest neighbours, driven by
+        # a queue of cities whose don't-look bit is off. A pass costs roughly
+        # O(n * neighbors) instead of O(n^2).
+        self.distance_matrix = distance_matrix
+        if neighbor_lists is None:
+            neighbor_lists = nearest_neighbor_lists(distance_matrix, neighbors)
+        self.neighbors = neighbor_lists.tolist()
+        self.or_opt_max = or_opt_max
+
+    def improve(self, route, active=None):
+        # Returns an improved copy of route and the change in tour length (<= 0).
+        # A closed route (first city repeated at the end, as produced by
+        # complete_tsp_solution) is returned closed. active limits the cities
+        # whose don't-look bit starts off, e.g. the ends of mutated segments.
+        route = list(route)
+        closed = len(route) > 1 and route[0] == route[-1]
+        if closed:
+            route.pop()
+        tour = _Tour(route, len(self.distance_matrix.matrix))
+        gain = self._optimize(tour, route if active is None else active)
+        improved = tour.route
+        if closed:
+            improved.append(improved[0])
+        return improved, -gain
+
+    def improve_population(self, population, rows):
+        # Applies improve() to the given (already scored) rows of a RoutePopulation
+        # in place, keeping their cached fitness valid.
+        for index in rows:
+            improved, delta = self.improve(population.routes[index].tolist())
+            if delta < 0:
+                population.routes[index] = improved
+                population.fitness[index] += delta
+
+    def _optimize(self, tour, active):
+        dist = self.distance_matrix.matrix.item
+        neighbors = self.neighbors
+        queue = deque(active)
+        queued = set(queue)
+        total_gain = 0.0
+        while queue:
+            a = queue.popleft()
+            queued.discard(a)
+            touched = self._two_opt_city(tour, a, dist, neighbors)
+            if touched is None:
+                touched = self._or_opt_city(tour, a, dist, neighbors)
+            if touched is None:
+                continue
+            gain, cities = touched
+            total_gain += gain
+            for city in cities:
+                if city not in queued:
+                    queue.append(city)
+                    queued.add(city)
+        return total_gain
+
+    def _two_opt_city(self, tour, a, dist, neighbors):
+        # First improving 2-opt move that adds an edge from a to a near neighbour.
+        for forward in (True, False):
+            a_next = tour.next(a) if forward else tour.prev(a)
+            removed = dist(a, a_next)
+            for c in neighbors[a]:
+                g1 = removed - dist(a, c)
+                if g1 <= 1e-10:
+                    break
+                c_next = tour.next(c) if forward else tour.prev(c)
+                if c == a_next or c_next == a:
+                    continue
+                gain = g1 + dist(c, c_next) - dist(a_next, c_next)
+                if gain > 1e-10:
+                    if forward:
+                        tour.two_opt(a, a_next, c, c_next)
+                    else:
+                        tour.two_opt(a_next, a, c_next, c)
+                    return gain, (a, a_next, c, c_next)
+        return None
+
+    def _or_opt_city(self, tour, a, dist, neighbors):
+        # First improving move of the segment starting at a (1 to or_opt_max
+        # cities) to an edge next to one of a's near neighbours, either way round.
+        for length in range(1, self.or_opt_max + 1):
+            segment = [a]
+            for _ in range(length - 1):
+                segment.append(tour.next(segment[-1]))
+            s1, s2 = segment[0], segment[-1]
+            p = tour.prev(s1)
+            nx = tour.next(s2)
+            if p == s2 or nx == p or nx in segment:
+                return None
+            removal = dist(p, s1) + dist(s2, nx) - dist(p, nx)
+            if removal <= 1e-10:
+                continue
+            for c in neighbors[a]:
+                if c in segment:
+                    continue
+                for c1, c2 in ((c, tour.next(c)), (tour.prev(c), c)):
+                    if c1 in segment or c2 in segment or c2 == p or c1 == nx:
+                        continue
+                    base = dist(c1, c2)
+                    forward_cost = dist(c1, s1) + dist(s2, c2) - base
+                    reverse_cost = dist(c1, s2) + dist(s1, c2) - base
+                    gain = removal - min(forward_cost, reverse_cost)
+                    if gain > 1e-10:
+                        tour.move_segment(p, s1, s2, nx, c1, c2, forward_cost <= reverse_cost)
+                        return gain, (p, nx, s1, s2, c1, c2)
+        return None
+
+
+class _Tour:
+    # Array tour with a position index. Every move is built from reversals of
+    # the shorter side of the cycle, so orientation may flip between moves; the
+    # moves are therefore expressed in terms of edges, not directions.
+    def __init__(self, route, size):
+        self.order = list(route)
+        self.length = len(route)
+        self.position = [0] * size
+        for i, city in enumerate(self.order):
+            self.position[city] = i
+
+    @property
+    def route(self):
+        return list(self.order)
+
+    def next(self, city):
+        return self.order[(self.position[city] + 1) % self.length]
+
+    def prev(self, city):
+        return self.order[self.position[city] - 1]
+
+    def _reverse(self, i, j):
+        # Reverses positions i..j (cyclic, inclusive), or the complementary arc
+        # when that is shorter; both give the same set of edges.
+        order, position, length = self.order, self.position, self.length
+        inner = (j - i) % length + 1
+        if 2 * inner > length:
+            i, j = (j + 1) % length, (i - 1) % length
+            inner = length - inner
+        for _ in range(inner // 2):
+            order[i], order[j] = order[j], order[i]
+            position[order[i]] = i
+            position[order[j]] = j
+            i = (i + 1) % length
+            j = (j - 1) % length
+
+    def two_opt(self, a, b, c, d):
+        # Replaces edges (a, b) and (c, d), with b after a and d after c in the
+        # same direction, by (a, c) and (b, d).
+        if self.next(a) == b:
+            self._reverse(self.position[b], self.position[c])
+        else:
+            self._reverse(self.position[a], self.position[d])
+
+    def move_segment(self, p, s1, s2, nx, c1, c2, keep_direction):
+        # Or-opt as three 2-opt moves: p s1..s2 nx ... c1 c2 becomes
+        # p nx ... c1 s1..s2 c2 (or c1 s2..s1 c2 when keep_direction is False).
+        self.two_opt(p, s1, c1, c2)
+        self.two_opt(p, c1, nx, s2)
+        if keep_direction and s1 != s2:
+            self.two_opt(c1, s2, s1, c2)
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+# Mutation kernels over a whole (pop_size x n) route array. Each takes the route
+# array, the rows to mutate and a NumPy Generator, draws the random positions
+# for all of those rows in one call and applies the move in place. As in
+# Individual, the first and last positions are never picked.
+#
+# There is deliberately no delta (incremental) fitness update here. The GA
+# only mutates children that crossover has just written (the elites are
+# copied past mutation), so a mutated row never has a cached fitness to
+# patch: it is unscored either way and gets one full evaluation in the next
+# batched population.evaluate(). Patching would need the length of a tour
+# that was never measured. Delta evaluation does pay off where scored tours
+# are changed move by move, which is LocalSearch (see localsearch.py).
+
+
+def _distinct_positions(length, count, rng):
+    # Two different positions per row from 1..length - 2, like
+    # random.sample(range(1, length - 1), 2).
+    first = rng.integers(1, length - 1, count)
+    second = rng.integers(1, length - 2, count)
+    second += second >= first
+    return first, second
+
+
+def _segments(rows, starts, ends):
+    # Flattened (row, position, offset) for every position of every segment
+    # [starts[k], ends[k]], so a whole batch of segment moves is one gather and
+    # one scatter.
+    lengths = ends - starts + 1
+    bounds = np.concatenate(([0], np.cumsum(lengths)))
+    offsets = np.arange(bounds[-1]) - np.repeat(bounds[:-1], lengths)
+    return np.repeat(rows, lengths), np.repeat(starts, lengths) + offsets, offsets, lengths
+
+
+def batch_swap_mutation(routes, rows, rng):
+    # Swaps two random cities in every row.
+    first, second = _distinct_positions(routes.shape[1], len(rows), rng)
+    routes[rows, first], routes[rows, second] = routes[rows, second], routes[rows, first]
+
+
+def batch_scramble_mutation(routes, rows, rng):
+    # Shuffles a random segment of every row. Sorting on segment number plus a
+    # uniform key in [0, 1) shuffles each segment without mixing segments.
+    first, second = _distinct_positions(routes.shape[1], len(rows), rng)
+    segment_rows, positions, _, lengths = _segments(rows, np.minimum(first, second), np.maximum(first, second))
+    keys = np.repeat(np.arange(len(rows)), lengths) + rng.random(len(positions))
+    routes[segment_rows, positions] = routes[segment_rows, positions][np.argsort(keys)]
+
+
+def batch_inversion_mutation(routes, rows, rng):
+    # Reverses a random segment of every row (a 2-opt move).
+    first, second = _distinct_positions(routes.shape[1], len(rows), rng)
+    starts, ends = np.minimum(first, second), np.maximum(first, second)
+    segment_rows, positions, offsets, lengths = _segments(rows, starts, ends)
+    mirrored = np.repeat(ends, lengths) - offsets
+    routes[segment_rows, positions] = routes[segment_rows, mirrored]
+
+
+def batch_insertion_mutation(routes, rows, rng):
+    # Removes the city at one random position and reinserts it at another,
+    # shifting the cities in between by one: a rotation of that segment.
+    source, target = _distinct_positions(routes.shape[1], len(rows), rng)
+    starts, ends = np.minimum(source, target), np.maximum(source, target)
+    segment_rows, positions, offsets, lengths = _segments(rows, starts, ends)
+    # Moving forward rotates the segment left by one, moving backward right by one
+    step = np.repeat(np.where(source < target, 1, -1), lengths)
+    rotated = np.repeat(starts, lengths) + (offsets + step) % np.repeat(lengths, lengths)
+    routes[segment_rows, positions] = routes[segment_rows, rotated]
+
+
+MUTATION_OPERATORS = {
+    "Swap": batch_swap_mutation,
+    "Scramble": batch_scramble_mutation,
+    "Inversion": batch_inversion_mutation,
+    "Insertion": batch_insertion_mutation,
+}
+
+
+def mutation_methods(method):
+    # A single operator name or a sequence of names, as accepted by RunConfig.
+    methods = (method,) if isinstance(method, str) else tuple(method)
+    for name in methods:
+        if name not in MUTATION_OPERATORS:
+            raise ValueError(f"Unknown mutation method: {name}")
+    return methods
+
+
+def batch_mutation(methods, routes, rows, rate, rng):
+    # Applies each operator in methods to every row in rows independently with
+    # probability rate and returns the rows that changed, so only those need
+    # to be marked dirty and re-scored.
+    rows = np.asarray(rows, dtype=np.int64)
+    changed = np.zeros(len(routes), dtype=bool)
+    if routes.shape[1] < 4 or not rows.size:
+        return np.flatnonzero(changed)
+    for method in mutation_methods(methods):
+        picked = rows[rng.random(len(rows)) < rate]
+        if picked.size:
+            MUTATION_OPERATORS[method](routes, picked, rng)
+            changed[picked] = True
+    return np.flatnonzero(changed)
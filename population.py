@@ -0,0 +1,92 @@
+import numpy as np
+
+
+
+class IndividualView:
+    # Thin stand-in for Individual that reads and writes one row of a
+    # RoutePopulation, so the GUI and the expert code keep using .route/.fitness.
+    def __init__(self, population, index):
+        self.population = population
+        self.index = index
+
+    @property
+    def row(self):
+        # The live int32 route row, no copy.
+        return self.population.routes[self.index]
+
+    @property
+    def route(self):
+        return self.population.routes[self.index].tolist()
+
+    @route.setter
+    def route(self, route):
+        self.population.routes[self.index] = route
+        self.population.dirty[self.index] = True
+
+    @property
+    def fitness(self):
+        if self.population.dirty[self.index]:
+            return None
+        return float(self.population.fitness[self.index])
+
+    @fitness.setter
+    def fitness(self, value):
+        if value is None:
+            self.population.dirty[self.index] = True
+        else:
+            self.population.fitness[self.index] = value
+            self.population.dirty[self.index] = False
+
+
+class RoutePopulation:
+    def __init__(self, size, city_ids):
+        # All routes live in one contiguous (size x n) int32 array with a parallel
+        # fitness array. dirty[i] is True while row i has not been scored yet.
+        city_ids = np.asarray(list(city_ids), dtype=np.int32)
+        self.size = size
+        self.routes = np.empty((size, len(city_ids)), dtype=np.int32)
+        self.routes[:] = city_ids
+        # The sorted ids every row holds, for repairs
+        self.cities = np.sort(city_ids)
+        self.fitness = np.zeros(size)
+        self.dirty = np.ones(size, dtype=bool)
+        # Number of full tour evaluations so far, for evaluation budgets
+        self.evaluations = 0
+
+        # Second set of buffers the next generation is written into. The two
+        # sets are swapped by swap_buffers(), so nothing is allocated per generation.
+        self.offspring = np.empty_like(self.routes)
+        self.offspring_fitness = np.zeros(size)
+        self.offspring_dirty = np.ones(size, dtype=bool)
+
+        # Views are bound to slots, not to buffers, so they stay valid across swaps.
+        self.individuals = [IndividualView(self, i) for i in range(size)]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return self.individuals[index]
+
+    def evaluate(self, distance_matrix):
+        # Scores only the rows that changed since they were last evaluated.
+        # distance_matrix may also be a FitnessCache.
+        rows = np.flatnonzero(self.dirty)
+        if rows.size == self.size:
+            distance_matrix.evaluate_routes(self.routes, out=self.fitness)
+        elif rows.size:
+            self.fitness[rows] = distance_matrix.evaluate_routes(self.routes[rows])
+        self.dirty[rows] = False
+        self.evaluations += rows.size
+        return self.fitness
+
+    def swap_buffers(self):
+        # Promotes the offspring buffers to the current generation and recycles
+        # the parent buffers for the next round of children.
+        self.routes, self.offspring = self.offspring, self.routes
+        self.fitness, self.offspring_fitness = self.offspring_fitness, self.fitness
+        self.dirty, self.offspring_dirty = self.offspring_dirty, self.dirty
+        self.offspring_dirty[:] = True
+
+    def best_index(self):
+        return int(np.argmin(self.fitness))
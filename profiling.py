@@ -0,0 +1,84 @@
+import time
+from contextlib import contextmanager
+
+
+# Per-phase timing of the hot path. A PhaseProfiler wraps the methods that
+# make up each phase with a perf_counter_ns timer and call counter. It is
+# installed by replacing attributes on one object (a GeneticAlgorithm, a
+# GUI), so with profiling off nothing is wrapped and the hot path runs exactly
+# the code it runs without this module.
+
+# "repair" is the duplicate repair inside the crossover kernels; "completion"
+# is RepairStage finishing a crowd tour in the GUI session.
+PHASES = ("evaluation", "selection", "crossover", "repair", "mutation", "local_search", "termination",
+          "crowd", "completion", "gui")
+
+# Phases timed inside another one, so their time is also part of that phase
+NESTED_PHASES = {"repair": "crossover"}
+
+
+class PhaseProfiler:
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.nanoseconds = {}
+        self.calls = {}
+
+    def add(self, phase, nanoseconds, calls=1):
+        self.nanoseconds[phase] = self.nanoseconds.get(phase, 0) + nanoseconds
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+
+    def wrap(self, phase, function):
+        # function, timed under phase
+        clock = self.clock
+        add = self.add
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add(phase, clock() - start)
+        return timed
+
+    def instrument(self, owner, attribute, phase):
+        # Replaces owner.attribute (a method or function) with its timed version.
+        setattr(owner, attribute, self.wrap(phase, getattr(owner, attribute)))
+
+    @contextmanager
+    def patched(self, module, attribute, phase):
+        # Times a module-level function called from inside other code (e.g. the
+        # repair step of the crossover kernels) while the block runs.
+        original = getattr(module, attribute)
+        setattr(module, attribute, self.wrap(phase, original))
+        try:
+            yield
+        finally:
+            setattr(module, attribute, original)
+
+    def summary(self):
+        # {phase: (calls, nanoseconds)}, picklable, for sending back from a worker
+        return {phase: (self.calls[phase], self.nanoseconds[phase]) for phase in self.calls}
+
+    def merge(self, other):
+        # Adds another profiler, or a summary() of one, to this one.
+        summary = other.summary() if isinstance(other, PhaseProfiler) else other
+        for phase, (calls, nanoseconds) in summary.items():
+            self.add(phase, nanoseconds, calls)
+        return self
+
+    def table(self, title=None):
+        # Breakdown table: calls, total and mean time and share of the timed
+        # total per phase. Nested phases are listed but not counted twice.
+        order = [phase for phase in PHASES if phase in self.calls]
+        order += sorted(phase for phase in self.calls if phase not in PHASES)
+        total = sum(self.nanoseconds[phase] for phase in order if phase not in NESTED_PHASES)
+        lines = [title] if title else []
+        lines.append(f"{'phase':<14}{'calls':>10}{'total ms':>12}{'mean us':>11}{'share':>8}")
+        for phase in order:
+            calls, nanoseconds = self.calls[phase], self.nanoseconds[phase]
+            share = 100.0 * nanoseconds / total if total else 0.0
+            label = f"  {phase}" if phase in NESTED_PHASES else phase
+            lines.append(f"{label:<14}{calls:>10}{nanoseconds / 1e6:>12.1f}{nanoseconds / 1e3 / max(calls, 1):>11.1f}"
+                         f"{share:>7.1f}%")
+        lines.append(f"{'total':<14}{'':>10}{total / 1e6:>12.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,71 @@
+import time
+
+import numpy as np
+
+
+class RouteRenderer:
+    def __init__(self, canvas, coordinates, city_ids, scale_factor=4, max_fps=10.0, label_limit=500,
+                 clock=time.monotonic):
+        # Draws tours on a Tk canvas without rebuilding it. City markers are
+        # created once; the tour is one polyline (plus the thick closing edge)
+        # whose points are replaced with canvas.coords. Redraws happen only for
+        # a changed tour and at most max_fps times a second; a tour arriving
+        # sooner is drawn when the interval is up, so the last one always shows.
+        # coordinates is indexed by city id, as DistanceMatrix.coordinates is.
+        # Instances with more than label_limit cities get dots instead of labels.
+        self.canvas = canvas
+        self.points = np.asarray(coordinates, dtype=float) * scale_factor
+        self.city_ids = [int(city_id) for city_id in city_ids]
+        self.interval = 1.0 / max_fps
+        self.label_limit = label_limit
+        self.clock = clock
+        self.path = None
+        self.closing = None
+        self.drawn = None
+        self.pending = None
+        self.last_draw = -np.inf
+        self.frames = 0
+
+    def _create_items(self):
+        # Lines first, so the city markers stay on top of them
+        canvas = self.canvas
+        start = self.points[self.city_ids[0]].tolist()
+        self.path = canvas.create_line(start + start, fill="blue", width=1)
+        self.closing = canvas.create_line(start + start, fill="green", width=5)
+        for city_id in self.city_ids:
+            x, y = self.points[city_id].tolist()
+            if len(self.city_ids) <= self.label_limit:
+                canvas.create_text(x, y, text=str(city_id), font=("Arial", 12, "bold"), fill="black", tags="city")
+            else:
+                canvas.create_oval(x - 1, y - 1, x + 1, y + 1, fill="black", outline="", tags="city")
+
+    def draw(self, route):
+        # Shows route (city ids, open or closed) as soon as the frame rate allows.
+        route = np.asarray(route)
+        if self.pending is None and self.drawn is not None and np.array_equal(route, self.drawn):
+            return
+        wait = self.last_draw + self.interval - self.clock()
+        if wait > 0:
+            # Too soon: keep only the newest tour and draw it when the interval is up
+            if self.pending is None:
+                self.canvas.after(int(wait * 1000) + 1, self._flush)
+            self.pending = route
+            return
+        self.pending = None
+        self._render(route)
+
+    def _flush(self):
+        route, self.pending = self.pending, None
+        if route is not None:
+            self._render(route)
+
+    def _render(self, route):
+        if self.path is None:
+            self._create_items()
+        if self.drawn is None or not np.array_equal(route, self.drawn):
+            points = self.points[route]
+            self.canvas.coords(self.path, points.ravel().tolist())
+            self.canvas.coords(self.closing, points[[-1, 0]].ravel().tolist())
+            self.drawn = route.copy()
+            self.frames += 1
+        self.last_draw = self.clock()
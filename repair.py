@@ -0,0 +1,134 @@
+import numpy as np
+
+from localsearch import nearest_neighbor_lists
+
+
+# Turning a list of city ids with duplicates, gaps or placeholders into a
+# complete tour. repair_route/batch_repair are the cheap O(n) repairs used
+# inside crossover; RepairStage inserts each missing city where it lengthens
+# the tour least, for routes that matter on their own (e.g. the crowd tour).
+
+
+def repair_route(route, cities):
+    # Keeps the first occurrence of every city and hands the missing cities, in
+    # ascending order, to the positions that held duplicates, -1 placeholders
+    # or ids outside cities. cities is the sorted array of ids a tour holds;
+    # like batch_repair, nothing is assumed about the ids themselves.
+    route = np.asarray(route)
+    length = len(route)
+    size = max(int(route.max()), int(cities[-1])) + 1
+    known = np.zeros(size, dtype=bool)
+    known[cities] = True
+    valid = route >= 0
+    valid[valid] = known[route[valid]]
+    first = np.full(size, length)
+    np.minimum.at(first, route[valid], np.flatnonzero(valid))
+    duplicate = ~valid
+    duplicate[valid] = first[route[valid]] != np.flatnonzero(valid)
+    if duplicate.any():
+        present = np.zeros(size, dtype=bool)
+        present[route[~duplicate]] = True
+        route = route.copy()
+        route[np.flatnonzero(duplicate)] = cities[~present[cities]]
+    return route
+
+
+def batch_repair(children, cities, size):
+    # repair_route for every row at once; every row should hold exactly cities.
+    rows, length = children.shape
+    row_ids = np.arange(rows)[:, None]
+    keys = row_ids * size + children
+    first = np.full(rows * size, length)
+    np.minimum.at(first, keys.ravel(), np.tile(np.arange(length), rows))
+    duplicate = first[keys] != np.arange(length)
+    present = np.zeros((rows, size), dtype=bool)
+    present[np.broadcast_to(row_ids, children.shape)[~duplicate], children[~duplicate]] = True
+    missing_rows, missing_cols = np.nonzero(~present[:, cities])
+    duplicate_rows, duplicate_cols = np.nonzero(duplicate)
+    # Both index lists are in row-major order with equal counts per row
+    children[duplicate_rows, duplicate_cols] = cities[missing_cols]
+    return children
+
+
+
+class RepairStage:
+    def __init__(self, distance_matrix, neighbors=10, neighbor_lists=None):
+        # Cheapest insertion restricted to each missing city's nearest
+        # neighbours: a city goes next to whichever of its neighbours (already in
+        # the tour) gives the smallest detour. A repair costs O(n + missing * k)
+        # instead of the O(n * missing) of trying every position.
+        self.distance_matrix = distance_matrix
+        if neighbor_lists is None:
+            neighbor_lists = nearest_neighbor_lists(distance_matrix, neighbors)
+        self.neighbors = neighbor_lists.tolist()
+        self.cities = distance_matrix.city_ids.tolist()
+        self.size = len(distance_matrix.matrix)
+        self.known = [False] * self.size
+        for city in self.cities:
+            self.known[city] = True
+
+    def __call__(self, route):
+        return self.repair(route)
+
+    def repair(self, route):
+        # Returns a complete open tour: the first occurrence of every known city
+        # in route, in route order, with every missing city inserted at its
+        # cheapest neighbouring edge. A closing city (route[0] repeated at the
+        # end) is treated as a duplicate.
+        known = self.known
+        in_tour = [False] * self.size
+        kept = []
+        for city in route:
+            city = int(city)
+            if 0 <= city < self.size and known[city] and not in_tour[city]:
+                in_tour[city] = True
+                kept.append(city)
+        missing = [city for city in self.cities if not in_tour[city]]
+        if not kept:
+            kept.append(missing.pop(0))
+            in_tour[kept[0]] = True
+
+        # Doubly linked cycle over the kept cities, so insertions are O(1)
+        following = [0] * self.size
+        preceding = [0] * self.size
+        for a, b in zip(kept, kept[1:] + kept[:1]):
+            following[a] = b
+            preceding[b] = a
+
+        dist = self.distance_matrix.matrix.item
+        for city in missing:
+            best_cost = float("inf")
+            best_edge = None
+            for near in self.neighbors[city]:
+                if not in_tour[near]:
+                    continue
+                for a, b in ((preceding[near], near), (near, following[near])):
+                    cost = dist(a, city) + dist(city, b) - dist(a, b)
+                    if cost < best_cost:
+                        best_cost = cost
+                        best_edge = (a, b)
+            if best_edge is None:
+                # None of the neighbours is placed yet: try every edge
+                a = kept[0]
+                while True:
+                    b = following[a]
+                    cost = dist(a, city) + dist(city, b) - dist(a, b)
+                    if cost < best_cost:
+                        best_cost = cost
+                        best_edge = (a, b)
+                    a = b
+                    if a == kept[0]:
+                        break
+            a, b = best_edge
+            following[a] = city
+            preceding[city] = a
+            following[city] = b
+            preceding[b] = city
+            in_tour[city] = True
+
+        tour = [kept[0]]
+        city = following[kept[0]]
+        while city != kept[0]:
+            tour.append(city)
+            city = following[city]
+        return tour
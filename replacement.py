@@ -0,0 +1,59 @@
+import heapq
+
+import numpy as np
+
+
+REPLACEMENT_MODES = ("generational", "steady_state")
+
+
+def elite_rows(fitness, count):
+    # Rows of the count shortest tours, best first.
+    if count <= 0:
+        return np.empty(0, dtype=np.int64)
+    if count < len(fitness):
+        rows = np.argpartition(fitness, count - 1)[:count]
+    else:
+        rows = np.arange(len(fitness))
+    return rows[np.argsort(fitness[rows], kind="stable")]
+
+
+class WorstHeap:
+    # Max-heap (by tour length) over the rows of a scored RoutePopulation, used
+    # by steady-state replacement to find the worst rows without a full scan.
+    # Entries are not removed when a row changes: a popped entry whose length no
+    # longer matches the row's fitness is stale and goes back in with the
+    # current value (lazy invalidation), which is enough for rows that only get
+    # shorter (local search, immigrants); rows that get longer must be push()ed.
+    # Every row has at least one entry unless pop_worst() just handed it out.
+    def __init__(self, population):
+        self.population = population
+        self.rebuild()
+
+    def rebuild(self):
+        self.heap = [(-fitness, row) for row, fitness in enumerate(self.population.fitness.tolist())]
+        heapq.heapify(self.heap)
+
+    def push(self, rows):
+        # Records the current fitness of rows that were just replaced.
+        fitness = self.population.fitness
+        for row in rows:
+            heapq.heappush(self.heap, (-float(fitness[row]), int(row)))
+        # Stale entries pile up; start afresh once they outnumber the live ones
+        if len(self.heap) > 4 * self.population.size:
+            self.rebuild()
+
+    def pop_worst(self, count):
+        # Removes and returns the count worst distinct rows, worst first.
+        fitness = self.population.fitness
+        heap = self.heap
+        rows = []
+        while len(rows) < count:
+            negative, row = heapq.heappop(heap)
+            if row in rows:
+                continue
+            current = float(fitness[row])
+            if -negative != current:
+                heapq.heappush(heap, (-current, row))
+                continue
+            rows.append(row)
+        return rows
@@ -0,0 +1,39 @@
+import numpy as np
+
+
+# Random streams for runs and islands, all derived from one master seed with
+# NumPy SeedSequence spawn keys. A stream depends only on the master seed and
+# its key, never on which process runs it or in which order tasks finish, so a
+# single run can be replayed in isolation (e.g. under a profiler) and gives
+# bit-identical results.
+
+# First element of every spawn key, so run and island streams never coincide
+RUN_STREAM = 0
+ISLAND_STREAM = 1
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        # seed=None draws fresh entropy; self.seed then holds the value to pass
+        # back in to reproduce the whole sweep.
+        self.root = np.random.SeedSequence(seed)
+        self.seed = self.root.entropy
+
+    def sequence(self, *key):
+        # The child SeedSequence for key, equivalent to spawning it but
+        # addressable directly.
+        return np.random.SeedSequence(self.root.entropy, spawn_key=self.root.spawn_key + tuple(key))
+
+    def run(self, batch, config_index, run_index):
+        # batch tells apart successive RunScheduler.run() calls.
+        return self.sequence(RUN_STREAM, batch, config_index, run_index)
+
+    def island(self, island):
+        return self.sequence(ISLAND_STREAM, island)
+
+
+def generator(sequence):
+    # The Generator for a stream. The global random and np.random state is left
+    # alone: nothing in a run draws from it, and a run in the caller's process
+    # (workers=1, rerun()) must not reset the caller's state.
+    return np.random.default_rng(sequence)
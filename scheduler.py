@@ -0,0 +1,185 @@
+import itertools
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from distances import DistanceMatrix
+from population import RoutePopulation
+from rngs import RandomStreams, generator
+from solver import GeneticAlgorithm
+
+
+class SharedArray:
+    # A NumPy array placed in shared memory. Only (name, shape, dtype) is sent to
+    # the workers, which map the same pages instead of receiving a copy.
+    def __init__(self, array):
+        self.shape = array.shape
+        self.dtype = array.dtype.str
+        self.memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(self.shape, dtype=self.dtype, buffer=self.memory.buf)[...] = array
+        self.name = self.memory.name
+
+    def spec(self):
+        return self.name, self.shape, self.dtype
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+
+class RunResult:
+    # What a worker sends back for one run: the final population sorted by
+    # fitness, plus enough bookkeeping to match it to its configuration.
+    # best_route/best_fitness are the best tour found during the whole run,
+    # which without elitism can be better than anything in the final population.
+    # telemetry holds the per-generation columns when config.telemetry is set,
+    # profile the PhaseProfiler.summary() of the run when config.profile is.
+    def __init__(self, config, config_index, run_index, seed, routes, fitness, elapsed,
+                 generations=None, evaluations=None, stop_reason=None, telemetry=None,
+                 profile=None, best_route=None, best_fitness=None):
+        self.config = config
+        self.config_index = config_index
+        self.run_index = run_index
+        self.seed = seed
+        self.routes = routes
+        self.fitness = fitness
+        self.elapsed = elapsed
+        self.generations = generations
+        self.evaluations = evaluations
+        self.stop_reason = stop_reason
+        self.telemetry = telemetry
+        self.profile = profile
+        if best_route is None or best_fitness > fitness[0]:
+            best_route, best_fitness = routes[0], fitness[0]
+        self.best_route = np.asarray(best_route).tolist()
+        self.best_fitness = float(best_fitness)
+
+    def population(self):
+        # Rebuilds a scored RoutePopulation so callers can keep using .individuals.
+        population = RoutePopulation(len(self.fitness), self.routes[0])
+        population.routes[:] = self.routes
+        population.fitness[:] = self.fitness
+        population.dirty[:] = False
+        return population
+
+
+# Per worker process state, filled in once by _init_worker
+_worker = {}
+
+
+def _init_worker(city_ids_spec, coordinates_spec, matrix_spec):
+    attached = [_attach(spec) for spec in (city_ids_spec, coordinates_spec, matrix_spec)]
+    _worker["memory"] = [memory for memory, _ in attached]
+    city_ids, coordinates, matrix = (array for _, array in attached)
+    _worker["distance_matrix"] = DistanceMatrix.from_arrays(city_ids, coordinates, matrix)
+
+
+def _worker_ready():
+    return os.getpid()
+
+
+def _run_task(config, config_index, run_index, seed, distance_matrix=None):
+    # seed is the run's SeedSequence (see rngs.py)
+    if distance_matrix is None:
+        distance_matrix = _worker["distance_matrix"]
+    rng = generator(seed)
+    start_time = time.perf_counter()
+    ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, rng)
+    population = ga.run()
+    order = np.argsort(population.fitness)
+    return RunResult(config, config_index, run_index, seed, population.routes[order].copy(),
+                     population.fitness[order].copy(), time.perf_counter() - start_time,
+                     ga.termination.generation, population.evaluations, ga.termination.reason,
+                     ga.log.arrays() if ga.log is not None else None,
+                     ga.profiler.summary() if ga.profiler is not None else None,
+                     ga.termination.best_route, ga.termination.best_fitness)
+
+
+class RunScheduler:
+    def __init__(self, distance_matrix, workers=None, seed=None):
+        # Fans independent GA runs out over a process pool. The distance matrix and
+        # coordinates are placed in shared memory once and mapped by every worker.
+        # workers=1 runs everything in this process without a pool.
+        self.distance_matrix = distance_matrix
+        self.workers = workers or os.cpu_count() or 1
+        self.streams = RandomStreams(seed)
+        self.seed = self.streams.seed
+        self.batches = 0
+        self.executor = None
+        self.shared = []
+        if self.workers > 1:
+            self.shared = [SharedArray(array) for array in (distance_matrix.city_ids,
+                                                            distance_matrix.coordinates,
+                                                            distance_matrix.matrix)]
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                initargs=tuple(shared.spec() for shared in self.shared))
+
+    def start(self):
+        # Brings the pool up now instead of on the first run() and waits until
+        # the workers answer, so a measurement can leave process start-up and
+        # mapping the shared arrays out.
+        if self.executor is not None:
+            for future in [self.executor.submit(_worker_ready) for _ in range(self.workers)]:
+                future.result()
+        return self
+
+    def run(self, configs, runs, window=None):
+        # Runs every configuration `runs` times and yields RunResult objects as
+        # they complete (not in submission order). Each run gets its own random
+        # stream, keyed by (call, config_index, run_index) under the scheduler's
+        # seed, whichever worker executes it. At most window runs (default twice
+        # the worker count) are queued or running at a time, and a new one is
+        # only submitted when the caller asks for the next result, so a caller
+        # that stops iterating (e.g. a paused GUI) soon leaves the pool idle.
+        batch = self.batches
+        self.batches += 1
+        tasks = [(config, config_index, run_index, self.streams.run(batch, config_index, run_index))
+                 for config_index, config in enumerate(configs)
+                 for run_index in range(runs)]
+        if self.executor is None:
+            for task in tasks:
+                yield _run_task(*task, distance_matrix=self.distance_matrix)
+            return
+        window = window or 2 * self.workers
+        queued = iter(tasks)
+        pending = {self.executor.submit(_run_task, *task) for task in itertools.islice(queued, window)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                    # Top up only once the caller is back for more
+                    for task in itertools.islice(queued, 1):
+                        pending.add(self.executor.submit(_run_task, *task))
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def rerun(self, result):
+        # Repeats the run behind a RunResult in this process, with the same
+        # random stream, so a slow run can be replayed under a profiler.
+        return _run_task(result.config, result.config_index, result.run_index, result.seed,
+                         distance_matrix=self.distance_matrix)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+        for shared in self.shared:
+            shared.close()
+        self.shared = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,150 @@
+import numpy as np
+
+
+SELECTION_STRATEGIES = ("roulette", "alias", "sus", "tournament")
+
+
+class SelectionEngine:
+    def __init__(self, strategy="roulette", tournament_size=3, rng=None):
+        # roulette   - fitness proportional (1 / tour length), binary search on the
+        #              cumulative weights, same distribution as roulette_wheel_selection
+        # alias      - same distribution, O(1) per draw with Walker's alias tables
+        # sus        - stochastic universal sampling, one spin with evenly spaced pointers
+        # tournament - best of tournament_size uniformly drawn individuals
+        if strategy not in SELECTION_STRATEGIES:
+            raise ValueError(f"Unknown selection strategy: {strategy}")
+        if tournament_size < 1:
+            raise ValueError("tournament_size must be at least 1")
+        self.strategy = strategy
+        self.tournament_size = tournament_size
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.fitness = None
+        self._weights = None
+        self._cumulative = None
+        self._alias_prob = None
+        self._alias_index = None
+        self._tree = None
+        self._total = 0.0
+
+    def prepare(self, fitness, incremental=False):
+        # Builds the per generation tables once, before any parent is drawn.
+        # incremental=True (steady-state replacement) keeps the weights in a
+        # Fenwick tree instead, so update() can patch the rows that change
+        # between draws in O(log n) each; alias draws then use the tree too,
+        # which gives the same distribution.
+        self.fitness = fitness
+        self._tree = None
+        if self.strategy == "tournament":
+            return
+        if self._weights is None or len(self._weights) != len(fitness):
+            self._weights = np.empty(len(fitness))
+            self._cumulative = np.empty(len(fitness))
+        np.divide(1.0, fitness, out=self._weights)
+        if incremental:
+            self._build_tree()
+        elif self.strategy == "alias":
+            self._build_alias_tables()
+        else:
+            np.cumsum(self._weights, out=self._cumulative)
+
+    def _build_alias_tables(self):
+        # Vose's variant of Walker's alias method.
+        size = len(self._weights)
+        scaled = self._weights * (size / self._weights.sum())
+        prob = np.ones(size)
+        alias = np.arange(size)
+        small = list(np.flatnonzero(scaled < 1.0))
+        large = list(np.flatnonzero(scaled >= 1.0))
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        self._alias_prob = prob
+        self._alias_index = alias
+
+    def _build_tree(self):
+        # tree[i] (1-based) holds the sum of the weights of rows i - lowbit(i)
+        # to i - 1; built from the prefix sums in one pass.
+        size = len(self._weights)
+        cumulative = np.concatenate(([0.0], np.cumsum(self._weights)))
+        index = np.arange(1, size + 1)
+        tree = np.zeros(size + 1)
+        tree[1:] = cumulative[index] - cumulative[index - (index & -index)]
+        self._tree = tree.tolist()
+        self._total = float(cumulative[-1])
+
+    def update(self, rows):
+        # Refreshes the weights of rows after their fitness changed (incremental
+        # mode only; the other tables are rebuilt by the next prepare()).
+        if self._tree is None:
+            return
+        tree = self._tree
+        size = len(tree) - 1
+        for row in rows:
+            weight = 1.0 / float(self.fitness[row])
+            delta = weight - self._weights[row]
+            self._weights[row] = weight
+            self._total += delta
+            index = int(row) + 1
+            while index <= size:
+                tree[index] += delta
+                index += index & -index
+
+    def _tree_search(self, point):
+        # Row whose cumulative weight interval contains point
+        tree = self._tree
+        size = len(tree) - 1
+        position = 0
+        step = 1 << (size.bit_length() - 1)
+        while step:
+            following = position + step
+            if following <= size and tree[following] < point:
+                position = following
+                point -= tree[following]
+            step >>= 1
+        return position
+
+    def draw(self, count):
+        # Draws count parent indices from the tables built by prepare().
+        size = len(self.fitness)
+        if self._tree is not None:
+            if self.strategy == "sus":
+                step = self._total / count
+                points = (self.rng.random() + np.arange(count)) * step
+            else:
+                points = self.rng.random(count) * self._total
+            indices = np.array([self._tree_search(point) for point in points.tolist()], dtype=np.int64)
+            if self.strategy == "sus":
+                self.rng.shuffle(indices)
+        elif self.strategy == "roulette":
+            total = self._cumulative[-1]
+            points = self.rng.random(count) * total
+            indices = np.searchsorted(self._cumulative, points)
+        elif self.strategy == "alias":
+            columns = self.rng.integers(0, size, count)
+            accept = self.rng.random(count) < self._alias_prob[columns]
+            indices = np.where(accept, columns, self._alias_index[columns])
+        elif self.strategy == "sus":
+            step = self._cumulative[-1] / count
+            points = (self.rng.random() + np.arange(count)) * step
+            indices = np.searchsorted(self._cumulative, points)
+            # Pointers come out sorted, shuffle so mating pairs are not neighbours
+            self.rng.shuffle(indices)
+        else:
+            candidates = self.rng.integers(0, size, (count, self.tournament_size))
+            winners = np.argmin(self.fitness[candidates], axis=1)
+            indices = candidates[np.arange(count), winners]
+        # Guards against floating point round off at the top of the wheel
+        np.minimum(indices, size - 1, out=indices)
+        return indices
+
+    def select(self, fitness, count):
+        # Prepares the tables for this generation and draws all parents in one batch.
+        self.prepare(fitness)
+        return self.draw(count)
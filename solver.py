@@ -0,0 +1,244 @@
+import numpy as np
+
+import crossover
+from construction import greedy_edge_tour, grid_neighbors, nearest_neighbor_tour
+from crossover import CROSSOVER_OPERATORS, batch_crossover
+from fitness_cache import FitnessCache
+from localsearch import LocalSearch
+from mutation import batch_mutation, mutation_methods
+from population import RoutePopulation
+from profiling import PhaseProfiler
+from replacement import REPLACEMENT_MODES, WorstHeap, elite_rows
+from selection import SelectionEngine
+from telemetry import GenerationLog
+from termination import Termination
+
+
+LOCAL_SEARCH_MODES = (None, "elite", "offspring")
+SEED_METHODS = ("nearest", "greedy")
+
+
+class RunConfig:
+    def __init__(self, crossover_method="Uniform", mutation_method="Swap", pop_size=100,
+                 max_generations=1000, mutation_rate=0.2, fitness_threshold=None,
+                 selection="roulette", local_search=None, local_search_neighbors=10,
+                 seed_fraction=0.0, seed_method="nearest", stall_generations=None,
+                 time_limit=None, max_evaluations=None, elitism=0, replacement="generational",
+                 steady_state_size=2, fitness_cache=0, telemetry=False,
+                 profile=False):
+        # Everything that defines one GA run. The method names are the labels used
+        # by the benchmark loops, e.g. "Cycle"/"Uniform" and "Swap"/"Scramble".
+        # mutation_method may also be a sequence of names; each operator is then
+        # applied independently with probability mutation_rate.
+        # local_search is None, "elite" (2-opt/Or-opt on the best route every
+        # generation) or "offspring" (on every child after mutation).
+        # seed_fraction of the initial population is built with nearest neighbour
+        # tours from random start cities; seed_method "greedy" makes the first of
+        # them a greedy edge tour.
+        # Besides max_generations and fitness_threshold (an absolute tour length,
+        # so off by default) a run stops after stall_generations without
+        # improvement, after time_limit seconds or after max_evaluations tour
+        # evaluations (see termination.py).
+        # replacement "generational" replaces the whole population every
+        # generation except the elitism best routes, which are carried over
+        # unchanged. "steady_state" instead breeds steady_state_size children at
+        # a time and puts them in place of the current worst routes; a generation
+        # is then pop_size children. The best max(elitism, 1) routes are never
+        # among the worst, so steady_state_size may be at most pop_size minus that.
+        # fitness_cache > 0 scores routes through an LRU FitnessCache of that
+        # size. Off by default: with a dense matrix, scoring a tour costs about
+        # as much as hashing it, and few children repeat an earlier tour.
+        # telemetry=True records best/mean/worst cost, diversity, evaluations and
+        # elapsed time every generation in a GenerationLog (see telemetry.py).
+        # profile=True times every phase of the run with a PhaseProfiler (see
+        # profiling.py); off, the run executes no timing code at all.
+        if crossover_method not in CROSSOVER_OPERATORS:
+            raise ValueError(f"Unknown crossover method: {crossover_method}")
+        mutation_methods(mutation_method)
+        if local_search not in LOCAL_SEARCH_MODES:
+            raise ValueError(f"Unknown local search mode: {local_search}")
+        if seed_method not in SEED_METHODS:
+            raise ValueError(f"Unknown seed method: {seed_method}")
+        if replacement not in REPLACEMENT_MODES:
+            raise ValueError(f"Unknown replacement mode: {replacement}")
+        if not 0 <= elitism < pop_size:
+            raise ValueError("elitism must be between 0 and pop_size - 1")
+        if replacement == "steady_state" and not 1 <= steady_state_size <= pop_size - max(elitism, 1):
+            raise ValueError("steady_state_size must be between 1 and pop_size - max(elitism, 1)")
+        self.crossover_method = crossover_method
+        self.mutation_method = mutation_method
+        self.pop_size = pop_size
+        self.max_generations = max_generations
+        self.mutation_rate = mutation_rate
+        self.fitness_threshold = fitness_threshold
+        self.selection = selection
+        self.local_search = local_search
+        self.local_search_neighbors = local_search_neighbors
+        self.seed_fraction = seed_fraction
+        self.seed_method = seed_method
+        self.stall_generations = stall_generations
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.elitism = elitism
+        self.replacement = replacement
+        self.steady_state_size = steady_state_size
+        self.fitness_cache = fitness_cache
+        self.telemetry = telemetry
+        self.profile = profile
+
+
+class GeneticAlgorithm:
+    def __init__(self, config, city_ids, distance_matrix, rng=None):
+        self.config = config
+        self.distance_matrix = distance_matrix
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # What population.evaluate() scores with: the matrix itself or a cache over it
+        self.evaluator = distance_matrix
+        if config.fitness_cache:
+            self.evaluator = FitnessCache(distance_matrix, config.fitness_cache)
+        self.selection = SelectionEngine(config.selection, rng=self.rng)
+        self.population = RoutePopulation(config.pop_size, city_ids)
+        self.local_search = None
+        if config.local_search is not None:
+            self.local_search = LocalSearch(distance_matrix, config.local_search_neighbors)
+        if config.seed_fraction > 0:
+            self.seed_population(city_ids)
+        self.generation = 0
+        self.termination = None
+        self.worst_heap = None
+        self.log = GenerationLog() if config.telemetry else None
+        self.profiler = None
+        if config.profile:
+            self.profiler = PhaseProfiler()
+            self._instrument(self.profiler)
+
+    def _instrument(self, profiler):
+        # Swaps the phase entry points of this run for timed versions
+        profiler.instrument(self.population, "evaluate", "evaluation")
+        # select() goes through prepare() and draw(), so those are timed instead
+        for method in ("prepare", "draw", "update"):
+            profiler.instrument(self.selection, method, "selection")
+        profiler.instrument(self, "_crossover", "crossover")
+        profiler.instrument(self, "_mutate", "mutation")
+        if self.local_search is not None:
+            profiler.instrument(self.local_search, "improve_population", "local_search")
+
+    def seed_population(self, city_ids):
+        # Overwrites the first seed_fraction of the rows with constructed tours.
+        config = self.config
+        count = min(int(round(config.pop_size * config.seed_fraction)), config.pop_size)
+        city_ids = np.asarray(list(city_ids))
+        coordinates = self.distance_matrix.coordinates
+        neighbors = grid_neighbors(coordinates[city_ids])
+        starts = self.rng.choice(city_ids, size=count, replace=count > len(city_ids))
+        for row, start_city in enumerate(starts):
+            if row == 0 and config.seed_method == "greedy":
+                tour = greedy_edge_tour(city_ids, coordinates)
+            else:
+                tour = nearest_neighbor_tour(city_ids, coordinates, int(start_city), neighbors)
+            self.population.routes[row] = tour
+            self.population.dirty[row] = True
+
+    def step(self):
+        # One generation: score, select, cross over, replace, mutate.
+        if self.config.replacement == "steady_state":
+            self._steady_state_step()
+        else:
+            self._generational_step()
+        self.generation += 1
+
+    def _generational_step(self):
+        # Children are written into the spare buffer, the elite rows are copied
+        # over the first children together with their fitness, and the buffers
+        # are swapped. Elites are not mutated, so they are never re-evaluated.
+        config = self.config
+        population = self.population
+        population.evaluate(self.evaluator)
+        if config.local_search == "elite":
+            self.local_search.improve_population(population, [population.best_index()])
+
+        parents = self.selection.select(population.fitness, config.pop_size)
+        self._crossover(parents, population.offspring)
+        elite = elite_rows(population.fitness, config.elitism)
+        population.offspring[:len(elite)] = population.routes[elite]
+        population.offspring_fitness[:len(elite)] = population.fitness[elite]
+        population.offspring_dirty[:len(elite)] = False
+        population.swap_buffers()
+
+        children = range(len(elite), population.size)
+        self._mutate(children)
+        if config.local_search == "offspring":
+            population.evaluate(self.evaluator)
+            self.local_search.improve_population(population, children)
+
+    def _steady_state_step(self):
+        # pop_size children in rounds of steady_state_size; each round's children
+        # overwrite the worst rows, found through a lazily updated heap. The
+        # selection weights are built once per generation and patched for the
+        # replaced rows after every round, not rebuilt over the whole population.
+        config = self.config
+        population = self.population
+        population.evaluate(self.evaluator)
+        if self.worst_heap is None:
+            self.worst_heap = WorstHeap(population)
+        if config.local_search == "elite":
+            self.local_search.improve_population(population, [population.best_index()])
+
+        count = config.steady_state_size
+        children = population.offspring[:count]
+        self.selection.prepare(population.fitness, incremental=True)
+        for _ in range(max(config.pop_size // count, 1)):
+            parents = self.selection.draw(count)
+            self._crossover(parents, children)
+            rows = self.worst_heap.pop_worst(count)
+            population.routes[rows] = children
+            population.dirty[rows] = True
+            self._mutate(rows)
+            population.evaluate(self.evaluator)
+            if config.local_search == "offspring":
+                self.local_search.improve_population(population, rows)
+            self.worst_heap.push(rows)
+            self.selection.update(rows)
+
+    def _crossover(self, parents, out):
+        batch_crossover(self.config.crossover_method, self.population.routes, parents, out, self.rng)
+
+    def _mutate(self, rows):
+        changed = batch_mutation(self.config.mutation_method, self.population.routes, rows,
+                                 self.config.mutation_rate, self.rng)
+        self.population.dirty[changed] = True
+
+    def run(self, terminate=None):
+        # Runs generations until terminate(population, generation) returns True,
+        # by default a Termination built from the config. The population is fully
+        # scored before every check and when the run ends.
+        if terminate is None:
+            terminate = Termination.from_config(self.config)
+        if isinstance(terminate, Termination):
+            terminate.start()
+            self.termination = terminate
+        if self.profiler is not None:
+            # The repair inside the crossover kernels is timed for this run only
+            terminate = self.profiler.wrap("termination", terminate)
+            with self.profiler.patched(crossover, "batch_repair", "repair"), \
+                    self.profiler.patched(crossover, "repair_route", "repair"):
+                return self._run(terminate)
+        return self._run(terminate)
+
+    def _run(self, terminate):
+        if self.log is not None:
+            self.log.start()
+        # The initial population (seeded tours included) counts for the best so
+        # far, but not as a generation
+        self.population.evaluate(self.evaluator)
+        if self.termination is not None:
+            self.termination.record(self.population)
+        for generation in range(self.config.max_generations):
+            self.step()
+            self.population.evaluate(self.evaluator)
+            if self.log is not None:
+                self.log.record(generation, self.population)
+            if terminate(self.population, generation):
+                break
+        self.population.evaluate(self.evaluator)
+        return self.population
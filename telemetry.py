@@ -0,0 +1,192 @@
+import json
+import time
+
+import numpy as np
+
+
+# Per-generation instrumentation. A GenerationLog collects one row per
+# generation inside the run (a worker process, usually) and travels back with
+# the RunResult; a TelemetryWriter in the main process appends the rows to a
+# JSONL or Parquet store, and read_telemetry() loads them as columns again.
+
+GENERATION_COLUMNS = ("generation", "best", "mean", "worst", "diversity", "evaluations", "elapsed")
+
+# Console output levels, least to most talkative
+VERBOSITY_LEVELS = ("quiet", "summary", "runs", "debug")
+
+
+def population_diversity(routes, sample=32):
+    # Cheap 0..1 spread measure: for up to `sample` evenly spaced cities, how
+    # many different (unordered) neighbour pairs they have across the rows,
+    # 0 when every row agrees, 1 when no two rows do. One scatter over the
+    # population plus a sort of rows x sample keys, so it can run every
+    # generation.
+    routes = np.asarray(routes)
+    rows, n = routes.shape
+    if rows < 2 or n < 3:
+        return 0.0
+    cities = np.sort(routes[0])[np.linspace(0, n - 1, min(sample, n)).astype(np.int64)]
+    positions = np.empty((rows, int(routes.max()) + 1), dtype=np.int64)
+    positions[np.arange(rows)[:, None], routes] = np.arange(n)
+    at = positions[:, cities]
+    previous = np.take_along_axis(routes, (at - 1) % n, axis=1).astype(np.int64)
+    following = np.take_along_axis(routes, (at + 1) % n, axis=1).astype(np.int64)
+    size = int(routes.max()) + 1
+    keys = np.sort(np.minimum(previous, following) * size + np.maximum(previous, following), axis=0)
+    distinct = 1 + np.count_nonzero(np.diff(keys, axis=0), axis=0)
+    return float((distinct - 1).mean() / (rows - 1))
+
+
+class GenerationLog:
+    def __init__(self, clock=time.perf_counter):
+        # One list per GENERATION_COLUMNS entry; elapsed is seconds since start().
+        self.clock = clock
+        self.start()
+
+    def start(self):
+        self.started = self.clock()
+        self.columns = {name: [] for name in GENERATION_COLUMNS}
+
+    def record(self, generation, population):
+        # population must be fully scored
+        fitness = population.fitness
+        columns = self.columns
+        columns["generation"].append(generation)
+        columns["best"].append(float(fitness.min()))
+        columns["mean"].append(float(fitness.mean()))
+        columns["worst"].append(float(fitness.max()))
+        columns["diversity"].append(population_diversity(population.routes))
+        columns["evaluations"].append(int(population.evaluations))
+        columns["elapsed"].append(self.clock() - self.started)
+
+    def __len__(self):
+        return len(self.columns["generation"])
+
+    def arrays(self):
+        return {name: np.asarray(values) for name, values in self.columns.items()}
+
+
+class TelemetryWriter:
+    def __init__(self, path, format=None, buffer_rows=10000):
+        # Appends rows to path. format is "jsonl" or "parquet", by default taken
+        # from the file suffix. Rows are buffered column-wise and written every
+        # buffer_rows rows and on close(). Parquet needs pyarrow, which is only
+        # imported here; each flush becomes one row group.
+        if format is None:
+            format = "parquet" if str(path).endswith(".parquet") else "jsonl"
+        if format not in ("jsonl", "parquet"):
+            raise ValueError(f"Unknown telemetry format: {format}")
+        self.path = path
+        self.format = format
+        self.buffer_rows = buffer_rows
+        self.buffer = {}
+        self.buffered = 0
+        self.rows = 0
+        self.parquet = None
+        if format == "parquet":
+            import pyarrow  # noqa: F401 - fail now rather than at the first flush
+        else:
+            # Truncate, so a store always holds one sweep
+            open(path, "w").close()
+
+    def write(self, columns, **constants):
+        # columns maps names to equal-length sequences; every keyword argument
+        # (e.g. crossover="Cycle", run_index=3) is repeated on each of those rows.
+        count = len(next(iter(columns.values()))) if columns else 0
+        if not count:
+            return
+        names = list(constants) + list(columns)
+        if self.buffer and names != list(self.buffer):
+            self.flush()
+        for name in names:
+            values = [constants[name]] * count if name in constants else np.asarray(columns[name]).tolist()
+            self.buffer.setdefault(name, []).extend(values)
+        self.buffered += count
+        if self.buffered >= self.buffer_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.buffered:
+            return
+        if self.format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.table(self.buffer)
+            if self.parquet is None:
+                self.parquet = pq.ParquetWriter(self.path, table.schema)
+            self.parquet.write_table(table)
+        else:
+            names = list(self.buffer)
+            with open(self.path, "a") as file:
+                for values in zip(*self.buffer.values()):
+                    file.write(json.dumps(dict(zip(names, values))) + "\n")
+        self.rows += self.buffered
+        self.buffer = {}
+        self.buffered = 0
+
+    def close(self):
+        self.flush()
+        if self.parquet is not None:
+            self.parquet.close()
+            self.parquet = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_telemetry(path):
+    # The whole store as {column: array}.
+    if str(path).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+    columns = {}
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                for name, value in json.loads(line).items():
+                    columns.setdefault(name, []).append(value)
+    return {name: np.asarray(values) for name, values in columns.items()}
+
+
+def improvement_curves(columns, key=("crossover", "mutation"), value="best"):
+    # {key tuple: mean of `value` per generation over all runs with that key}.
+    # A run that stopped early keeps its last value for the later generations.
+    curves = {}
+    runs = {}
+    labels = list(zip(*(columns[name] for name in key), columns["run_index"]))
+    generations = columns["generation"]
+    values = columns[value]
+    for row, label in enumerate(labels):
+        runs.setdefault(label[:-1], {}).setdefault(label[-1], []).append((generations[row], values[row]))
+    for combo, by_run in runs.items():
+        length = max(int(generation) for records in by_run.values() for generation, _ in records) + 1
+        stacked = np.empty((len(by_run), length))
+        for index, records in enumerate(by_run.values()):
+            records.sort()
+            curve = np.array([cost for _, cost in records])
+            stacked[index, :len(curve)] = curve
+            stacked[index, len(curve):] = curve[-1]
+        curves[tuple(str(part) for part in combo)] = stacked.mean(axis=0)
+    return curves
+
+
+class Reporter:
+    def __init__(self, verbosity="quiet"):
+        # print() gated by VERBOSITY_LEVELS; reporter("runs", message) prints
+        # only at verbosity "runs" or "debug". "quiet" prints nothing.
+        if verbosity not in VERBOSITY_LEVELS:
+            raise ValueError(f"Unknown verbosity: {verbosity}")
+        self.level = VERBOSITY_LEVELS.index(verbosity)
+
+    def enabled(self, level):
+        return self.level >= VERBOSITY_LEVELS.index(level) > 0
+
+    def __call__(self, level, message):
+        if self.enabled(level):
+            print(message)
@@ -0,0 +1,76 @@
+import time
+
+import numpy as np
+
+
+STOP_REASONS = ("generations", "threshold", "stall", "time", "evaluations")
+
+
+class Termination:
+    def __init__(self, max_generations=1000, fitness_threshold=None, stall_generations=None,
+                 time_limit=None, max_evaluations=None, min_improvement=0.0, clock=time.perf_counter):
+        # Decides when a run stops. Any criterion left as None is not checked.
+        # max_generations   - hard cap on generations
+        # fitness_threshold - stop once the best tour is at most this long
+        # stall_generations - stop after this many generations without the best
+        #                     improving by more than min_improvement
+        # time_limit        - wall-clock budget in seconds, measured from start()
+        # max_evaluations   - budget of full tour evaluations (population.evaluations)
+        self.max_generations = max_generations
+        self.fitness_threshold = fitness_threshold
+        self.stall_generations = stall_generations
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.min_improvement = min_improvement
+        self.clock = clock
+        self.start()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config.max_generations, config.fitness_threshold, config.stall_generations,
+                   config.time_limit, config.max_evaluations)
+
+    def start(self):
+        # Resets the best-so-far record and the clock for a new run.
+        self.started = self.clock()
+        self.generation = 0
+        self.best_fitness = np.inf
+        self.best_route = None
+        self.best_generation = 0
+        self.reason = None
+
+    def record(self, population):
+        # Takes a fully scored population into the best-so-far record without
+        # counting a generation, as run() does for the initial population. Only
+        # its minimum is looked at; the best route is copied only when it
+        # improves on the best so far.
+        best = population.best_index()
+        fitness = float(population.fitness[best])
+        if fitness < self.best_fitness - self.min_improvement:
+            self.best_generation = self.generation
+        if fitness < self.best_fitness:
+            self.best_fitness = fitness
+            self.best_route = population.routes[best].copy()
+
+    def update(self, population):
+        # Records one finished, fully scored generation and returns True when the
+        # run should stop (the reason is left in self.reason).
+        self.generation += 1
+        self.record(population)
+
+        if self.max_generations is not None and self.generation >= self.max_generations:
+            self.reason = "generations"
+        elif self.fitness_threshold is not None and self.best_fitness <= self.fitness_threshold:
+            self.reason = "threshold"
+        elif self.stall_generations is not None and self.generation - self.best_generation >= self.stall_generations:
+            self.reason = "stall"
+        elif self.time_limit is not None and self.clock() - self.started >= self.time_limit:
+            self.reason = "time"
+        elif self.max_evaluations is not None and population.evaluations >= self.max_evaluations:
+            self.reason = "evaluations"
+        return self.reason is not None
+
+    def __call__(self, population, generation):
+        # The terminate(population, generation) signature GeneticAlgorithm.run()
+        # accepts; the generation count is kept here.
+        return self.update(population)
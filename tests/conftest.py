@@ -0,0 +1,29 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The modules live at the top of the repository, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from distances import DistanceMatrix  # noqa: E402
+
+
+@pytest.fixture
+def city_data():
+    # 40 random cities with non-contiguous ids, as a TSPLIB file may have
+    rng = np.random.default_rng(7)
+    ids = np.sort(rng.choice(np.arange(1, 200), 40, replace=False))
+    return {int(city_id): (float(x), float(y)) for city_id, (x, y) in zip(ids, rng.random((40, 2)) * 500)}
+
+
+@pytest.fixture
+def distance_matrix(city_data):
+    return DistanceMatrix(city_data)
+
+
+@pytest.fixture
+def routes(distance_matrix):
+    rng = np.random.default_rng(11)
+    return np.array([rng.permutation(distance_matrix.city_ids) for _ in range(30)], dtype=np.int32)
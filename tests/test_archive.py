@@ -0,0 +1,42 @@
+import numpy as np
+
+from archive import ExpertArchive, canonical_routes, route_keys
+
+
+def test_canonical_routes_ignore_rotation_and_direction():
+    tour = np.array([4, 2, 7, 1, 9, 3])
+    spellings = [np.roll(tour, shift) for shift in range(6)] + [np.roll(tour[::-1], shift) for shift in range(6)]
+    canonical = canonical_routes(spellings)
+    assert (canonical == canonical[0]).all()
+    assert canonical[0][0] == 1
+    assert len(set(route_keys(canonical))) == 1
+
+
+def test_different_tours_get_different_keys(routes):
+    assert len(set(route_keys(canonical_routes(routes)))) == len(routes)
+
+
+def test_archive_stores_each_tour_once():
+    archive = ExpertArchive(capacity=5, length=5)
+    tour = np.array([3, 1, 4, 2, 5])
+    assert archive.add([tour, np.roll(tour, 2), tour[::-1]], [10.0, 10.0, 10.0]) == 1
+    assert archive.add(tour, 10.0) == 0
+    assert len(archive) == 1
+    assert archive.offered == 4
+
+
+def test_full_archive_evicts_the_worst(routes):
+    archive = ExpertArchive(capacity=4, length=routes.shape[1])
+    costs = np.arange(10.0, 0.0, -1.0)
+    for route, cost in zip(routes[:10], costs):
+        archive.add(route, cost)
+    assert len(archive) == 4
+    best_routes, best_costs = archive.best()
+    np.testing.assert_array_equal(best_costs, [1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(best_routes, canonical_routes(routes[9:5:-1]))
+    # Not shorter than the worst stored tour: rejected
+    assert archive.add(routes[20], 4.0) == 0
+    # An evicted tour can come back once it is good enough
+    assert archive.add(routes[0], 0.5) == 1
+    assert archive.best(1)[1][0] == 0.5
+    assert archive.routes.shape == (4, routes.shape[1])
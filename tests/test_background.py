@@ -0,0 +1,52 @@
+import threading
+
+from background import BackgroundSolver
+
+
+def wait_for_end(solver):
+    solver.thread.join(timeout=10)
+    assert not solver.running
+    return solver.poll()
+
+
+def failing_solver():
+    raise ValueError("bad instance")
+
+
+def test_errors_carry_the_full_traceback():
+    messages = wait_for_end(BackgroundSolver(failing_solver).start())
+    assert len(messages) == 1
+    kind, exc, text = messages[0]
+    assert kind == "error" and isinstance(exc, ValueError)
+    assert "failing_solver" in text and "ValueError: bad instance" in text
+
+
+def test_published_progress_then_done():
+    def solve(solver_box):
+        for fitness in (30.0, 20.0):
+            solver_box[0].checkpoint()
+            solver_box[0].publish([1, 2, 3], fitness)
+
+    box = []
+    solver = BackgroundSolver(solve, box)
+    box.append(solver)
+    assert wait_for_end(solver.start()) == [("best", [1, 2, 3], 30.0), ("best", [1, 2, 3], 20.0), ("done",)]
+
+
+def test_pause_then_cancel_stops_at_the_next_checkpoint():
+    started = threading.Event()
+
+    def solve(solver_box):
+        started.set()
+        while True:
+            solver_box[0].checkpoint()
+
+    box = []
+    solver = BackgroundSolver(solve, box)
+    box.append(solver)
+    solver.pause()
+    solver.start()
+    started.wait(timeout=10)
+    assert solver.paused and solver.running
+    solver.cancel()
+    assert wait_for_end(solver) == [("cancelled",)]
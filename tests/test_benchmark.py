@@ -0,0 +1,38 @@
+import pytest
+
+from benchmark import CASE_KEY, compare, random_instance, run_case
+
+
+def record(wall_time, evaluations=1000, rss=100.0, best=500.0):
+    case = {name: 0 for name in CASE_KEY}
+    return dict(case, wall_time=wall_time, evaluations=evaluations, evals_per_second=evaluations / wall_time,
+                peak_process_rss_mb=rss, best_fitness=best)
+
+
+def test_compare_ignores_noise_below_the_time_floor():
+    # 0.2 s -> 0.26 s is 30% slower but only 60 ms
+    assert compare([record(0.26)], [record(0.2)]) == []
+
+
+def test_compare_flags_real_slowdowns():
+    metrics = {regression["metric"] for regression in compare([record(2.0)], [record(1.0)])}
+    assert metrics == {"wall_time", "evals_per_second"}
+
+
+def test_compare_flags_memory_and_quality():
+    metrics = {regression["metric"] for regression in compare([record(1.0, rss=150.0, best=510.0)],
+                                                              [record(1.0)])}
+    assert metrics == {"peak_process_rss_mb", "best_fitness"}
+
+
+def test_random_instance_is_reproducible():
+    first, second = random_instance(30, seed=4), random_instance(30, seed=4)
+    assert first.name == second.name
+    assert (first.matrix == second.matrix).all()
+
+
+def test_run_case_keeps_the_fastest_repeat():
+    result = run_case(("random", 20, 0), "Uniform", "Swap", 10, 1, 2, 5, 1, repeats=3)
+    assert len(result["wall_times"]) == 3
+    assert result["wall_time"] == min(result["wall_times"])
+    assert result["evals_per_second"] == pytest.approx(result["evaluations"] / result["wall_time"])
@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+
+from cli import main
+
+
+def write_instance(path):
+    rows = [f"{city} {x} {y}" for city, (x, y) in enumerate([(0, 0), (4, 0), (8, 1), (9, 5), (6, 9), (1, 8),
+                                                             (3, 4), (7, 4)], start=1)]
+    path.write_text("\n".join(["NAME : tiny", "DIMENSION : 8", "EDGE_WEIGHT_TYPE : EUC_2D", "NODE_COORD_SECTION",
+                               *rows, "EOF"]) + "\n")
+    return str(path)
+
+
+def test_headless_sweep_writes_results(tmp_path):
+    instance = write_instance(tmp_path / "tiny.tsp")
+    output = tmp_path / "results.json"
+    results = main([instance, "--crossover", "Order", "--mutation", "Swap", "Inversion", "--runs", "3",
+                    "--generations", "10", "--pop-size", "12", "--seed", "4", "--workers", "1", "--no-cache",
+                    "--output", str(output)])
+    assert json.loads(output.read_text()) == results
+    assert [(combo["crossover"], combo["mutation"]) for combo in results["combinations"]] == \
+        [("Order", "Swap"), ("Order", "Inversion")]
+    for combo in results["combinations"]:
+        assert [run["run"] for run in combo["runs"]] == [0, 1, 2]
+        assert combo["min_fitness"] <= combo["mean_fitness"] <= combo["max_fitness"]
+        assert sorted(combo["best_route"]) == list(range(1, 9))
+
+
+def test_importing_hybridrun_needs_no_display():
+    code = "import sys, HybridRun; assert 'tkinter' not in sys.modules and 'matplotlib' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
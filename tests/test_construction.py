@@ -0,0 +1,68 @@
+import numpy as np
+
+from cli import parse_args
+from construction import greedy_edge_tour, grid_neighbors, nearest_neighbor_tour
+from solver import GeneticAlgorithm, RunConfig
+
+
+def brute_force_nearest_neighbor(city_ids, coordinates, start_city):
+    tour = [start_city]
+    remaining = set(city_ids) - {start_city}
+    while remaining:
+        x, y = coordinates[tour[-1]]
+        tour.append(min(remaining, key=lambda city: ((coordinates[city][0] - x) ** 2
+                                                     + (coordinates[city][1] - y) ** 2, city)))
+        remaining.remove(tour[-1])
+    return tour
+
+
+def test_grid_neighbors_are_nearly_always_the_nearest_points():
+    # Candidates come from the 3x3 cells around a point, so a point near a
+    # sparse patch can miss a true neighbour (or get -1); most rows are exact
+    points = np.random.default_rng(1).random((500, 2)) * 100
+    neighbors = grid_neighbors(points, k=6)
+    distances = ((points[:, None] - points[None, :]) ** 2).sum(axis=2)
+    np.fill_diagonal(distances, np.inf)
+    found = np.where(neighbors >= 0, np.take_along_axis(distances, np.maximum(neighbors, 0), axis=1), np.inf)
+    assert (found[:, 1:] >= found[:, :-1]).all()
+    exact = np.isclose(found, np.sort(distances, axis=1)[:, :6]).all(axis=1)
+    assert exact.mean() > 0.9
+
+
+def test_nearest_neighbor_tour_matches_brute_force(distance_matrix):
+    city_ids = distance_matrix.city_ids.tolist()
+    coordinates = distance_matrix.coordinates
+    for start_city in city_ids[:5]:
+        tour = nearest_neighbor_tour(city_ids, coordinates, start_city)
+        assert tour == brute_force_nearest_neighbor(city_ids, coordinates.tolist(), start_city)
+
+
+def test_greedy_edge_tour_is_a_short_permutation(distance_matrix, routes):
+    city_ids = distance_matrix.city_ids
+    tour = greedy_edge_tour(city_ids, distance_matrix.coordinates)
+    assert sorted(tour) == sorted(city_ids.tolist())
+    assert distance_matrix.tour_length(tour) < distance_matrix.evaluate_routes(routes).min() / 2
+
+
+def test_large_instances_are_permutations():
+    points = np.random.default_rng(2).random((20000, 2)) * 1000
+    coordinates = np.vstack(([0.0, 0.0], points))
+    city_ids = np.arange(1, 20001)
+    for tour in (nearest_neighbor_tour(city_ids, coordinates), greedy_edge_tour(city_ids, coordinates)):
+        assert len(tour) == 20000
+        assert np.array_equal(np.sort(tour), city_ids)
+
+
+def test_seed_fraction_seeds_the_first_rows(distance_matrix):
+    config = RunConfig(pop_size=20, seed_fraction=0.25, seed_method="greedy")
+    ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(3))
+    fitness = ga.population.evaluate(distance_matrix)
+    assert ga.population.routes[0].tolist() == greedy_edge_tour(distance_matrix.city_ids,
+                                                                distance_matrix.coordinates)
+    # Five constructed tours, all far shorter than the unseeded rows
+    assert fitness[:5].max() < fitness[5:].min()
+
+
+def test_cli_passes_seeding_on():
+    args = parse_args(["instance.tsp", "--seed-fraction", "0.1", "--seed-method", "greedy"])
+    assert (args.seed_fraction, args.seed_method) == (0.1, "greedy")
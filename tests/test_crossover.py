@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from HybridRun import Population
+from crossover import CROSSOVER_OPERATORS, batch_crossover
+from repair import batch_repair, repair_route
+
+
+# Every operator must turn complete tours into complete tours: each city
+# exactly once per row, whatever the city ids are.
+
+
+def assert_permutations(routes, city_ids):
+    expected = np.sort(city_ids)
+    for route in np.atleast_2d(routes):
+        np.testing.assert_array_equal(np.sort(route), expected)
+
+
+@pytest.mark.parametrize("method", sorted(CROSSOVER_OPERATORS))
+def test_crossover_children_are_permutations(method, distance_matrix, routes):
+    rng = np.random.default_rng(17)
+    operator = CROSSOVER_OPERATORS[method]
+    for first, second in zip(routes[0::2], routes[1::2]):
+        child1, child2 = operator(first, second, rng)
+        assert_permutations([child1, child2], distance_matrix.city_ids)
+
+
+@pytest.mark.parametrize("method", sorted(CROSSOVER_OPERATORS))
+def test_batch_crossover_children_are_permutations(method, distance_matrix, routes):
+    rng = np.random.default_rng(3)
+    # An odd parent count, so the unpaired last parent is covered too
+    parents = rng.integers(0, len(routes), 21)
+    out = np.empty((len(parents), routes.shape[1]), dtype=routes.dtype)
+    batch_crossover(method, routes, parents, out, rng)
+    assert_permutations(out, distance_matrix.city_ids)
+
+
+def test_repair_route_fills_duplicates_and_placeholders():
+    route = np.array([3, 1, 3, -1, 5, 1, 7, 8])
+    assert_permutations(repair_route(route, np.arange(1, 9)), np.arange(1, 9))
+
+
+def test_repair_route_keeps_non_contiguous_ids():
+    cities = np.array([2, 5, 9, 11, 40, 41])
+    route = np.array([9, 2, 9, -1, 41, 7])
+    repaired = repair_route(route, cities)
+    assert_permutations(repaired, cities)
+    # First occurrences stay where they were
+    np.testing.assert_array_equal(repaired[[0, 1, 4]], [9, 2, 41])
+
+
+def test_fix_invalid_route_with_non_contiguous_ids(city_data):
+    population = Population(2, city_data)
+    route = population[0].route
+    broken = route[:]
+    broken[3] = -1
+    broken[7] = broken[8]
+    assert_permutations(np.array(population.fix_invalid_route(broken)), list(city_data))
+
+
+def test_batch_repair_rows_are_permutations(distance_matrix, routes):
+    rng = np.random.default_rng(9)
+    broken = routes.copy()
+    # Overwrite a quarter of every row with random (duplicate) cities
+    positions = rng.random(broken.shape) < 0.25
+    broken[positions] = rng.choice(distance_matrix.city_ids, positions.sum())
+    batch_repair(broken, np.sort(distance_matrix.city_ids), int(distance_matrix.city_ids.max()) + 1)
+    assert_permutations(broken, distance_matrix.city_ids)
+
+
+def test_cycle_crossover_keeps_every_city_in_a_parent_position():
+    parent1 = np.array([1, 2, 3, 4, 5, 6, 7, 8])
+    parent2 = np.array([8, 5, 2, 1, 3, 6, 4, 7])
+    child1, child2 = CROSSOVER_OPERATORS["Cycle"](parent1, parent2, None)
+    # Cycles {0, 3, 6, 7}, {1, 2, 4} and {5}, alternately from each parent
+    np.testing.assert_array_equal(child1, [1, 5, 2, 4, 3, 6, 7, 8])
+    np.testing.assert_array_equal(child2, [8, 2, 3, 1, 5, 6, 4, 7])
+
+
+def test_cycle_crossover_children_take_each_position_from_a_parent(routes):
+    for first, second in zip(routes[0::2], routes[1::2]):
+        child1, child2 = CROSSOVER_OPERATORS["Cycle"](first, second, None)
+        assert ((child1 == first) | (child1 == second)).all()
+        np.testing.assert_array_equal(np.where(child1 == first, second, first), child2)
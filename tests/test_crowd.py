@@ -0,0 +1,25 @@
+import numpy as np
+
+from crowd import consensus_tour, edge_frequencies, edge_frequency_matrix
+
+
+def test_edge_frequencies_count_undirected_edges():
+    routes = np.array([[1, 2, 3, 4], [2, 1, 4, 3], [1, 3, 2, 4]])
+    first, second, counts = edge_frequencies(routes)
+    found = {(int(a), int(b)): int(count) for a, b, count in zip(first, second, counts)}
+    assert found == {(1, 2): 2, (2, 3): 3, (3, 4): 2, (1, 4): 3, (1, 3): 1, (2, 4): 1}
+    matrix = edge_frequency_matrix(routes)
+    assert matrix[2, 1] == matrix[1, 2] == 2
+    assert matrix.sum() == 2 * counts.sum()
+
+
+def test_consensus_of_agreeing_experts_is_their_tour(distance_matrix, routes):
+    tour = routes[0]
+    experts = np.array([np.roll(tour, shift) for shift in range(5)] + [tour[::-1]])
+    consensus = consensus_tour(experts, distance_matrix.coordinates)
+    assert np.isclose(distance_matrix.tour_length(consensus), distance_matrix.tour_length(tour))
+
+
+def test_consensus_is_a_complete_tour(distance_matrix, routes):
+    consensus = consensus_tour(routes, distance_matrix.coordinates)
+    assert sorted(consensus) == sorted(distance_matrix.city_ids.tolist())
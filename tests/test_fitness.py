@@ -0,0 +1,24 @@
+import numpy as np
+
+from HybridRun import Individual, calculate_fitness
+
+
+# calculate_fitness is the reference implementation; every fast path must agree with it.
+
+
+def reference_lengths(routes, city_data):
+    lengths = []
+    for route in routes:
+        individual = Individual(city_data)
+        individual.route = route.tolist()
+        lengths.append(calculate_fitness(individual, city_data))
+    return np.array(lengths)
+
+
+def test_evaluate_routes_matches_calculate_fitness(distance_matrix, city_data, routes):
+    np.testing.assert_allclose(distance_matrix.evaluate_routes(routes), reference_lengths(routes, city_data))
+
+
+def test_tour_length_matches_calculate_fitness(distance_matrix, city_data, routes):
+    expected = reference_lengths(routes, city_data)
+    np.testing.assert_allclose([distance_matrix.tour_length(route) for route in routes], expected)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from fitness_cache import FitnessCache
+from solver import GeneticAlgorithm, RunConfig
+
+
+def test_cached_lengths_match_the_matrix(distance_matrix, routes):
+    cache = FitnessCache(distance_matrix, capacity=10)
+    expected = distance_matrix.evaluate_routes(routes)
+    # Twice, so the second pass is served (partly) from the cache
+    for _ in range(2):
+        np.testing.assert_allclose(cache.evaluate_routes(routes, np.empty(len(routes))), expected)
+    # A closed route (start repeated at the end) has the same length
+    closed = routes[0].tolist() + [int(routes[0][0])]
+    np.testing.assert_allclose(cache.tour_length(closed), expected[0])
+
+
+def test_rotations_and_reversals_are_hits(distance_matrix, routes):
+    cache = FitnessCache(distance_matrix)
+    cache.evaluate_routes(routes[:1])
+    spellings = np.array([np.roll(routes[0], 5), routes[0][::-1], np.roll(routes[0][::-1], 3)])
+    np.testing.assert_allclose(cache.evaluate_routes(spellings), distance_matrix.tour_length(routes[0]))
+    assert (cache.hits, cache.misses) == (3, 1)
+    assert cache.hit_rate == 0.75
+
+
+def test_least_recently_used_tour_is_evicted(distance_matrix, routes):
+    cache = FitnessCache(distance_matrix, capacity=2)
+    cache.evaluate_routes(routes[:2])
+    cache.evaluate_routes(routes[:1])  # routes[0] is now the most recent
+    cache.evaluate_routes(routes[2:3])
+    assert len(cache) == 2
+    cache.hits = cache.misses = 0
+    cache.evaluate_routes(routes[:3])
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_stored_lengths_are_served(distance_matrix, routes):
+    cache = FitnessCache(distance_matrix)
+    cache.store(routes[:4], [1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(cache.evaluate_routes(routes[:4]), [1.0, 2.0, 3.0, 4.0])
+
+
+def test_runs_with_and_without_the_cache_agree(distance_matrix):
+    results = []
+    for capacity in (0, 500):
+        config = RunConfig(crossover_method="Order", pop_size=20, max_generations=20, fitness_cache=capacity)
+        ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(9))
+        results.append(ga.run().fitness.copy())
+    np.testing.assert_allclose(results[0], results[1])
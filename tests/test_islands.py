@@ -0,0 +1,30 @@
+import numpy as np
+
+from islands import IslandConfig, run_islands
+from solver import RunConfig
+
+
+def island_run(distance_matrix, seed):
+    config = RunConfig(crossover_method="Order", mutation_method="Inversion", pop_size=20, max_generations=30,
+                       stall_generations=12)
+    island_config = IslandConfig(islands=3, migration_interval=5, migrants=2, topology="full")
+    return run_islands(config, distance_matrix, island_config, seed=seed, timeout=60)
+
+
+def test_seeded_island_runs_are_reproducible(distance_matrix):
+    first, second = island_run(distance_matrix, 4), island_run(distance_matrix, 4)
+    np.testing.assert_array_equal(first.island_curves, second.island_curves)
+    assert first.best_route == second.best_route
+    assert first.best_fitness == second.best_fitness
+
+
+def test_curves_track_the_best_so_far(distance_matrix):
+    result = island_run(distance_matrix, 8)
+    curves = result.island_curves
+    assert curves.shape == (3, 30)
+    # Best so far never rises, also after an island stopped early
+    assert (np.diff(curves, axis=1) <= 0).all()
+    np.testing.assert_array_equal(result.global_curve, curves.min(axis=0))
+    assert result.best_fitness == result.global_curve[-1]
+    assert sorted(result.best_route) == sorted(distance_matrix.city_ids.tolist())
+    assert np.isclose(distance_matrix.tour_length(result.best_route), result.best_fitness)
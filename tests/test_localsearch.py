@@ -0,0 +1,41 @@
+import numpy as np
+
+from localsearch import LocalSearch, nearest_neighbor_lists
+from population import RoutePopulation
+
+
+def test_neighbor_lists_are_the_nearest_cities(distance_matrix):
+    neighbors = nearest_neighbor_lists(distance_matrix, 5)
+    city_ids = distance_matrix.city_ids
+    for city in city_ids:
+        others = city_ids[city_ids != city]
+        distances = distance_matrix.matrix[city, others]
+        np.testing.assert_allclose(distance_matrix.matrix[city, neighbors[city]], np.sort(distances)[:5])
+
+
+def test_improve_reports_the_exact_change(distance_matrix, routes):
+    search = LocalSearch(distance_matrix, neighbors=8)
+    for route in routes:
+        improved, delta = search.improve(route)
+        assert sorted(improved) == sorted(route.tolist())
+        assert delta <= 0
+        assert np.isclose(distance_matrix.tour_length(improved) - distance_matrix.tour_length(route), delta)
+
+
+def test_improve_keeps_closed_routes_closed(distance_matrix, routes):
+    search = LocalSearch(distance_matrix)
+    closed = routes[0].tolist() + [int(routes[0][0])]
+    improved, delta = search.improve(closed)
+    assert improved[0] == improved[-1]
+    assert np.isclose(distance_matrix.tour_length(improved[:-1]) - distance_matrix.tour_length(routes[0]), delta)
+
+
+def test_improve_population_keeps_fitness_valid(distance_matrix, routes):
+    population = RoutePopulation(len(routes), distance_matrix.city_ids)
+    population.routes[:] = routes
+    population.evaluate(distance_matrix)
+    before = population.fitness.copy()
+    LocalSearch(distance_matrix).improve_population(population, range(0, len(routes), 3))
+    np.testing.assert_allclose(population.fitness, distance_matrix.evaluate_routes(population.routes))
+    assert (population.fitness[::3] < before[::3]).all()
+    np.testing.assert_array_equal(population.routes[1::3], routes[1::3])
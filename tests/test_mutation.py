@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from mutation import MUTATION_OPERATORS, batch_mutation, mutation_methods
+
+
+# Every kernel must keep complete tours complete: each city exactly once per row.
+
+
+def assert_permutations(routes, city_ids):
+    expected = np.sort(city_ids)
+    for route in np.atleast_2d(routes):
+        np.testing.assert_array_equal(np.sort(route), expected)
+
+
+@pytest.mark.parametrize("method", sorted(MUTATION_OPERATORS))
+def test_mutation_keeps_permutations(method, distance_matrix, routes):
+    rng = np.random.default_rng(5)
+    mutated = routes.copy()
+    rows = np.arange(0, len(routes), 2)
+    changed = batch_mutation(method, mutated, rows, 1.0, rng)
+    assert_permutations(mutated, distance_matrix.city_ids)
+    # Only the requested rows may change, and changed must report them
+    untouched = np.setdiff1d(np.arange(len(routes)), rows)
+    np.testing.assert_array_equal(mutated[untouched], routes[untouched])
+    assert set(changed.tolist()) <= set(rows.tolist())
+    assert set(np.flatnonzero((mutated != routes).any(axis=1)).tolist()) <= set(changed.tolist())
+
+
+def test_rate_zero_changes_nothing(routes):
+    mutated = routes.copy()
+    changed = batch_mutation(("Swap", "Scramble"), mutated, np.arange(len(routes)), 0.0, np.random.default_rng(6))
+    assert changed.size == 0
+    np.testing.assert_array_equal(mutated, routes)
+
+
+def test_first_and_last_positions_stay_put(routes):
+    for method in MUTATION_OPERATORS:
+        mutated = routes.copy()
+        batch_mutation(method, mutated, np.arange(len(routes)), 1.0, np.random.default_rng(7))
+        np.testing.assert_array_equal(mutated[:, [0, -1]], routes[:, [0, -1]])
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        mutation_methods(["Swap", "Shuffle"])
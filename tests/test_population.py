@@ -0,0 +1,37 @@
+import numpy as np
+
+from population import RoutePopulation
+
+
+def test_evaluate_scores_only_dirty_rows(distance_matrix, routes):
+    population = RoutePopulation(len(routes), distance_matrix.city_ids)
+    population.routes[:] = routes
+    population.evaluate(distance_matrix)
+    assert population.evaluations == len(routes)
+    population.routes[[2, 5]] = routes[[5, 2]]
+    population.dirty[[2, 5]] = True
+    population.evaluate(distance_matrix)
+    assert population.evaluations == len(routes) + 2
+    np.testing.assert_allclose(population.fitness, distance_matrix.evaluate_routes(population.routes))
+
+
+def test_individual_views_read_and_write_rows(distance_matrix, routes):
+    population = RoutePopulation(3, distance_matrix.city_ids)
+    view = population[1]
+    view.route = routes[0].tolist()
+    assert view.fitness is None
+    population.evaluate(distance_matrix)
+    assert np.isclose(view.fitness, distance_matrix.tour_length(routes[0]))
+    view.fitness = 12.5
+    assert population.fitness[1] == 12.5 and not population.dirty[1]
+
+
+def test_swap_buffers_keeps_views_on_their_slots(distance_matrix, routes):
+    population = RoutePopulation(2, distance_matrix.city_ids)
+    view = population[0]
+    population.offspring[:] = routes[:2]
+    population.offspring_dirty[:] = True
+    population.swap_buffers()
+    assert view.route == routes[0].tolist()
+    assert population.offspring_dirty.all()
+    assert population.best_index() in (0, 1)
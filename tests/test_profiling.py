@@ -0,0 +1,45 @@
+import numpy as np
+
+import crossover
+from profiling import PHASES, PhaseProfiler
+from solver import GeneticAlgorithm, RunConfig
+
+
+def test_wrap_counts_calls_and_time():
+    ticks = iter(range(0, 100, 5))
+    profiler = PhaseProfiler(clock=lambda: next(ticks))
+    double = profiler.wrap("mutation", lambda value: 2 * value)
+    assert double(3) == 6 and double(4) == 8
+    assert profiler.summary() == {"mutation": (2, 10)}
+
+
+def test_patched_restores_the_original():
+    original = crossover.batch_repair
+    profiler = PhaseProfiler()
+    with profiler.patched(crossover, "batch_repair", "repair"):
+        assert crossover.batch_repair is not original
+    assert crossover.batch_repair is original
+
+
+def test_profiled_run_is_identical_and_times_every_phase(distance_matrix):
+    results = []
+    for profile in (False, True):
+        config = RunConfig(crossover_method="Uniform", pop_size=20, max_generations=10, profile=profile)
+        ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(5))
+        results.append(ga.run().routes.copy())
+    np.testing.assert_array_equal(results[0], results[1])
+    summary = ga.profiler.summary()
+    assert {"evaluation", "selection", "crossover", "repair", "mutation", "termination"} <= set(summary)
+    assert summary["termination"][0] == 10
+    assert set(summary) <= set(PHASES)
+
+
+def test_merge_and_table_do_not_count_nested_phases_twice():
+    profiler = PhaseProfiler().merge({"crossover": (2, 3000000), "repair": (2, 1000000)})
+    profiler.merge(PhaseProfiler().merge({"mutation": (1, 1000000)}))
+    lines = profiler.table("sweep").splitlines()
+    assert lines[0] == "sweep"
+    # repair is part of crossover, so the total is 4 ms, not 5
+    assert lines[-1].split()[-1] == "4.0"
+    assert [line.split()[0] for line in lines[2:-1]] == ["crossover", "repair", "mutation"]
+    assert "75.0%" in lines[2] and "25.0%" in lines[3]
@@ -0,0 +1,77 @@
+import numpy as np
+
+from renderer import RouteRenderer
+
+
+class FakeCanvas:
+    # Records what RouteRenderer asks of a Tk canvas
+    def __init__(self):
+        self.items = []
+        self.coordinates = {}
+        self.scheduled = []
+
+    def _create(self, kind):
+        self.items.append(kind)
+        return len(self.items)
+
+    def create_line(self, points, **options):
+        return self._create("line")
+
+    def create_text(self, x, y, **options):
+        return self._create("text")
+
+    def create_oval(self, *box, **options):
+        return self._create("oval")
+
+    def coords(self, item, points):
+        self.coordinates[item] = points
+
+    def after(self, milliseconds, callback):
+        self.scheduled.append(callback)
+
+
+def make_renderer(cities=4, label_limit=500):
+    now = [0.0]
+    canvas = FakeCanvas()
+    coordinates = np.arange(2 * (cities + 1), dtype=float).reshape(-1, 2)
+    renderer = RouteRenderer(canvas, coordinates, range(1, cities + 1), scale_factor=1, max_fps=10.0,
+                             label_limit=label_limit, clock=lambda: now[0])
+    return renderer, canvas, now
+
+
+def test_items_are_created_once_and_updated_in_place():
+    renderer, canvas, now = make_renderer()
+    renderer.draw([1, 2, 3, 4])
+    now[0] = 1.0
+    renderer.draw([4, 3, 2, 1])
+    assert canvas.items == ["line", "line", "text", "text", "text", "text"]
+    assert canvas.coordinates[1] == [8.0, 9.0, 6.0, 7.0, 4.0, 5.0, 2.0, 3.0]
+    assert canvas.coordinates[2] == [2.0, 3.0, 8.0, 9.0]
+    assert renderer.frames == 2
+
+
+def test_large_instances_get_dots():
+    renderer, canvas, _ = make_renderer(cities=6, label_limit=5)
+    renderer.draw(list(range(1, 7)))
+    assert canvas.items.count("oval") == 6 and "text" not in canvas.items
+
+
+def test_frames_are_throttled_and_the_newest_tour_wins():
+    renderer, canvas, now = make_renderer()
+    renderer.draw([1, 2, 3, 4])
+    now[0] = 0.01
+    renderer.draw([2, 1, 3, 4])
+    renderer.draw([3, 1, 2, 4])
+    assert renderer.frames == 1 and len(canvas.scheduled) == 1
+    now[0] = 0.2
+    canvas.scheduled[0]()
+    assert renderer.frames == 2
+    np.testing.assert_array_equal(renderer.drawn, [3, 1, 2, 4])
+
+
+def test_unchanged_tour_is_not_redrawn():
+    renderer, _, now = make_renderer()
+    renderer.draw([1, 2, 3, 4])
+    now[0] = 5.0
+    renderer.draw([1, 2, 3, 4])
+    assert renderer.frames == 1
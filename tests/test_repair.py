@@ -0,0 +1,39 @@
+import numpy as np
+
+from distances import DistanceMatrix
+from repair import RepairStage
+
+
+def assert_permutation(route, city_ids):
+    np.testing.assert_array_equal(np.sort(route), np.sort(city_ids))
+
+
+def test_repair_stage_completes_partial_tours(distance_matrix, routes):
+    stage = RepairStage(distance_matrix, neighbors=5)
+    rng = np.random.default_rng(13)
+    for route in routes[:10]:
+        partial = route[rng.random(len(route)) < 0.6].tolist()
+        partial += partial[:3]  # duplicates
+        assert_permutation(stage(partial), distance_matrix.city_ids)
+
+
+def test_repair_stage_keeps_the_order_of_kept_cities(distance_matrix, routes):
+    stage = RepairStage(distance_matrix, neighbors=5)
+    partial = routes[0][::2].tolist()
+    repaired = stage(partial + [partial[0]])
+    assert [city for city in repaired if city in set(partial)] == partial
+
+
+def test_repair_stage_leaves_complete_tours_alone(distance_matrix, routes):
+    stage = RepairStage(distance_matrix)
+    assert stage(routes[1].tolist()) == routes[1].tolist()
+
+
+def test_repair_stage_inserts_at_the_cheapest_neighbouring_edge():
+    # Four corners of a square and a city just above the bottom edge, which
+    # belongs between the two bottom corners
+    distance_matrix = DistanceMatrix({1: (0.0, 0.0), 2: (10.0, 0.0), 3: (10.0, 10.0), 4: (0.0, 10.0),
+                                      5: (5.0, 0.5)})
+    repaired = RepairStage(distance_matrix, neighbors=4)([1, 2, 3, 4])
+    position = repaired.index(5)
+    assert {repaired[position - 1], repaired[(position + 1) % 5]} == {1, 2}
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from population import RoutePopulation
+from replacement import WorstHeap, elite_rows
+from solver import GeneticAlgorithm, RunConfig
+
+
+def test_elite_rows_are_the_shortest_best_first():
+    fitness = np.array([5.0, 1.0, 9.0, 3.0, 1.5])
+    np.testing.assert_array_equal(elite_rows(fitness, 3), [1, 4, 3])
+    assert elite_rows(fitness, 0).size == 0
+
+
+def test_worst_heap_skips_stale_entries():
+    population = RoutePopulation(6, range(1, 5))
+    population.fitness[:] = [4.0, 9.0, 1.0, 7.0, 3.0, 8.0]
+    heap = WorstHeap(population)
+    assert heap.pop_worst(2) == [1, 5]
+    # Row 3 got shorter without being pushed; row 1 was replaced and pushed
+    population.fitness[3] = 0.5
+    population.fitness[1] = 2.0
+    heap.push([1])
+    assert heap.pop_worst(2) == [0, 4]
+
+
+@pytest.mark.parametrize("replacement", ["generational", "steady_state"])
+def test_best_tour_never_gets_worse(replacement, distance_matrix):
+    config = RunConfig(crossover_method="Uniform", mutation_method="Scramble", pop_size=30, max_generations=1,
+                       mutation_rate=1.0, elitism=3, replacement=replacement, steady_state_size=4)
+    ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(6))
+    population = ga.population
+    for _ in range(15):
+        fitness = population.evaluate(ga.evaluator).copy()
+        kept = sorted(fitness)[:config.elitism]
+        ga.step()
+        after = np.sort(population.evaluate(ga.evaluator))
+        # The elitism best tours (or better ones) are still there
+        assert (after[:config.elitism] <= np.array(kept) + 1e-9).all()
+        np.testing.assert_allclose(population.fitness, distance_matrix.evaluate_routes(population.routes))
+
+
+def test_steady_state_size_must_leave_the_best_alone():
+    with pytest.raises(ValueError):
+        RunConfig(pop_size=10, elitism=2, replacement="steady_state", steady_state_size=9)
@@ -0,0 +1,55 @@
+import random
+
+import numpy as np
+
+from rngs import RandomStreams, generator
+from scheduler import RunScheduler
+from solver import RunConfig
+
+
+def sweep(distance_matrix, workers, seed=5):
+    configs = [RunConfig(crossover_method="Order", mutation_method="Swap", pop_size=20, max_generations=15),
+               RunConfig(crossover_method="Cycle", mutation_method="Inversion", pop_size=20, max_generations=15)]
+    with RunScheduler(distance_matrix, workers=workers, seed=seed) as scheduler:
+        results = sorted(scheduler.run(configs, 3), key=lambda result: (result.config_index, result.run_index))
+        replayed = [scheduler.rerun(result) for result in results]
+    return results, replayed
+
+
+def assert_identical(first, second):
+    np.testing.assert_array_equal(first.routes, second.routes)
+    np.testing.assert_array_equal(first.fitness, second.fitness)
+    assert first.best_route == second.best_route
+    assert first.best_fitness == second.best_fitness
+
+
+def test_streams_depend_only_on_seed_and_key():
+    first, second = RandomStreams(3), RandomStreams(3)
+    assert generator(first.run(0, 1, 2)).random() == generator(second.run(0, 1, 2)).random()
+    draws = {generator(first.run(0, 0, run)).random() for run in range(5)}
+    draws.add(generator(first.island(0)).random())
+    assert len(draws) == 6
+
+
+def test_results_are_identical_across_worker_counts(distance_matrix):
+    serial, _ = sweep(distance_matrix, workers=1)
+    parallel, _ = sweep(distance_matrix, workers=2)
+    for first, second in zip(serial, parallel):
+        assert (first.config_index, first.run_index) == (second.config_index, second.run_index)
+        assert_identical(first, second)
+
+
+def test_rerun_replays_a_run_bit_for_bit(distance_matrix):
+    results, replayed = sweep(distance_matrix, workers=2)
+    for result, again in zip(results, replayed):
+        assert_identical(result, again)
+
+
+def test_runs_leave_the_global_random_state_alone(distance_matrix):
+    random.seed(1)
+    np.random.seed(1)
+    expected = (random.random(), np.random.random())
+    random.seed(1)
+    np.random.seed(1)
+    sweep(distance_matrix, workers=1)
+    assert (random.random(), np.random.random()) == expected
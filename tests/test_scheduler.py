@@ -0,0 +1,36 @@
+import numpy as np
+
+from scheduler import RunScheduler
+from solver import RunConfig
+
+
+def test_every_run_comes_back_once(distance_matrix):
+    configs = [RunConfig(pop_size=10, max_generations=5), RunConfig(crossover_method="PMX", pop_size=10,
+                                                                    max_generations=5)]
+    with RunScheduler(distance_matrix, workers=2) as scheduler:
+        results = list(scheduler.run(configs, 4, window=2))
+    assert sorted((result.config_index, result.run_index) for result in results) == \
+        [(config, run) for config in range(2) for run in range(4)]
+    for result in results:
+        assert result.config.crossover_method == configs[result.config_index].crossover_method
+        assert (np.diff(result.fitness) >= 0).all()
+        assert result.best_fitness <= result.fitness[0]
+        assert np.isclose(distance_matrix.tour_length(result.best_route), result.best_fitness)
+        population = result.population()
+        np.testing.assert_allclose(population.fitness, distance_matrix.evaluate_routes(population.routes))
+
+
+def test_successive_calls_use_new_streams(distance_matrix):
+    config = RunConfig(pop_size=10, max_generations=5)
+    with RunScheduler(distance_matrix, workers=1, seed=2) as scheduler:
+        first = next(scheduler.run([config], 1))
+        second = next(scheduler.run([config], 1))
+    assert first.seed.spawn_key != second.seed.spawn_key
+    assert not np.array_equal(first.routes, second.routes)
+
+
+def test_close_releases_the_shared_arrays(distance_matrix):
+    scheduler = RunScheduler(distance_matrix, workers=2).start()
+    assert len(scheduler.shared) == 3
+    scheduler.close()
+    assert scheduler.executor is None and scheduler.shared == []
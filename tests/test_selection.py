@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from selection import SelectionEngine
+
+
+FITNESS = np.array([10.0, 20.0, 40.0, 5.0, 80.0, 25.0])
+
+
+def expected_probabilities(fitness):
+    weights = 1.0 / fitness
+    return weights / weights.sum()
+
+
+@pytest.mark.parametrize("strategy", ["roulette", "alias", "sus"])
+def test_draws_are_fitness_proportional(strategy):
+    engine = SelectionEngine(strategy, rng=np.random.default_rng(0))
+    draws = 200000
+    counts = np.bincount(engine.select(FITNESS, draws), minlength=len(FITNESS))
+    np.testing.assert_allclose(counts / draws, expected_probabilities(FITNESS), atol=0.005)
+
+
+def test_sus_gives_every_row_its_expected_share():
+    # One spin with evenly spaced pointers: each row is picked floor or ceil of
+    # its expected count, never more or less
+    engine = SelectionEngine("sus", rng=np.random.default_rng(1))
+    expected = expected_probabilities(FITNESS) * 60
+    for _ in range(20):
+        counts = np.bincount(engine.select(FITNESS, 60), minlength=len(FITNESS))
+        assert (counts >= np.floor(expected)).all() and (counts <= np.ceil(expected)).all()
+
+
+def test_tournament_favours_shorter_tours():
+    engine = SelectionEngine("tournament", tournament_size=3, rng=np.random.default_rng(2))
+    counts = np.bincount(engine.select(FITNESS, 60000), minlength=len(FITNESS))
+    # With size 3 the worst tour only wins a tournament of itself three times
+    assert counts[4] / 60000 == pytest.approx((1 / 6) ** 3, abs=0.003)
+    assert counts.argmax() == FITNESS.argmin()
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        SelectionEngine("rank")
+
+
+@pytest.mark.parametrize("strategy", ["roulette", "alias", "sus"])
+def test_incremental_updates_follow_the_new_fitness(strategy):
+    engine = SelectionEngine(strategy, rng=np.random.default_rng(4))
+    fitness = FITNESS.copy()
+    engine.prepare(fitness, incremental=True)
+    # Steady-state replacement changes rows in place and patches only those
+    fitness[[1, 4]] = [2.0, 100.0]
+    engine.update([1, 4])
+    draws = 200000
+    counts = np.bincount(engine.draw(draws), minlength=len(fitness))
+    np.testing.assert_allclose(counts / draws, expected_probabilities(fitness), atol=0.005)
+
+
+def test_fenwick_tree_matches_a_rebuild():
+    rng = np.random.default_rng(5)
+    fitness = rng.random(37) * 100 + 1
+    engine = SelectionEngine("roulette", rng=rng)
+    engine.prepare(fitness, incremental=True)
+    for _ in range(50):
+        rows = rng.choice(len(fitness), 3, replace=False)
+        fitness[rows] = rng.random(3) * 100 + 1
+        engine.update(rows)
+    rebuilt = SelectionEngine("roulette")
+    rebuilt.prepare(fitness.copy(), incremental=True)
+    np.testing.assert_allclose(engine._tree, rebuilt._tree)
+    assert engine._total == pytest.approx(rebuilt._total)
+    # Every cumulative weight falls in the row whose interval holds it
+    cumulative = np.cumsum(1.0 / fitness)
+    for point in rng.random(200) * cumulative[-1]:
+        assert engine._tree_search(point) == np.searchsorted(cumulative, point)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from solver import GeneticAlgorithm, RunConfig
+from telemetry import (GENERATION_COLUMNS, Reporter, TelemetryWriter, improvement_curves, population_diversity,
+                       read_telemetry)
+
+
+def test_diversity_is_zero_for_copies_and_one_for_disjoint_neighbourhoods():
+    tour = np.arange(1, 9)
+    assert population_diversity(np.array([tour, tour, np.roll(tour, 3)])) == 0.0
+    # Reversed tours have the same neighbours
+    assert population_diversity(np.array([tour, tour[::-1]])) == 0.0
+    assert population_diversity(np.array([[1, 2, 3, 4, 5, 6], [1, 3, 5, 2, 6, 4]])) == 1.0
+
+
+def test_run_records_one_row_per_generation(distance_matrix):
+    config = RunConfig(pop_size=10, max_generations=7, telemetry=True)
+    ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(4))
+    ga.run()
+    columns = ga.log.arrays()
+    assert set(columns) == set(GENERATION_COLUMNS)
+    np.testing.assert_array_equal(columns["generation"], np.arange(7))
+    assert (columns["best"] <= columns["mean"]).all() and (columns["mean"] <= columns["worst"]).all()
+    assert (np.diff(columns["evaluations"]) > 0).all()
+
+
+def test_jsonl_round_trip_and_curves(tmp_path):
+    path = str(tmp_path / "telemetry.jsonl")
+    with TelemetryWriter(path, buffer_rows=3) as writer:
+        writer.write({"generation": [0, 1, 2], "best": [9.0, 7.0, 6.0]}, crossover="Order", mutation="Swap",
+                     run_index=0)
+        writer.write({"generation": [0, 1], "best": [8.0, 4.0]}, crossover="Order", mutation="Swap", run_index=1)
+    assert writer.rows == 5
+    columns = read_telemetry(path)
+    np.testing.assert_array_equal(columns["best"], [9.0, 7.0, 6.0, 8.0, 4.0])
+    # Run 1 stopped early and keeps its last value
+    curves = improvement_curves(columns)
+    np.testing.assert_allclose(curves[("Order", "Swap")], [8.5, 5.5, 5.0])
+
+
+def test_unknown_format_and_verbosity_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        TelemetryWriter(str(tmp_path / "telemetry.csv"), format="csv")
+    with pytest.raises(ValueError):
+        Reporter("loud")
+
+
+def test_reporter_prints_up_to_its_level(capsys):
+    reporter = Reporter("summary")
+    reporter("summary", "shown")
+    reporter("runs", "hidden")
+    Reporter("quiet")("summary", "hidden")
+    assert capsys.readouterr().out == "shown\n"
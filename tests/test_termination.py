@@ -0,0 +1,102 @@
+import numpy as np
+
+from distances import DistanceMatrix
+from population import RoutePopulation
+from solver import GeneticAlgorithm, RunConfig
+from termination import Termination
+
+
+def scored_population(fitness, evaluations=0):
+    population = RoutePopulation(len(fitness), range(1, 6))
+    population.fitness[:] = fitness
+    population.dirty[:] = False
+    population.evaluations = evaluations
+    return population
+
+
+def run_until_stop(termination, fitness_per_generation, evaluations_per_generation=0):
+    termination.start()
+    for generation, fitness in enumerate(fitness_per_generation):
+        population = scored_population(fitness, evaluations_per_generation * (generation + 1))
+        if termination.update(population):
+            return generation + 1
+    return None
+
+
+def test_stops_after_max_generations():
+    termination = Termination(max_generations=3)
+    assert run_until_stop(termination, [[5.0, 6.0]] * 10) == 3
+    assert termination.reason == "generations"
+
+
+def test_stops_at_fitness_threshold():
+    termination = Termination(max_generations=None, fitness_threshold=4.0)
+    assert run_until_stop(termination, [[9.0], [6.0], [4.0], [1.0]]) == 3
+    assert termination.reason == "threshold"
+
+
+def test_stops_after_stall_and_keeps_best_so_far():
+    termination = Termination(max_generations=None, stall_generations=2)
+    # The best improves in generation 2 and never again; the current minimum rises
+    assert run_until_stop(termination, [[9.0], [7.0], [8.0], [9.0], [3.0]]) == 4
+    assert termination.reason == "stall"
+    assert termination.best_fitness == 7.0
+    assert termination.best_generation == 2
+
+
+def test_min_improvement_counts_small_gains_as_stall():
+    termination = Termination(max_generations=None, stall_generations=2, min_improvement=1.0)
+    assert run_until_stop(termination, [[9.0], [8.5], [8.2], [1.0]]) == 3
+    assert termination.reason == "stall"
+    # The small gains still update the best route
+    assert termination.best_fitness == 8.2
+
+
+def test_stops_at_time_limit():
+    now = [0.0]
+    termination = Termination(max_generations=None, time_limit=10.0, clock=lambda: now[0])
+    termination.start()
+    now[0] = 9.0
+    assert not termination.update(scored_population([5.0]))
+    now[0] = 10.0
+    assert termination.update(scored_population([5.0]))
+    assert termination.reason == "time"
+
+
+def test_stops_at_evaluation_budget():
+    termination = Termination(max_generations=None, max_evaluations=250)
+    assert run_until_stop(termination, [[5.0]] * 10, evaluations_per_generation=100) == 3
+    assert termination.reason == "evaluations"
+
+
+def test_record_does_not_count_a_generation():
+    termination = Termination(max_generations=2)
+    termination.record(scored_population([4.0, 2.0]))
+    assert termination.generation == 0
+    assert termination.best_fitness == 2.0
+    assert not termination.update(scored_population([3.0]))
+    assert termination.update(scored_population([3.0]))
+    assert termination.best_fitness == 2.0
+
+
+def test_run_keeps_a_good_initial_tour(distance_matrix):
+    # Seeded nearest neighbour tours are far better than anything a few
+    # generations of unelitist crossover produce; the best so far must keep them.
+    config = RunConfig(crossover_method="Uniform", mutation_method="Scramble", pop_size=30, max_generations=5,
+                       mutation_rate=1.0, seed_fraction=0.1, elitism=0)
+    ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(1))
+    initial_best = float(ga.population.evaluate(ga.evaluator).min())
+    ga.run()
+    assert ga.termination.best_fitness <= initial_best
+    assert ga.termination.generation == 5
+    assert np.isclose(distance_matrix.tour_length(ga.termination.best_route), ga.termination.best_fitness)
+
+
+def test_default_config_has_no_fitness_threshold(city_data):
+    # An absolute threshold means nothing across instances; a small instance
+    # whose tours are all short must still run every generation
+    distance_matrix = DistanceMatrix({city: (x / 100, y / 100) for city, (x, y) in city_data.items()})
+    config = RunConfig(pop_size=10, max_generations=3, local_search="elite")
+    ga = GeneticAlgorithm(config, distance_matrix.city_ids.tolist(), distance_matrix, np.random.default_rng(2))
+    ga.run()
+    assert ga.termination.reason == "generations"
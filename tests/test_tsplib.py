@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pytest
+
+from tsplib import load_instance
+
+
+def write_tsp(directory, name, header, sections):
+    lines = [f"NAME : {name}"] + [f"{key} : {value}" for key, value in header.items()]
+    for section, body in sections.items():
+        lines.append(section)
+        lines.extend(body)
+    lines.append("EOF")
+    path = os.path.join(directory, f"{name}.tsp")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+    return path
+
+
+COORDINATES = {7: (0.0, 0.0), 2: (3.0, 4.0), 11: (6.0, 0.0), 5: (3.2, 1.1)}
+
+
+def coordinate_file(directory, edge_weight_type="EUC_2D", name="small"):
+    rows = [f"{city} {x} {y}" for city, (x, y) in COORDINATES.items()]
+    return write_tsp(directory, name, {"TYPE": "TSP", "DIMENSION": len(COORDINATES),
+                                       "EDGE_WEIGHT_TYPE": edge_weight_type}, {"NODE_COORD_SECTION": rows})
+
+
+def test_euc_2d_with_non_contiguous_ids(tmp_path):
+    instance = load_instance(coordinate_file(str(tmp_path)), cache=False)
+    assert instance.name == "small"
+    assert instance.dimension == 4
+    np.testing.assert_array_equal(instance.city_ids, [2, 5, 7, 11])
+    assert instance.city_data() == COORDINATES
+    assert instance.matrix[7, 2] == pytest.approx(5.0)
+    assert instance.matrix[5, 7] == pytest.approx(np.hypot(3.2, 1.1))
+    rounded = load_instance(coordinate_file(str(tmp_path)), cache=False, tsplib_rounding=True)
+    assert rounded.matrix[5, 7] == 3.0
+
+
+def test_ceil_and_att_weights(tmp_path):
+    ceil = load_instance(coordinate_file(str(tmp_path), "CEIL_2D", "ceil"), cache=False)
+    assert ceil.matrix[5, 7] == 4.0
+    att = load_instance(coordinate_file(str(tmp_path), "ATT", "att"), cache=False)
+    # sqrt(25 / 10) = 1.58 rounds to 2
+    assert att.matrix[7, 2] == 2.0
+
+
+def test_geo_weights(tmp_path):
+    # One degree of latitude along a meridian is about 111 km
+    path = write_tsp(str(tmp_path), "geo", {"DIMENSION": 2, "EDGE_WEIGHT_TYPE": "GEO"},
+                     {"NODE_COORD_SECTION": ["1 10.00 20.00", "2 11.00 20.00"]})
+    instance = load_instance(path, cache=False)
+    assert instance.matrix[1, 2] == instance.matrix[2, 1] == pytest.approx(112, abs=1)
+    assert instance.matrix[1, 1] == 0.0
+
+
+@pytest.mark.parametrize("edge_weight_format, values", [
+    ("FULL_MATRIX", "0 1 2 1 0 3 2 3 0"),
+    ("UPPER_ROW", "1 2 3"),
+    ("LOWER_ROW", "1 2 3"),
+    ("UPPER_DIAG_ROW", "0 1 2 0 3 0"),
+    ("LOWER_DIAG_ROW", "0 1 0 2 3 0"),
+])
+def test_explicit_weights(tmp_path, edge_weight_format, values):
+    path = write_tsp(str(tmp_path), "explicit", {"DIMENSION": 3, "EDGE_WEIGHT_TYPE": "EXPLICIT",
+                                                 "EDGE_WEIGHT_FORMAT": edge_weight_format},
+                     {"EDGE_WEIGHT_SECTION": [values]})
+    instance = load_instance(path, cache=False)
+    np.testing.assert_array_equal(instance.city_ids, [1, 2, 3])
+    np.testing.assert_array_equal(instance.matrix[1:, 1:], [[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+
+
+def test_unsupported_weight_type_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        load_instance(coordinate_file(str(tmp_path), "MAN_2D", "manhattan"), cache=False)
+
+
+def test_cache_round_trip(tmp_path):
+    path = coordinate_file(str(tmp_path))
+    cache_dir = str(tmp_path / "cache")
+    os.makedirs(cache_dir)
+    parsed = load_instance(path, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 3
+    cached = load_instance(path, cache_dir=cache_dir)
+    assert isinstance(cached.matrix, np.memmap)
+    assert cached.name == parsed.name and cached.dimension == parsed.dimension
+    np.testing.assert_array_equal(cached.city_ids, parsed.city_ids)
+    np.testing.assert_array_equal(cached.coordinates, parsed.coordinates)
+    np.testing.assert_array_equal(cached.matrix, parsed.matrix)
+    # The rounding mode is part of the key, so it gets its own sidecars
+    rounded = load_instance(path, cache_dir=cache_dir, tsplib_rounding=True)
+    assert len(os.listdir(cache_dir)) == 6
+    assert rounded.matrix[5, 7] == 3.0
+    tour = [7, 2, 11, 5]
+    assert cached.distance_matrix().tour_length(tour) == parsed.distance_matrix().tour_length(tour)
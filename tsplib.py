@@ -0,0 +1,197 @@
+import hashlib
+import os
+
+import numpy as np
+
+from distances import DistanceMatrix
+
+
+# Loader for TSPLIB .tsp files. Supported EDGE_WEIGHT_TYPEs: EUC_2D, CEIL_2D,
+# ATT, GEO and EXPLICIT (FULL_MATRIX, UPPER_ROW, LOWER_ROW, UPPER_DIAG_ROW,
+# LOWER_DIAG_ROW). Parsed arrays are cached next to the file as .npy sidecars
+# named after the file's SHA-1, and loaded memory-mapped on later runs.
+
+SECTIONS = ("NODE_COORD_SECTION", "EDGE_WEIGHT_SECTION", "DISPLAY_DATA_SECTION",
+            "TOUR_SECTION", "FIXED_EDGES_SECTION", "DEMAND_SECTION", "DEPOT_SECTION")
+EDGE_WEIGHT_TYPES = ("EUC_2D", "CEIL_2D", "ATT", "GEO", "EXPLICIT")
+EDGE_WEIGHT_FORMATS = ("FULL_MATRIX", "UPPER_ROW", "LOWER_ROW", "UPPER_DIAG_ROW", "LOWER_DIAG_ROW")
+
+
+class TSPInstance:
+    def __init__(self, path, header, city_ids, coordinates, matrix):
+        # coordinates and matrix are indexed by city id (row 0 unused for the
+        # usual 1..n ids), the same layout DistanceMatrix uses.
+        self.path = path
+        self.header = header
+        self.name = header.get("NAME", os.path.basename(path))
+        self.dimension = int(header["DIMENSION"])
+        self.edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+        self.city_ids = city_ids
+        self.coordinates = coordinates
+        self.matrix = matrix
+
+    def city_data(self):
+        # {city_id: (x, y)}, the format the GUI and calculate_fitness use.
+        return {int(city_id): (float(x), float(y))
+                for city_id, (x, y) in zip(self.city_ids, self.coordinates[self.city_ids])}
+
+    def distance_matrix(self):
+        # np.asarray drops the memmap subclass (not the mapping), which would
+        # otherwise add Python overhead to every gather.
+        return DistanceMatrix.from_arrays(self.city_ids, self.coordinates, np.asarray(self.matrix))
+
+
+def _nint(values):
+    return np.floor(values + 0.5)
+
+
+def _geo_radians(values):
+    degrees = np.trunc(values)
+    return np.pi * (degrees + 5.0 * (values - degrees) / 3.0) / 180.0
+
+
+def edge_weights(edge_weight_type, points, tsplib_rounding=False):
+    # Full matrix for the coordinate based weight types, on compact indices.
+    # EUC_2D stays unrounded by default, as calculate_fitness has always scored
+    # tours; tsplib_rounding=True applies the TSPLIB nint() for comparisons
+    # against published optima. ATT and GEO are integer by definition.
+    xs = points[:, 0]
+    ys = points[:, 1]
+    dx = xs[:, None] - xs[None, :]
+    dy = ys[:, None] - ys[None, :]
+    if edge_weight_type == "EUC_2D":
+        weights = np.hypot(dx, dy)
+        return _nint(weights) if tsplib_rounding else weights
+    if edge_weight_type == "CEIL_2D":
+        return np.ceil(np.hypot(dx, dy))
+    if edge_weight_type == "ATT":
+        exact = np.sqrt((dx * dx + dy * dy) / 10.0)
+        rounded = _nint(exact)
+        return np.where(rounded < exact, rounded + 1.0, rounded)
+    if edge_weight_type == "GEO":
+        latitude = _geo_radians(xs)
+        longitude = _geo_radians(ys)
+        q1 = np.cos(longitude[:, None] - longitude[None, :])
+        q2 = np.cos(latitude[:, None] - latitude[None, :])
+        q3 = np.cos(latitude[:, None] + latitude[None, :])
+        angle = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+        weights = np.trunc(6378.388 * angle + 1.0)
+        np.fill_diagonal(weights, 0.0)
+        return weights
+    raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+
+
+def _explicit_weights(values, dimension, edge_weight_format):
+    # Expands an EDGE_WEIGHT_SECTION into a full symmetric matrix.
+    if edge_weight_format == "FULL_MATRIX":
+        return values[:dimension * dimension].reshape(dimension, dimension)
+    matrix = np.zeros((dimension, dimension))
+    if edge_weight_format == "UPPER_ROW":
+        rows, cols = np.triu_indices(dimension, 1)
+    elif edge_weight_format == "LOWER_ROW":
+        rows, cols = np.tril_indices(dimension, -1)
+    elif edge_weight_format == "UPPER_DIAG_ROW":
+        rows, cols = np.triu_indices(dimension)
+    elif edge_weight_format == "LOWER_DIAG_ROW":
+        rows, cols = np.tril_indices(dimension)
+    else:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT: {edge_weight_format}")
+    matrix[rows, cols] = values[:len(rows)]
+    matrix[cols, rows] = values[:len(rows)]
+    return matrix
+
+
+def _split_sections(text):
+    # Returns the header keywords and the raw text of every data section.
+    header = {}
+    sections = {}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        keyword = line.split(":")[0].strip() if line else ""
+        if keyword in SECTIONS:
+            start = i + 1
+            i = start
+            while i < len(lines):
+                word = lines[i].strip().split(":")[0].strip()
+                if word in SECTIONS or word == "EOF" or (":" in lines[i] and word.isupper()):
+                    break
+                i += 1
+            sections[keyword] = "\n".join(lines[start:i])
+            continue
+        if keyword == "EOF":
+            break
+        if ":" in line:
+            key, value = line.split(":", 1)
+            header[key.strip()] = value.strip()
+        i += 1
+    return header, sections
+
+
+def _parse(path, text, tsplib_rounding):
+    header, sections = _split_sections(text)
+    dimension = int(header["DIMENSION"])
+    edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+    if edge_weight_type not in EDGE_WEIGHT_TYPES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+
+    coordinate_text = sections.get("NODE_COORD_SECTION") or sections.get("DISPLAY_DATA_SECTION")
+    if coordinate_text:
+        table = np.fromstring(coordinate_text, sep=" ").reshape(-1, 3)[:dimension]
+        table = table[np.argsort(table[:, 0], kind="stable")]
+        city_ids = table[:, 0].astype(np.int32)
+        points = table[:, 1:]
+    else:
+        city_ids = np.arange(1, dimension + 1, dtype=np.int32)
+        points = np.zeros((dimension, 2))
+
+    if edge_weight_type == "EXPLICIT":
+        values = np.fromstring(sections["EDGE_WEIGHT_SECTION"], sep=" ")
+        weights = _explicit_weights(values, dimension, header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX"))
+    else:
+        weights = edge_weights(edge_weight_type, points, tsplib_rounding)
+
+    # Re-index by city id, the layout DistanceMatrix expects
+    size = int(city_ids.max()) + 1
+    coordinates = np.zeros((size, 2))
+    coordinates[city_ids] = points
+    matrix = np.zeros((size, size))
+    matrix[np.ix_(city_ids, city_ids)] = weights
+    return header, city_ids, coordinates, matrix
+
+
+def _cache_paths(path, digest, cache_dir):
+    base = os.path.join(cache_dir or os.path.dirname(os.path.abspath(path)),
+                        f"{os.path.basename(path)}.{digest[:16]}")
+    return {name: f"{base}.{name}.npy" for name in ("ids", "coords", "dist")}
+
+
+def load_instance(path, cache=True, cache_dir=None, tsplib_rounding=False):
+    # Parses a TSPLIB file. With cache=True the parsed arrays are written to
+    # .npy sidecars keyed by the file's SHA-1 (and the rounding mode), and later
+    # calls memory-map them instead of parsing, so startup no longer grows with
+    # the distance matrix size.
+    with open(path, "rb") as file:
+        raw = file.read()
+    text = raw.decode("ascii", errors="replace")
+    if not cache:
+        return TSPInstance(path, *_parse(path, text, tsplib_rounding))
+
+    digest = hashlib.sha1(raw + (b"nint" if tsplib_rounding else b"")).hexdigest()
+    paths = _cache_paths(path, digest, cache_dir)
+    if all(os.path.exists(p) for p in paths.values()):
+        header, _ = _split_sections(text.split("NODE_COORD_SECTION")[0].split("EDGE_WEIGHT_SECTION")[0])
+        return TSPInstance(path, header,
+                           np.load(paths["ids"]),
+                           np.load(paths["coords"]),
+                           np.load(paths["dist"], mmap_mode="r"))
+
+    header, city_ids, coordinates, matrix = _parse(path, text, tsplib_rounding)
+    for name, array in (("ids", city_ids), ("coords", coordinates), ("dist", matrix)):
+        # Write to a temporary name first so a half written file is never loaded
+        temporary = paths[name] + ".tmp"
+        with open(temporary, "wb") as file:
+            np.save(file, array)
+        os.replace(temporary, paths[name])
+    return TSPInstance(path, header, city_ids, coordinates, np.load(paths["dist"], mmap_mode="r"))